@@ -0,0 +1,27 @@
+from .circularity import solve_fixed_point
+from .cube import StatementCube
+from .curves import clear_curve_cache, curve_from_tenors, read_curve_csv
+from .debt import (PROFILES, debt_schedule_arrays, floating_debt_schedule_arrays, principal_debt_schedule_arrays,
+                   sculpted_debt_schedule_arrays)
+from .depreciation import depreciation_schedule_arrays
+from .derivatives import KPIDerivatives, kpi_derivatives
+from .dual import Dual
+from .model import ModelInputs, ModelResult, TrancheTerms, run_model, tranche_table
+from .rates import ShortRateSpec, short_rate_paths
+from .sensitivity import tornado
+from .simulation import SimulationResult, SimulationSpec, simulate
+from .sizing import SizingResult, max_additional_loan, min_tenor
+from .stress import breakeven_multipliers
+from .sweep import cash_sweep_arrays
+from .structuring import StructureSearch, optimize_structure
+from .tax import TAX_COLUMNS, tax_schedule_arrays
+from .valuation import effective_cost, irr, npv, valuation
+
+__all__ = ["Dual", "KPIDerivatives", "ModelInputs", "ModelResult", "PROFILES", "ShortRateSpec", "SimulationResult",
+           "SimulationSpec", "SizingResult", "StatementCube", "StructureSearch", "TAX_COLUMNS", "TrancheTerms",
+           "breakeven_multipliers", "cash_sweep_arrays", "clear_curve_cache", "curve_from_tenors",
+           "debt_schedule_arrays", "depreciation_schedule_arrays", "effective_cost", "floating_debt_schedule_arrays",
+           "irr", "kpi_derivatives", "max_additional_loan", "min_tenor", "npv", "optimize_structure",
+           "principal_debt_schedule_arrays", "read_curve_csv", "run_model", "sculpted_debt_schedule_arrays",
+           "short_rate_paths", "simulate", "solve_fixed_point", "tax_schedule_arrays", "tornado", "tranche_table",
+           "valuation"]
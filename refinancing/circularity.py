@@ -0,0 +1,88 @@
+"""Fixed-point solver for the circular references of the monthly model.
+
+Interest on average balances and interest earned on cash depend on balances
+that depend on them, the circularity a spreadsheet resolves with iterative
+calculation.  ``solve_fixed_point`` iterates the whole monthly model on the
+circular amounts with Anderson acceleration: each step mixes the last
+``history`` iterates with the weights that best cancel their residuals, a
+small least-squares problem solved for every case of a batch at once.
+
+Interest credited to a balance it is earned on makes every month depend on
+all the months before, a triangular Jacobian that plain and Anderson
+iterations only work through a few months at a time.  The residuals are
+therefore first turned into Newton steps by ``balance_interest_step``, exact
+when nothing else feeds back, so a run without cash sweep converges in two
+passes.  With ``Dual`` inputs the solver takes the Newton steps without
+Anderson mixing, which carries the derivatives to their own fixed point along
+with the values.
+"""
+import numpy as np
+
+from .dual import Dual, as_float
+
+
+def _largest(residual):
+    """Largest absolute residual of each case, values and tangents of a ``Dual`` alike."""
+    if isinstance(residual, Dual):
+        return np.maximum(np.abs(residual.value).max(axis=-1), np.abs(residual.tangent).max(axis=(0, -1)))
+    return np.abs(residual).max(axis=-1)
+
+
+def balance_interest_step(residual, rate, average=False):
+    """Newton step for monthly interest ``(..., months)`` earned on a balance it is credited to.
+
+    A change ``d`` of the interest moves the balance by its running sum ``D``,
+    and so the interest by ``rate`` ``(...)`` times the opening (or with
+    ``average``, the average of the opening and closing) ``D``.  The step
+    solves ``d_t - rate * (D_{t-1} + D_t) / 2 = residual_t`` (``rate *
+    D_{t-1}`` on opening balances), a linear recurrence on ``D`` solved with a
+    cumulative sum.
+    """
+    rate = as_float(rate)[..., None]
+    growth = (1 + rate / 2) / (1 - rate / 2) if average else 1 + rate
+    scale = 1 / (1 - rate / 2) if average else 1.0
+    powers = growth ** np.arange(1, residual.shape[-1] + 1)
+    D = powers * np.cumsum(residual * scale / powers, axis=-1)
+    return np.diff(D, axis=-1, prepend=0.0)
+
+
+def solve_fixed_point(update, x0, tol=1e-6, max_iter=50, history=5, precondition=None):
+    """Fixed point ``x = update(x)`` of arrays ``(..., m)``, the leading axes being cases.
+
+    ``precondition`` turns a residual ``update(x) - x`` into the step to take
+    from ``x`` (an approximate Newton step; the residual itself when None).
+    Stops once every case moves by at most ``tol`` in a pass, or after
+    ``max_iter`` passes.  Returns ``(x, iterations, residual)``: the last
+    iterate (the one ``update`` was last called on), the number of
+    ``update`` calls and the largest move of each case in the last one.
+    """
+    precondition = (lambda r: r) if precondition is None else precondition
+    x = x0
+    residual = update(x) - x
+    iterations = 1
+    accelerate = not isinstance(residual, Dual)
+    moves, changes = [], []
+    newton = None
+    while iterations < max_iter:
+        largest = _largest(residual)
+        if np.all(largest <= tol):
+            break
+        previous, newton = newton, precondition(residual)
+        if accelerate and previous is not None:
+            moves = (moves + [x - last])[-history:]
+            changes = (changes + [newton - previous])[-history:]
+        step = x + newton
+        if accelerate and moves:
+            dX = np.stack(moves, axis=-1)
+            dG = np.stack(changes, axis=-1)
+            gram = np.swapaxes(dG, -1, -2) @ dG
+            ridge = (1e-12 * np.trace(gram, axis1=-2, axis2=-1)[..., None, None] + 1e-300) * np.eye(len(moves))
+            weights = np.linalg.solve(gram + ridge, np.swapaxes(dG, -1, -2) @ newton[..., None])
+            step = step - ((dX + dG) @ weights)[..., 0]
+            # Converged cases stay where they are
+            step = np.where((largest <= tol)[..., None], x, step)
+        last = x
+        x = step
+        residual = update(x) - x
+        iterations += 1
+    return x, iterations, _largest(residual)
@@ -0,0 +1,87 @@
+"""Array-backed statement tables.
+
+A ``StatementCube`` holds the lines of one statement as a single float64 array
+of shape ``(..., line, period)`` plus a line label index; the Year/Month
+labels are derived from the period axis.  The model works on cubes and only
+builds DataFrames at the display/export edge (``to_frame``).
+"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .dual import as_float
+
+MONTH_NAMES = [datetime.strptime(str(m), "%m").strftime("%B") for m in range(1, 13)]
+
+
+class StatementCube:
+    """Statement lines over monthly (``freq='M'``) or annual (``freq='Y'``) periods.
+
+    Lines are read like dict entries (``cube['Revenue']`` is a view on the
+    array), so a cube can be passed wherever a dict of line arrays is expected.
+    """
+
+    __slots__ = ('values', 'lines', 'index', 'freq')
+
+    def __init__(self, values, lines, freq='M', index=None):
+        self.values = values
+        self.lines = list(lines)
+        self.index = index if index is not None else {line: row for row, line in enumerate(self.lines)}
+        self.freq = freq
+
+    @classmethod
+    def from_lines(cls, lines, freq='M'):
+        """Stack a dict of line arrays (month/year axis last) into one cube."""
+        arrays = np.broadcast_arrays(*[as_float(values) for values in lines.values()])
+        return cls(np.stack(arrays, axis=-2), lines.keys(), freq)
+
+    def alias(self, names):
+        """Cube sharing this one's array under other line names (``{new name: line}``)."""
+        return StatementCube(self.values, names.keys(), self.freq, {name: self.index[line] for name, line in names.items()})
+
+    def select(self, index):
+        """Cube of the cases at ``index`` of the leading (scenario) axes."""
+        return StatementCube(self.values[index], self.lines, self.freq, self.index)
+
+    def __getitem__(self, line):
+        return self.values[..., self.index[line], :]
+
+    def __contains__(self, line):
+        return line in self.index
+
+    def __iter__(self):
+        return iter(self.lines)
+
+    def __len__(self):
+        return len(self.lines)
+
+    def keys(self):
+        return list(self.lines)
+
+    def items(self):
+        return [(line, self[line]) for line in self.lines]
+
+    @property
+    def nb_periods(self):
+        return self.values.shape[-1]
+
+    def to_frame(self, labels=('Year', 'Month'), month='December'):
+        """DataFrame of a single case, one row per period and one column per line.
+
+        Monthly tables are indexed by MonthCum and annual ones by Year; ``labels``
+        picks the Year/Month label columns shown before the lines (annual tables
+        label every year with ``month``).
+        """
+        if self.values.ndim != 2:
+            raise ValueError("to_frame needs a single case, pick one with select()")
+        n = self.nb_periods
+        if self.freq == 'M':
+            index = pd.RangeIndex(1, n + 1, name='MonthCum')
+            period_labels = {'Year': np.arange(n) // 12 + 1, 'Month': [MONTH_NAMES[m % 12] for m in range(n)]}
+        else:
+            index = pd.RangeIndex(1, n + 1, name='Year')
+            period_labels = {'Month': [month] * n}
+        columns = {label: period_labels[label] for label in labels if label in period_labels}
+        columns.update(self.items())
+        return pd.DataFrame(columns, index=index)
@@ -0,0 +1,84 @@
+"""Monthly base-rate curves for the ``Bank_Base_Rate_Curve_*`` inputs.
+
+A curve is built from a few tenor points (in months) by linear interpolation,
+held flat before the first and after the last tenor, or read from a CSV file.
+Interpolated curves are cached by a hash of their tenor points, so a book of
+cases sharing a few curve snapshots builds each snapshot once, and
+``curve_from_tenors`` only interpolates the distinct rows of a batch.  The
+cache keeps the ``CURVE_CACHE_SIZE`` curves used last; ``clear_curve_cache``
+empties it.
+"""
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Most curves the cache holds, the least recently used being dropped first
+CURVE_CACHE_SIZE = 1024
+# Interpolated curves by content hash of (tenors, rates, nb_months), least recently used first
+_CURVE_CACHE = OrderedDict()
+
+
+def _digest(tenors, rates, nb_months):
+    h = hashlib.sha1(np.ascontiguousarray(tenors).tobytes())
+    h.update(np.ascontiguousarray(rates).tobytes())
+    h.update(str(nb_months).encode())
+    return h.hexdigest()
+
+
+def interpolated_curve(tenors, rates, nb_months):
+    """Rates in % of months 1..``nb_months`` interpolated from one set of tenor points, cached.
+
+    The returned array is shared with the cache and read-only.
+    """
+    tenors = np.asarray(tenors, dtype=float)
+    rates = np.asarray(rates, dtype=float)
+    key = _digest(tenors, rates, nb_months)
+    curve = _CURVE_CACHE.get(key)
+    if curve is not None:
+        _CURVE_CACHE.move_to_end(key)
+        return curve
+    order = np.argsort(tenors, kind='stable')
+    curve = np.interp(np.arange(1, nb_months + 1), tenors[order], rates[order])
+    curve.flags.writeable = False
+    _CURVE_CACHE[key] = curve
+    while len(_CURVE_CACHE) > CURVE_CACHE_SIZE:
+        _CURVE_CACHE.popitem(last=False)
+    return curve
+
+
+def curve_from_tenors(tenors, rates, nb_months):
+    """Monthly curves ``(..., nb_months)`` in % from rates ``(..., tenors)`` at ``tenors`` months.
+
+    Leading axes of ``rates`` are cases; identical rows are interpolated once.
+    """
+    tenors = np.asarray(tenors, dtype=float)
+    rates = np.asarray(rates, dtype=float)
+    if rates.shape[-1] != len(tenors):
+        raise ValueError(f"rates have {rates.shape[-1]} points for {len(tenors)} tenors")
+    if rates.ndim == 1:
+        return interpolated_curve(tenors, rates, nb_months)
+    rows = rates.reshape(-1, len(tenors))
+    unique, inverse = np.unique(rows, axis=0, return_inverse=True)
+    curves = np.stack([interpolated_curve(tenors, row, nb_months) for row in unique])
+    return curves[inverse.reshape(-1)].reshape(rates.shape[:-1] + (nb_months,))
+
+
+def read_curve_csv(path, nb_months, tenor_column='Tenor', rate_column='Rate'):
+    """Monthly curve in % from a CSV of tenor points (tenors in months, rates in %).
+
+    A file with one row per month is a curve given point by point; fewer rows
+    are interpolated like ``curve_from_tenors``.
+    """
+    table = pd.read_csv(path)
+    missing = [c for c in (tenor_column, rate_column) if c not in table.columns]
+    if missing:
+        raise ValueError(f"{path} has no column {missing}")
+    return interpolated_curve(table[tenor_column].to_numpy(dtype=float), table[rate_column].to_numpy(dtype=float),
+                              nb_months)
+
+
+def clear_curve_cache():
+    """Drop every cached curve."""
+    _CURVE_CACHE.clear()
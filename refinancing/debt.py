@@ -0,0 +1,347 @@
+"""Closed-form debt schedule of a tranche.
+
+A tranche goes through three phases, all of which are linear recurrences on the
+closing balance ``C``:
+
+* grace period (``i <= Amortization_M``): interest is capitalised as
+  ``Amortisation = Opening * rate``, so ``C_i = C_{i-1} * (1 + rate)``;
+* annuity (``i > Amortization_M``): a constant ``pmt`` repayment fixed on
+  the balance outstanding after the grace period, with interest charged until
+  maturity, so ``C_i = C_{i-1} * (1 + rate * [i <= Maturity_M]) + Repayment``;
+* run-off: once a closing balance drops below 1 the repayment stops, and a
+  closing balance with ``abs(C) < 1`` is snapped to 0.
+
+Each phase is solved with cumulative products and sums over the month axis, so
+no Python loop runs per month.  Every argument broadcasts, so a leading axis of
+tranches or scenarios can be evaluated in the same call, and the arguments
+may be ``Dual`` arrays to get derivatives along.
+
+Besides the annuity, a tranche can repay a set principal profile (bullet,
+straight-line or a custom share of the balance each month) or a debt service
+sculpted to a target DSCR; ``PROFILES`` lists them.
+"""
+import numpy as np
+
+from .dual import as_float
+
+# Repayment profiles of a tranche, 'annuity' being the original one
+PROFILES = ('annuity', 'bullet', 'straight-line', 'sculpted', 'custom')
+
+DEBT_COLUMNS = ['Opening', 'Additional Loan', 'Amortisation', 'Interest', 'Repayment', 'Closing']
+
+
+def _first(mask, default):
+    """Index of the first True along the last axis, ``default`` where there is none."""
+    return np.where(mask.any(axis=-1), mask.argmax(axis=-1), default)
+
+
+def pmt(rate, nper, pv):
+    """``numpy_financial.pmt`` (end-of-period payments, no future value) in plain array operations."""
+    temp = (1 + rate) ** nper
+    masked_rate = np.where(rate == 0, 1, rate)
+    fact = np.where(rate == 0, nper, (temp - 1) / masked_rate)
+    return -pv * temp / fact
+
+
+def _snap_once(closing):
+    """Zero a no-repayment path from the first month it falls below 1 in absolute value.
+
+    Months before the path starts are expected to hold ``inf``.
+    """
+    n = closing.shape[-1]
+    months = np.arange(n)
+    first = _first(np.abs(closing) < 1, n)
+    return np.where(months >= first[..., None], 0.0, closing)
+
+
+def debt_schedule_arrays(loan, additional_loan, rate, amortization_m, maturity_m, repayment_over_m,
+                         consolidated=False, nb_months=120):
+    """Monthly debt schedule of one tranche (or a batch of tranches).
+
+    ``rate`` is the monthly interest rate and the periods are in months.  Returns
+    ``(schedule, outAftAmortization, Repayment)``: a dict of the ``DEBT_COLUMNS``
+    arrays of shape ``(..., nb_months)``, the balance the annuity is fixed on and
+    the annuity itself, both of shape ``(...)``.
+    """
+    loan, additional_loan, rate, A, M, R, consolidated = np.broadcast_arrays(
+        *[as_float(p) for p in (loan, additional_loan, rate, amortization_m, maturity_m, repayment_over_m)],
+        np.asarray(consolidated, dtype=bool))
+    col = lambda p: p[..., None]
+    n = nb_months
+    i = np.arange(1, n + 1, dtype=float)
+    idx = np.arange(n)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # Month 1: the loan and the restructuring top-up are drawn
+        out0 = loan + additional_loan
+        opening1 = np.where(consolidated, 0.0, loan)
+        additional1 = np.where(consolidated, 0.0, additional_loan)
+        amort1 = np.where(1 <= A, opening1 * rate, 0.0)
+        interest1 = np.where((1 <= M) & (1 > A), (opening1 + additional1) * rate, 0.0)
+        repayment1 = np.where(A != 0, 0.0, pmt(rate, R, out0))
+        closing1 = np.nansum(np.stack([opening1, additional1, amort1, interest1, repayment1]), axis=0)
+        closing1 = np.where(np.abs(closing1) < 1, 0.0, closing1)
+
+        # Growth of the balance from month 2 on: capitalised interest in the grace
+        # period, interest until maturity afterwards
+        growth = 1 + col(rate) * ((i <= col(A)) | ((i > col(A)) & (i <= col(M))))
+        growth[..., 0] = 1.0
+        G = np.cumprod(growth, axis=-1)
+
+        # The annuity starts on the first month after the grace period (month 2 at
+        # the earliest), unless month 1 already carried a repayment
+        started = repayment1 != 0
+        s = np.maximum(2, np.floor(np.maximum(A, 0)) + 1).astype(int)
+        s = np.where(started, 2, s)
+        before_start = np.take_along_axis(closing1[..., None] * G, np.minimum(s - 2, n - 1)[..., None], axis=-1)[..., 0]
+        payment = np.where(started, repayment1, pmt(rate, R, before_start))
+
+        # Path while the repayment runs (no snapping happens while the balance is >= 1)
+        active = (idx + 1) >= col(s)
+        paid = np.where(active, col(np.nan_to_num(payment)), 0.0)
+        paid[..., 0] = 0.0
+        full = G * (col(closing1) + np.cumsum(paid / G, axis=-1))
+        # First month whose closing falls below 1: repayments stop after it
+        t = _first(full < 1, n)
+        t_closing = np.take_along_axis(full, np.minimum(t, n - 1)[..., None], axis=-1)[..., 0]
+        t_closing = np.where(np.abs(t_closing) < 1, 0.0, t_closing)
+        t_growth = np.take_along_axis(G, np.minimum(t, n - 1)[..., None], axis=-1)
+        runoff = _snap_once(np.where(idx >= col(t), col(t_closing) * G / t_growth, np.inf))
+        closing = np.where(idx < col(t), full, runoff)
+
+        opening = np.concatenate([opening1[..., None], closing[..., :-1]], axis=-1)
+        additional = np.zeros_like(closing)
+        additional[..., 0] = additional1
+        amortisation = np.where(i <= col(A), opening * col(rate), 0.0)
+        interest = np.where((i <= col(M)) & (i > col(A)), opening * col(rate), 0.0)
+        interest[..., 0] = interest1
+        repayment = np.where(active & (idx <= col(t)), col(payment), 0.0)
+        repayment[..., 0] = repayment1
+
+        # outAftAmortization is only re-fixed when the annuity actually started after a grace period
+        refixed = ~started & (s - 1 < n) & (s - 1 <= t)
+        outAftAmortization = np.where(refixed, before_start, out0)
+        annuity = pmt(rate, R, outAftAmortization)
+    schedule = dict(zip(DEBT_COLUMNS, (opening, additional, amortisation, interest, repayment, closing)))
+    return schedule, outAftAmortization, annuity
+
+
+def floating_debt_schedule_arrays(loan, additional_loan, rates, amortization_m, maturity_m, repayment_over_m,
+                                  consolidated=False):
+    """Monthly debt schedule of a floating-rate tranche.
+
+    ``rates`` holds the monthly interest rate of every month, shape
+    ``(..., nb_months)``.  Interest, capitalised or paid, accrues at each
+    month's rate, and the annuity is re-fixed every month: the repayment
+    amortises the opening balance over the repayment months left at that
+    month's rate, so that a flat curve gives back the fixed-rate annuity.  The
+    balance then follows ``C_i = C_{i-1} * (1 + rate_i - a_i)`` with ``a_i``
+    the annuity factor, one cumulative product again.  Past maturity no
+    interest accrues and, as in the fixed-rate schedule, the last annuity keeps
+    being paid, so the balance falls linearly; it runs off as in the
+    fixed-rate schedule once it falls below 1.  Returns the same
+    ``(schedule, outAftAmortization, Repayment)`` as ``debt_schedule_arrays``,
+    the annuity at the rate of the month it starts.
+    """
+    rates = as_float(rates)
+    loan, additional_loan, rate1, A, M, R, consolidated = np.broadcast_arrays(
+        *[as_float(p) for p in (loan, additional_loan, rates[..., 0], amortization_m, maturity_m, repayment_over_m)],
+        np.asarray(consolidated, dtype=bool))
+    n = rates.shape[-1]
+    rates = np.broadcast_to(rates, rate1.shape + (n,))
+    col = lambda p: p[..., None]
+    i = np.arange(1, n + 1, dtype=float)
+    idx = np.arange(n)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # Month 1 as in the fixed-rate schedule, at the month 1 rate
+        out0 = loan + additional_loan
+        opening1 = np.where(consolidated, 0.0, loan)
+        additional1 = np.where(consolidated, 0.0, additional_loan)
+        amort1 = np.where(1 <= A, opening1 * rate1, 0.0)
+        interest1 = np.where((1 <= M) & (1 > A), (opening1 + additional1) * rate1, 0.0)
+        repayment1 = np.where(A != 0, 0.0, pmt(rate1, R, out0))
+        closing1 = np.nansum(np.stack([opening1, additional1, amort1, interest1, repayment1]), axis=0)
+        closing1 = np.where(np.abs(closing1) < 1, 0.0, closing1)
+
+        # Repayments run from the month after the grace period (month 1 when it
+        # already carried one) over R months.  Interest accrues in the grace
+        # period and until maturity, and the annuity is re-fixed every month
+        # interest accrues; from month f on (after maturity) no interest accrues
+        # and the last annuity is paid as it is, as in the fixed-rate schedule
+        started = repayment1 != 0
+        s = np.where(started, 1, np.maximum(2, np.floor(np.maximum(A, 0)) + 1)).astype(int)
+        grace = i <= col(A)
+        accrued = np.where(grace | (i <= col(M)), rates, 0.0)
+        repaying = (idx + 1) >= col(s)
+        refixing = repaying & (i <= col(M))
+        factor = np.where(refixing, -pmt(accrued, np.maximum(col(R) - (i - col(s)), 1), 1.0), 0.0)
+        growth = 1 + accrued - factor
+        growth[..., 0] = 1.0
+        compounded = col(closing1) * np.cumprod(growth, axis=-1)
+        f = np.maximum(s, np.floor(np.maximum(M, 0)) + 1).astype(int)
+        anchor = np.minimum(np.maximum(f - 1, 1), n)
+        anchor_closing = np.take_along_axis(compounded, (anchor - 1)[..., None], axis=-1)[..., 0]
+        fixing_rate = np.take_along_axis(rates, np.minimum(f - 1, n - 1)[..., None], axis=-1)[..., 0]
+        left = np.where(f > s, np.maximum(R - (f - s), 1), R)
+        payment = np.where(f <= 1, -repayment1, -pmt(fixing_rate, left, anchor_closing))
+        flat = i > col(anchor)
+        full = np.where(flat, col(anchor_closing) - (i - col(anchor)) * col(payment), compounded)
+        # As in the fixed-rate schedule, repayments stop after the first month
+        # closing below 1 and the balance then only accrues
+        t = _first(full < 1, n)
+        t_closing = np.take_along_axis(full, np.minimum(t, n - 1)[..., None], axis=-1)[..., 0]
+        t_closing = np.where(np.abs(t_closing) < 1, 0.0, t_closing)
+        G = 1 + accrued
+        G[..., 0] = 1.0
+        G = np.cumprod(G, axis=-1)
+        t_growth = np.take_along_axis(G, np.minimum(t, n - 1)[..., None], axis=-1)
+        runoff = _snap_once(np.where(idx >= col(t), col(t_closing) * G / t_growth, np.inf))
+        closing = np.where(idx < col(t), full, runoff)
+
+        opening = np.concatenate([opening1[..., None], closing[..., :-1]], axis=-1)
+        additional = np.zeros_like(closing)
+        additional[..., 0] = additional1
+        amortisation = np.where(grace, opening * accrued, 0.0)
+        interest = np.where(~grace & (i <= col(M)), opening * accrued, 0.0)
+        interest[..., 0] = interest1
+        repayment = np.where(idx <= col(t), np.where(flat, -col(payment), -opening * factor), 0.0)
+        repayment[..., 0] = repayment1
+
+        start = np.minimum(s - 1, n - 1)[..., None]
+        refixed = ~started & (s - 1 < n) & (s - 1 <= t)
+        before_start = np.take_along_axis(opening, start, axis=-1)[..., 0]
+        outAftAmortization = np.where(refixed, before_start, out0)
+        annuity = pmt(np.take_along_axis(rates, start, axis=-1)[..., 0], R, outAftAmortization)
+    schedule = dict(zip(DEBT_COLUMNS, (opening, additional, amortisation, interest, repayment, closing)))
+    return schedule, outAftAmortization, annuity
+
+
+def _pre_repayment(loan, additional_loan, rates, A, M, consolidated):
+    """Month 1 draws, the path until repayments start and the balance they are sized on.
+
+    Returns ``(opening1, additional1, amort1, interest1, s, accrued, grace,
+    pre, start_balance, principal_base)``: the month 1 columns, ``s`` the first
+    repayment month (1 without grace period), ``pre`` the
+    closing balances with interest capitalised until then, ``start_balance``
+    the balance just before month ``s`` and ``principal_base`` the balance the
+    repayments are sized on (the drawn loans without grace period).
+    """
+    n = rates.shape[-1]
+    col = lambda p: p[..., None]
+    i = np.arange(1, n + 1, dtype=float)
+    rate1 = rates[..., 0]
+    opening1 = np.where(consolidated, 0.0, loan)
+    additional1 = np.where(consolidated, 0.0, additional_loan)
+    amort1 = np.where(1 <= A, opening1 * rate1, 0.0)
+    interest1 = np.where((1 <= M) & (1 > A), (opening1 + additional1) * rate1, 0.0)
+    s = np.where(A <= 0, 1, np.maximum(2, np.floor(np.maximum(A, 0)) + 1)).astype(int)
+    grace = i <= col(A)
+    accrued = np.where(grace | (i <= col(M)), rates, 0.0)
+    growth = 1 + accrued
+    growth[..., 0] = 1.0
+    pre = col(opening1 + additional1 + amort1 + interest1) * np.cumprod(growth, axis=-1)
+    before = np.take_along_axis(pre, np.clip(s - 2, 0, n - 1)[..., None], axis=-1)[..., 0]
+    start_balance = np.where(s == 1, opening1 + additional1, before)
+    principal_base = np.where(s == 1, loan + additional_loan, before)
+    return opening1, additional1, amort1, interest1, s, accrued, grace, pre, start_balance, principal_base
+
+
+def _profile_columns(opening1, additional1, amort1, interest1, closing, accrued, grace, M):
+    """``DEBT_COLUMNS`` dict of a profile schedule from its closing balances, Repayment left to fill in."""
+    n = closing.shape[-1]
+    i = np.arange(1, n + 1, dtype=float)
+    closing = np.where(np.abs(closing) < 1, 0.0, closing)
+    opening = np.concatenate([opening1[..., None], closing[..., :-1]], axis=-1)
+    additional = np.zeros_like(closing)
+    additional[..., 0] = additional1
+    amortisation = np.where(grace, opening * accrued, 0.0)
+    amortisation[..., 0] = amort1
+    interest = np.where(~grace & (i <= M[..., None]), opening * accrued, 0.0)
+    interest[..., 0] = interest1
+    return dict(zip(DEBT_COLUMNS, (opening, additional, amortisation, interest, None, closing)))
+
+
+def principal_debt_schedule_arrays(loan, additional_loan, rates, amortization_m, maturity_m, repayment_over_m,
+                                   principal, consolidated=False):
+    """Monthly debt schedule of tranches repaying a set principal profile (bullet, straight-line, custom).
+
+    ``rates`` holds the monthly interest rate of every month and ``principal``
+    the share of the balance repaid in each repayment month, counted from the
+    first one; both have shape ``(..., nb_months)``.  The grace period
+    capitalises interest as in the annuity schedule, then interest is paid
+    every month until maturity on top of the principal.  Cumulative shares are
+    capped at 1 and the last of the ``repayment_over_m`` months repays what is
+    left, so a bullet is all zeros and straight-line is ``1 / repayment_over_m``
+    every month.  Returns ``(schedule, outAftAmortization, Repayment)`` like
+    ``debt_schedule_arrays``, with the balance the principal is a share of
+    and the first debt service.
+    """
+    rates = as_float(rates)
+    loan, additional_loan, rate1, A, M, R, consolidated = np.broadcast_arrays(
+        *[as_float(p) for p in (loan, additional_loan, rates[..., 0], amortization_m, maturity_m, repayment_over_m)],
+        np.asarray(consolidated, dtype=bool))
+    n = rates.shape[-1]
+    rates = np.broadcast_to(rates, rate1.shape + (n,))
+    principal = np.broadcast_to(as_float(principal), rate1.shape + (n,))
+    col = lambda p: p[..., None]
+    idx = np.arange(n)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        opening1, additional1, amort1, interest1, s, accrued, grace, pre, start_balance, base = _pre_repayment(
+            loan, additional_loan, rates, A, M, consolidated)
+        k = idx - col(s - 1)
+        share = np.where(k >= 0, np.take_along_axis(principal, np.clip(k, 0, n - 1), axis=-1), 0.0)
+        repaid = np.minimum(np.cumsum(share, axis=-1), 1.0)
+        repaid = np.where(k >= col(R) - 1, 1.0, repaid)
+        repaid = np.where(k >= 0, repaid, 0.0)
+        closing = np.where(k < 0, pre, col(start_balance) - col(base) * repaid)
+        schedule = _profile_columns(opening1, additional1, amort1, interest1, closing, accrued, grace, M)
+        paid = col(base) * np.diff(repaid, axis=-1, prepend=0.0)
+        repayment = np.where(k >= 0, -(schedule['Interest'] + paid), 0.0)
+        schedule['Repayment'] = repayment
+        first = np.take_along_axis(repayment, np.minimum(s - 1, n - 1)[..., None], axis=-1)[..., 0]
+    return schedule, base, first
+
+
+def sculpted_debt_schedule_arrays(loan, additional_loan, rates, amortization_m, maturity_m, repayment_over_m,
+                                  cfads, target_dscr, consolidated=False):
+    """Monthly debt schedule of tranches whose debt service is sculpted to a target DSCR.
+
+    From the first repayment month the debt service is ``max(cfads, 0) /
+    target_dscr``, ``cfads`` ``(..., nb_months)`` being the cash flow available
+    for debt service (the monthly EBITDA, the DSCR numerator), or the share of
+    it a tranche is sized on when several are sculpted.  Interest
+    accrues on the balance and a debt service below it is capitalised; the
+    balance is repaid as soon as the debt service covers it, and whatever is
+    left in the last of the ``repayment_over_m`` months is repaid then.  The
+    balance is the linear recurrence ``C_i = C_{i-1} (1 + rate_i) - service_i``
+    solved with cumulative products and sums.  Returns ``(schedule,
+    outAftAmortization, Repayment)`` like ``debt_schedule_arrays``.
+    """
+    rates = as_float(rates)
+    loan, additional_loan, rate1, A, M, R, target_dscr, consolidated = np.broadcast_arrays(
+        *[as_float(p) for p in (loan, additional_loan, rates[..., 0], amortization_m, maturity_m, repayment_over_m,
+                                target_dscr)],
+        np.asarray(consolidated, dtype=bool))
+    n = rates.shape[-1]
+    rates = np.broadcast_to(rates, rate1.shape + (n,))
+    cfads = np.broadcast_to(as_float(cfads), rate1.shape + (n,))
+    col = lambda p: p[..., None]
+    idx = np.arange(n)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        opening1, additional1, amort1, interest1, s, accrued, grace, pre, start_balance, base = _pre_repayment(
+            loan, additional_loan, rates, A, M, consolidated)
+        k = idx - col(s - 1)
+        repaying = k >= 0
+        service = np.where(repaying, np.maximum(cfads, 0.0) / col(target_dscr), 0.0)
+        growth = np.where(repaying, 1 + accrued, 1.0)
+        H = np.cumprod(growth, axis=-1)
+        full = H * (col(start_balance) - np.cumsum(service / H, axis=-1))
+        # The month the balance is paid off: the first one the service covers it, the last repayment month at the latest
+        t = _first(repaying & ((full < 1) | (k >= col(R) - 1)), n)
+        closing = np.where(~repaying, pre, np.where(idx < col(t), full, 0.0))
+        schedule = _profile_columns(opening1, additional1, amort1, interest1, closing, accrued, grace, M)
+        owed = schedule['Opening'] * growth
+        owed[..., 0] = np.where(s == 1, start_balance * growth[..., 0], owed[..., 0])
+        repayment = np.where(repaying & (idx < col(t)), -service, np.where(idx == col(t), -owed, 0.0))
+        schedule['Repayment'] = repayment
+        first = np.take_along_axis(repayment, np.minimum(s - 1, n - 1)[..., None], axis=-1)[..., 0]
+    return schedule, base, first
@@ -0,0 +1,44 @@
+"""Depreciation schedule solved as a linear recurrence.
+
+Each month the asset base is ``Opening + Capex Addition`` and loses
+``1 / life`` of it, so ``Closing_i = (Closing_{i-1} + capex_i) * k_i`` with
+``k_i = 1 - 1 / (life * 12)`` up to the end of the projections and ``k_i = 1``
+afterwards.  With ``K_i = k_1 * ... * k_i`` the closing balance is
+``K_i * (ppe + sum_{j <= i} capex_j / K_{j-1})``, i.e. one cumulative product
+and one cumulative sum over the month axis.
+"""
+import numpy as np
+
+from .dual import as_float
+
+DEPRECIATION_COLUMNS = ['Opening', 'Capex Addition', 'Depreciation', 'Closing']
+
+
+def depreciation_schedule_arrays(ppe, capex, life_m, nb_months):
+    """Monthly depreciation schedule.
+
+    ``capex`` holds the monthly capex additions, shape ``(..., months)``;
+    ``ppe``, ``life_m`` (useful life in months) and ``nb_months`` (months that
+    are depreciated, later months only add capex) broadcast against its leading
+    axes.  Returns a dict of the ``DEPRECIATION_COLUMNS`` arrays.
+    """
+    capex = as_float(capex)
+    col = lambda p: as_float(p)[..., None]
+    ppe, life_m, nb_months = col(ppe), col(life_m), col(nb_months)
+    i = np.arange(1, capex.shape[-1] + 1)
+    active = i <= nb_months
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        k = np.where(active, 1 - 1 / life_m, 1.0)
+        K = np.cumprod(k, axis=-1)
+        K_prev = np.concatenate([np.ones_like(K[..., :1]), K[..., :-1]], axis=-1)
+        closing = K * (ppe + np.cumsum(capex / K_prev, axis=-1))
+        # A one-month life writes the whole base off every month
+        written_off = np.where(active, 0.0, np.where(active.any(axis=-1, keepdims=True), 0.0, ppe)
+                               + np.cumsum(np.where(active, 0.0, capex), axis=-1))
+        closing = np.where(k[..., :1] == 0, written_off, closing)
+        # A zero life divides by zero: the base goes to -inf/inf after the first
+        # depreciated month and is undefined from the second one on
+        closing = np.where((life_m == 0) & (np.cumsum(active, axis=-1) >= 2), np.nan, closing)
+        opening = np.concatenate([np.broadcast_to(ppe, closing[..., :1].shape), closing[..., :-1]], axis=-1)
+        depreciation = np.where(active, (opening + capex) / life_m, 0.0)
+    return dict(zip(DEPRECIATION_COLUMNS, (opening, np.broadcast_to(capex, closing.shape), depreciation, closing)))
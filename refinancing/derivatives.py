@@ -0,0 +1,91 @@
+"""Exact derivatives of the KPI tables with respect to chosen inputs.
+
+Each input of ``wrt`` is seeded as a ``Dual`` array with its own direction and
+the model runs once: every KPI then comes with its derivative along every
+input (forward-mode differentiation), instead of one finite difference rerun
+per input.
+"""
+from dataclasses import dataclass, fields
+
+import numpy as np
+import pandas as pd
+
+from .cube import StatementCube
+from .dual import Dual
+from .model import ModelResult, TrancheTerms, run_model
+from .sensitivity import numeric_inputs, with_inputs
+
+# Tranche rates (in %) and loan amounts the derivatives are taken against by default
+RATE_INPUTS = ['Bank_Base_Rate_SenSec', 'Liquidity_Premiums_SenSec', 'Credit_Risk_Premiums_SenSec',
+               'Bank_Base_Rate_StTerm', 'Liquidity_Premiums_StTerm', 'Credit_Risk_Premiums_StTerm']
+LOAN_INPUTS = ['senior_secured', 'Additional_Loan_on_restructuring_SenSec',
+               'debt_tranche1', 'Additional_Loan_on_restructuring_StTerm']
+GROWTH_INPUTS = ['growth_rate_rev_Dict', 'growth_rate_cost_Dict', 'growth_rate_cost_ope_Dict']
+
+
+def default_wrt(inputs):
+    """Tranche rates, loan amounts and the revenue/cost growth rate of every projection year."""
+    years = range(1, inputs.projections_year + 1)
+    return RATE_INPUTS + LOAN_INPUTS + [f"{name}[{y}]" for name in GROWTH_INPUTS for y in years]
+
+
+@dataclass
+class KPIDerivatives:
+    wrt: list
+    # Values of the run, as run_model returns them
+    result: ModelResult
+    # d KPI / d input, cubes of shape (input, ..., line, period)
+    kpi_mtly: StatementCube
+    kpi_yly: StatementCube
+
+    def frame(self, kpi, yearly=True):
+        """Derivatives of ``kpi`` for a single case, one row per input and one column per month or year."""
+        cube = self.kpi_yly if yearly else self.kpi_mtly
+        values = cube[kpi]
+        if values.ndim != 2:
+            raise ValueError("frame needs a single case, pass inputs without scenario axes")
+        columns = pd.RangeIndex(1, values.shape[-1] + 1, name='Year' if yearly else 'MonthCum')
+        return pd.DataFrame(values, index=pd.Index(self.wrt, name='Input'), columns=columns)
+
+
+def _value(x):
+    return x.value if isinstance(x, Dual) else x
+
+
+def _tangent(cube, nb_directions):
+    values = cube.values
+    tangent = values.tangent if isinstance(values, Dual) else np.zeros((nb_directions,) + np.shape(values))
+    return StatementCube(tangent, cube.lines, cube.freq, cube.index)
+
+
+def kpi_derivatives(inputs, wrt=None):
+    """Values of the model and derivatives of ``KPIMtlyTbl``/``KPIYlyTbl`` with respect to ``wrt``.
+
+    ``wrt`` names numeric inputs like ``numeric_inputs`` does (``field`` or
+    ``field[key]``), ``default_wrt(inputs)`` by default.  Rates and growth rates
+    are in % like the inputs, so derivatives are per percentage point.  Masked
+    ratios (e.g. the DSCR of a year without repayment) have the derivative of
+    their fill value; ratios at a kink (a repayment stopping, a balance snapped
+    to 0) take the one-sided derivative of the branch the values are on.
+    """
+    wrt = default_wrt(inputs) if wrt is None else list(wrt)
+    base = numeric_inputs(inputs)
+    unknown = [name for name in wrt if name not in base]
+    if unknown:
+        raise ValueError(f"unknown numeric inputs {unknown}")
+    seeded = {name: Dual.seed(base[name], k, len(wrt)) for k, name in enumerate(wrt)}
+    dual = run_model(with_inputs(inputs, seeded))
+
+    values = {}
+    for f in fields(dual):
+        value = getattr(dual, f.name)
+        if isinstance(value, StatementCube):
+            values[f.name] = StatementCube(_value(value.values), value.lines, value.freq, value.index)
+        elif isinstance(value, TrancheTerms):
+            values[f.name] = TrancheTerms(**{t.name: _value(getattr(value, t.name)) for t in fields(value)})
+        elif isinstance(value, list):
+            values[f.name] = value
+        else:
+            values[f.name] = {line: _value(v) for line, v in value.items()}
+    return KPIDerivatives(wrt=wrt, result=ModelResult(**values),
+                          kpi_mtly=_tangent(dual.kpi_mtly, len(wrt)), kpi_yly=_tangent(dual.kpi_yly, len(wrt)))
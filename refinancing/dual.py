@@ -0,0 +1,289 @@
+"""Forward-mode derivatives through the array pipeline.
+
+A ``Dual`` is a float array together with its tangents along a set of input
+directions: ``tangent`` has shape ``(directions, *value.shape)``.  It hooks into
+numpy's ``__array_ufunc__``/``__array_function__`` protocols, so the model's
+array functions run on it unchanged and return exact derivatives alongside the
+values.  Comparisons and other predicates act on the values only, and integer
+or piecewise constant results (``floor``, ``astype(int)``) have no tangent.
+
+Only the numpy functions the engine uses are supported; any other one raises
+``TypeError`` rather than silently dropping the tangents.
+"""
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+
+
+def as_float(x):
+    """``x`` as a float array; a ``Dual`` is returned as it is."""
+    return x if isinstance(x, Dual) else np.asarray(x, dtype=float)
+
+
+def _parts(x):
+    return (x.value, x.tangent) if isinstance(x, Dual) else (x, None)
+
+
+def _lift(tangent, ndim):
+    """Tangent reshaped so that its value axes right-align with ``ndim`` value axes."""
+    return tangent.reshape(tangent.shape[:1] + (1,) * (ndim - tangent.ndim + 1) + tangent.shape[1:])
+
+
+def _axis(axis):
+    """Tangent axis of value ``axis`` (the direction axis comes first)."""
+    return axis + 1 if axis is not None and axis >= 0 else axis
+
+
+def _nb_directions(args):
+    return next(x.tangent.shape[0] for x in args if isinstance(x, Dual))
+
+
+def _combine(value, nb_directions, terms):
+    """Dual of ``value`` whose tangent is the sum of ``partial * tangent`` over ``terms``."""
+    value = np.asarray(value, dtype=float)
+    tangent = None
+    for partial, t in terms:
+        if t is None:
+            continue
+        term = partial * _lift(t, value.ndim)
+        tangent = term if tangent is None else tangent + term
+    if tangent is None:
+        tangent = np.zeros((nb_directions,) + value.shape)
+    return Dual(value, np.broadcast_to(tangent, (nb_directions,) + value.shape))
+
+
+def _lifted(args, ndim):
+    """Values and tangents (zero when missing) of ``args``, tangents lifted to ``ndim`` value axes."""
+    nb = _nb_directions(args)
+    values = [_parts(x)[0] for x in args]
+    tangents = [_lift(x.tangent, ndim) if isinstance(x, Dual) else np.zeros((nb,) + (1,) * ndim) for x in args]
+    return values, tangents
+
+
+# Partial derivatives of the differentiable ufuncs, from the inputs and the result z
+_PARTIALS = {
+    np.add: lambda x, y, z: (1.0, 1.0),
+    np.subtract: lambda x, y, z: (1.0, -1.0),
+    np.multiply: lambda x, y, z: (y, x),
+    np.true_divide: lambda x, y, z: (1 / y, -z / y),
+    np.power: lambda x, y, z: (y * x ** (y - 1), z * np.log(x)),
+    np.maximum: lambda x, y, z: (x >= y, x < y),
+    np.minimum: lambda x, y, z: (x <= y, x > y),
+    np.fmax: lambda x, y, z: (x >= y, x < y),
+    np.fmin: lambda x, y, z: (x <= y, x > y),
+    np.negative: lambda x, z: (-1.0,),
+    np.positive: lambda x, z: (1.0,),
+    np.absolute: lambda x, z: (np.sign(x),),
+    np.sqrt: lambda x, z: (0.5 / z,),
+    np.exp: lambda x, z: (z,),
+    np.log: lambda x, z: (1 / x,),
+}
+# Ufuncs with a zero derivative wherever it exists
+_PIECEWISE_CONSTANT = {np.floor, np.ceil, np.trunc, np.rint, np.sign}
+
+
+class Dual(NDArrayOperatorsMixin):
+    """Array ``value`` carrying its derivatives ``tangent`` along ``directions`` inputs."""
+
+    __slots__ = ('value', 'tangent')
+
+    def __init__(self, value, tangent):
+        self.value = np.asarray(value, dtype=float)
+        self.tangent = np.asarray(tangent, dtype=float)
+
+    @classmethod
+    def seed(cls, value, direction, nb_directions):
+        """Input ``value`` with a unit tangent along ``direction`` (of ``nb_directions``)."""
+        value = np.asarray(value, dtype=float)
+        tangent = np.zeros((nb_directions,) + value.shape)
+        tangent[direction] = 1.0
+        return cls(value, tangent)
+
+    def __array__(self, dtype=None, copy=None):
+        raise TypeError("a Dual array cannot be converted to a plain array, use .value")
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or 'out' in kwargs:
+            return NotImplemented
+        values = [_parts(x)[0] for x in inputs]
+        z = ufunc(*values, **kwargs)
+        nb = _nb_directions(inputs)
+        if ufunc in _PIECEWISE_CONSTANT:
+            return _combine(z, nb, [])
+        if ufunc not in _PARTIALS:
+            # Comparisons and predicates: plain results
+            return z
+        partials = _PARTIALS[ufunc](*values, z)
+        return _combine(z, nb, [(p, _parts(x)[1]) for p, x in zip(partials, inputs)])
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func not in _FUNCTIONS:
+            return NotImplemented
+        return _FUNCTIONS[func](*args, **kwargs)
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    @property
+    def ndim(self):
+        return self.value.ndim
+
+    @property
+    def nb_directions(self):
+        return self.tangent.shape[0]
+
+    def __len__(self):
+        return len(self.value)
+
+    def __repr__(self):
+        return f"Dual({self.value!r}, tangent shape {self.tangent.shape})"
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        return Dual(self.value[key], self.tangent[(slice(None),) + key])
+
+    def __setitem__(self, key, item):
+        key = key if isinstance(key, tuple) else (key,)
+        value, tangent = _parts(item)
+        if not self.value.flags.writeable:
+            self.value = self.value.copy()
+        if not self.tangent.flags.writeable:
+            self.tangent = self.tangent.copy()
+        self.value[key] = value
+        target = (slice(None),) + key
+        self.tangent[target] = 0.0 if tangent is None else _lift(tangent, self.tangent[target].ndim - 1)
+
+    def reshape(self, *shape):
+        shape = shape[0] if len(shape) == 1 and isinstance(shape[0], tuple) else shape
+        return Dual(self.value.reshape(shape), self.tangent.reshape((self.nb_directions,) + tuple(shape)))
+
+    def astype(self, dtype):
+        """Plain array of the values (tangents are dropped, e.g. for integer indices)."""
+        return self.value.astype(dtype)
+
+    def sum(self, axis=None):
+        return _sum(self, axis=axis)
+
+
+def _where(condition, x, y):
+    value = np.where(condition, _parts(x)[0], _parts(y)[0])
+    (_, _), (tx, ty) = _lifted([x, y], value.ndim)
+    return Dual(value, np.where(condition, tx, ty))
+
+
+def _cumsum(a, axis=None):
+    return Dual(np.cumsum(a.value, axis=axis), np.cumsum(a.tangent, axis=_axis(axis)))
+
+
+def _cumprod(a, axis=None):
+    value = np.cumprod(a.value, axis=axis)
+    # d P_i = P_i * sum_{k<=i} d x_k / x_k
+    zero = a.value == 0
+    if not zero.any():
+        return Dual(value, value * np.cumsum(a.tangent / a.value, axis=_axis(axis)))
+    # With 0 factors taken as 1 (products Q): before any 0 the same, with one
+    # 0 factor d P_i = Q_i d x_k at that factor, with more it is 0
+    x = np.where(zero, 1.0, a.value)
+    relative = a.tangent / x
+    zeros = np.cumsum(zero, axis=axis)
+    at_zero = np.cumsum(np.where(zero, relative, 0.0), axis=_axis(axis))
+    relative = np.where(zeros == 0, np.cumsum(relative, axis=_axis(axis)), np.where(zeros == 1, at_zero, 0.0))
+    return Dual(value, np.cumprod(x, axis=axis) * relative)
+
+
+def _concatenate(arrays, axis=0):
+    arrays = list(arrays)
+    value = np.concatenate([_parts(x)[0] for x in arrays], axis=axis)
+    nb = _nb_directions(arrays)
+    tangents = [x.tangent if isinstance(x, Dual) else np.zeros((nb,) + np.shape(x)) for x in arrays]
+    return Dual(value, np.concatenate(tangents, axis=_axis(axis)))
+
+
+def _expand_dims(a, axis):
+    if not isinstance(a, Dual):
+        return np.expand_dims(a, axis)
+    axis = axis % (a.ndim + 1)
+    return Dual(np.expand_dims(a.value, axis), np.expand_dims(a.tangent, axis + 1))
+
+
+def _stack(arrays, axis=0):
+    return _concatenate([_expand_dims(x, axis) for x in _broadcast_arrays(*arrays)], axis=axis)
+
+
+def _broadcast_to(a, shape):
+    value, tangent = _parts(a)
+    shape = tuple(shape) if np.iterable(shape) else (shape,)
+    return Dual(np.broadcast_to(value, shape),
+                np.broadcast_to(_lift(tangent, len(shape)), (tangent.shape[0],) + shape))
+
+
+def _broadcast_arrays(*args):
+    shape = np.broadcast_shapes(*[np.shape(_parts(x)[0]) for x in args])
+    return [_broadcast_to(x, shape) if isinstance(x, Dual) else np.broadcast_to(x, shape) for x in args]
+
+
+def _take_along_axis(arr, indices, axis):
+    return Dual(np.take_along_axis(arr.value, indices, axis), np.take_along_axis(arr.tangent, indices[None], _axis(axis)))
+
+
+def _sum(a, axis=None):
+    if axis is None:
+        axis = tuple(range(a.ndim))
+    axes = tuple(_axis(ax) for ax in np.atleast_1d(axis)) if np.ndim(axis) else _axis(axis)
+    return Dual(np.sum(a.value, axis=axis), np.sum(a.tangent, axis=axes))
+
+
+def _nansum(a, axis=None):
+    return _sum(Dual(np.where(np.isnan(a.value), 0.0, a.value), np.where(np.isnan(a.value), 0.0, a.tangent)), axis)
+
+
+def _diff(a, axis=-1, prepend=np._NoValue):
+    if prepend is not np._NoValue:
+        shape = list(np.shape(a))
+        shape[axis] = 1
+        a = _concatenate([np.broadcast_to(prepend, tuple(shape)), a], axis=axis)
+    n = a.shape[axis]
+    head = (slice(None),) * (axis % a.ndim)
+    return a[head + (slice(1, n),)] - a[head + (slice(0, n - 1),)]
+
+
+def _zeros_like(a, *args, **kwargs):
+    return Dual(np.zeros_like(a.value), np.zeros_like(a.tangent))
+
+
+def _ones_like(a, *args, **kwargs):
+    return Dual(np.ones_like(a.value), np.zeros_like(a.tangent))
+
+
+def _full_like(a, fill_value, *args, **kwargs):
+    return Dual(np.full_like(a.value, fill_value), np.zeros_like(a.tangent))
+
+
+def _nan_to_num(x, *args, **kwargs):
+    return Dual(np.nan_to_num(x.value, *args, **kwargs), np.where(np.isfinite(x.value), x.tangent, 0.0))
+
+
+def _repeat(a, repeats, axis=None):
+    return Dual(np.repeat(a.value, repeats, axis=axis), np.repeat(a.tangent, repeats, axis=_axis(axis)))
+
+
+_FUNCTIONS = {
+    np.where: _where,
+    np.cumsum: _cumsum,
+    np.cumprod: _cumprod,
+    np.concatenate: _concatenate,
+    np.stack: _stack,
+    np.broadcast_to: _broadcast_to,
+    np.broadcast_arrays: _broadcast_arrays,
+    np.take_along_axis: _take_along_axis,
+    np.sum: _sum,
+    np.nansum: _nansum,
+    np.diff: _diff,
+    np.zeros_like: _zeros_like,
+    np.ones_like: _ones_like,
+    np.full_like: _full_like,
+    np.nan_to_num: _nan_to_num,
+    np.repeat: _repeat,
+    np.shape: lambda a: a.value.shape,
+    np.ndim: lambda a: a.value.ndim,
+}
@@ -0,0 +1,116 @@
+"""Credit and liquidity ratios evaluated over whole columns.
+
+Every ratio is a masked division: where its guard holds, the value comes from
+a fill policy instead of the division.  Policies are a number (``0`` or
+``np.nan``), ``CARRY`` (repeat the last unmasked value along the month/year
+axis, ``0`` before the first one) or ``None`` (no guard, the IEEE result of
+the division is kept, as the monthly table always did).
+"""
+import numpy as np
+
+from .dual import as_float
+from .statements import DEBT_LINES
+
+CARRY = 'carry'
+
+KPI_MONTHLY_COLUMNS = ['Debt to EBITDA', 'Debt Service Coverage Ratio', 'Loan to Value (Tangible Asset) Ratio',
+                       'Interest Coverage Ratio', 'Current Ratio', 'Quick Ratio (Acid Test Ratio)', 'Debt to Equity Ratio',
+                       'Operating Margin', 'FCFF', 'FCFE']
+KPI_YEARLY_COLUMNS = KPI_MONTHLY_COLUMNS[:-2]
+# Covenant floors ("min") and caps ("max") on the annual ratios
+DEFAULT_COVENANTS = {
+    'Debt Service Coverage Ratio': ('min', 1.2),
+    'Debt to EBITDA': ('max', 4.0),
+    'Interest Coverage Ratio': ('min', 2.0),
+    'Loan to Value (Tangible Asset) Ratio': ('max', 0.8),
+}
+# The DSCR floor alone, the limit stress and structuring searches test by default
+DEFAULT_FLOORS = {'Debt Service Coverage Ratio': DEFAULT_COVENANTS['Debt Service Coverage Ratio']}
+
+
+def carry_forward(values, mask, initial=0.0):
+    """``values`` where ``mask`` is False, else the last unmasked value before (``initial`` if none)."""
+    values = as_float(values)
+    idx = np.where(mask, -1, np.arange(values.shape[-1]))
+    idx = np.maximum.accumulate(idx, axis=-1)
+    carried = np.take_along_axis(values, np.maximum(idx, 0), axis=-1)
+    return np.where(idx < 0, initial, carried)
+
+
+def safe_divide(num, den, mask=None, fill=None):
+    """``num / den`` with the ``fill`` policy applied where ``mask`` is True."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = as_float(num) / as_float(den)
+    if mask is None or fill is None:
+        return ratio
+    if isinstance(fill, str) and fill == CARRY:
+        return carry_forward(ratio, mask)
+    return np.where(mask, fill, ratio)
+
+
+def kpi_arrays(pnl, bs, cfs, yearly=False, debt_lines=DEBT_LINES):
+    """KPIs from the P&L (statement names), balance sheet and cash flow lines.
+
+    Debt is the sum of the tranche lines ``debt_lines``.  The monthly table
+    only guards the DSCR (0 without repayment).  The annual one shows 0 for
+    Debt to EBITDA and Debt to Equity once every tranche is below 1, carries
+    the DSCR forward over years without repayment, and guards the Interest
+    Coverage (EBITDA == 0), Current and Quick Ratios (no payables) and
+    Operating Margin (no revenue, NaN).
+    """
+    tranches = np.stack([bs[line] for line in debt_lines])
+    debt = np.sum(tranches, axis=0)
+    no_debt = (tranches < 1).all(axis=0) if yearly else None
+    no_repayment = cfs['Repayment of Long-term Debt'] == 0
+    current = bs['Cash'] + bs['Accounts Receivable'] + bs['Inventory'] + bs['Other Current Assets'] + bs['Other Assets/DTA']
+    quick = bs['Cash'] + bs['Accounts Receivable'] + bs['Other Current Assets'] + bs['Other Assets/DTA']
+    no_payables = bs['Accounts payable/Provisions'] == 0 if yearly else None
+    kpi = {}
+    kpi['Debt to EBITDA'] = safe_divide(debt, pnl['EBITDA'], no_debt, 0)
+    kpi['Debt Service Coverage Ratio'] = safe_divide(pnl['EBITDA'], -cfs['Repayment of Long-term Debt'], no_repayment,
+                                                     CARRY if yearly else 0)
+    kpi['Loan to Value (Tangible Asset) Ratio'] = safe_divide(debt, bs['Property, Plant & Equipment (Net)'])
+    kpi['Interest Coverage Ratio'] = safe_divide(pnl['EBITDA'] + pnl['Depreciation and Amortisation'], -pnl['Interest Expense'],
+                                                 pnl['EBITDA'] == 0 if yearly else None, 0)
+    kpi['Current Ratio'] = safe_divide(current, bs['Accounts payable/Provisions'], no_payables, 0)
+    kpi['Quick Ratio (Acid Test Ratio)'] = safe_divide(quick, bs['Accounts payable/Provisions'], no_payables, 0)
+    kpi['Debt to Equity Ratio'] = safe_divide(debt, bs['Equity'] + bs['Retained Earning'], no_debt, 0)
+    kpi['Operating Margin'] = safe_divide(pnl['EBITDA'], pnl['Revenue'], pnl['Revenue'] == 0 if yearly else None, np.nan)
+    if not yearly:
+        kpi['FCFF'] = cfs['Net Cash from Operating Activities'] + cfs['Net Cash from Investing Activities']
+        kpi['FCFE'] = cfs['Net Cash from Operating Activities'] + cfs['Net Cash from Investing Activities'] + cfs['Net Cash from Financing Activities']
+    return kpi
+
+
+def covenant_breaches(kpi_yly, cfs_yly, covenants):
+    """Years in which each covenant ``{ratio: ('min' | 'max', threshold)}`` is broken.
+
+    NaN ratios never break a covenant.  The DSCR is only tested in years with
+    debt service (otherwise it is 0 or carried over from the last serviced
+    year) and the ICR in years with interest.  Returns ``{ratio: bool array
+    (..., years)}``.
+    """
+    tested = {'Debt Service Coverage Ratio': cfs_yly['Repayment of Long-term Debt'] != 0,
+              'Interest Coverage Ratio': cfs_yly['Interest Paid'] != 0}
+    breached = {}
+    for ratio, (kind, threshold) in covenants.items():
+        if kind == 'min':
+            breached[ratio] = kpi_yly[ratio] < threshold
+        elif kind == 'max':
+            breached[ratio] = kpi_yly[ratio] > threshold
+        else:
+            raise ValueError(f"covenant kind must be 'min' or 'max', not {kind!r}")
+        if ratio in tested:
+            breached[ratio] = breached[ratio] & tested[ratio]
+    return breached
+
+
+def covenants_met(kpi_yly, cfs_yly, covenants):
+    """Whether every covenant holds in every year, shape ``(...)``."""
+    breached = covenant_breaches(kpi_yly, cfs_yly, covenants)
+    return ~np.any([b.any(axis=-1) for b in breached.values()], axis=0)
+
+
+def limits_met(kpi_yly, cfs_yly, bs_mtly, covenants, min_cash=0.0):
+    """Whether every covenant holds in every year and the monthly Cash never falls below ``min_cash``."""
+    return covenants_met(kpi_yly, cfs_yly, covenants) & (bs_mtly['Cash'] >= min_cash).all(axis=-1)
@@ -0,0 +1,972 @@
+"""Headless refinancing model.
+
+Everything the Streamlit app used to compute inline inside ``with tab1:`` lives
+here, so a refinancing case can be run from plain Python (batch jobs,
+notebooks, solvers) without a Streamlit rerun.  Inputs are given exactly as
+they are typed into the app: rates, growth rates, seasonality and working
+capital assumptions are in %, and converted to fractions by the engine.
+
+Every input except the horizon (``projections_year``) and the working capital
+window may also be an array over leading scenario axes, e.g. 1,000 base rates
+or growth paths: the whole model then runs once over ``(scenario, month)``
+arrays and ``ModelResult.scenario(i)`` picks one case for display.
+"""
+from dataclasses import dataclass, field, fields, replace
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from .circularity import balance_interest_step, solve_fixed_point
+from .cube import StatementCube
+from .debt import (DEBT_COLUMNS, PROFILES, debt_schedule_arrays, floating_debt_schedule_arrays,
+                   principal_debt_schedule_arrays, sculpted_debt_schedule_arrays)
+from .depreciation import depreciation_schedule_arrays
+from .dual import Dual, as_float
+from .kpi import kpi_arrays
+from .sweep import cash_sweep_arrays
+from .statements import (PNL_MONTHLY_ALIASES, bs_cfs_arrays, bs_yearly_arrays, cfs_yearly_arrays, operating_arrays,
+                         pnl_arrays, pnl_yearly_arrays)
+from .tax import tax_paid, tax_schedule_arrays
+
+
+# Inputs holding a monthly curve, month axis last
+CURVE_FIELDS = ('Bank_Base_Rate_Curve_SenSec', 'Bank_Base_Rate_Curve_StTerm')
+# Inputs holding a monthly schedule counted from the first repayment month
+SCHEDULE_FIELDS = ('Custom_Schedule_SenSec', 'Custom_Schedule_StTerm')
+# Columns of a tranche table, one row per facility: Name is its balance sheet
+# line, Loan its opening balance and Senior whether it repays over the grace
+# period when that equals the maturity (as Senior Secured does)
+TRANCHE_COLUMNS = ['Name', 'IndivDebt', 'Loan', 'Additional_Loan_on_restructuring', 'Bank_Base_Rate',
+                   'Liquidity_Premiums', 'Credit_Risk_Premiums', 'Maturity_Y', 'Amortization_Y', 'Senior']
+# Optional columns of a tranche table and their value when absent or empty:
+# monthly base rate curves (None when fixed) and the repayment profile
+OPTIONAL_TRANCHE_COLUMNS = {'Bank_Base_Rate_Curve': None, 'Profile': 'annuity', 'Target_DSCR': 1.3,
+                            'Custom_Schedule': None}
+# Balance sheet line of the revolving facility, the last tranche when there is one
+REVOLVER = 'Revolver'
+# Tranches of the input fields: field suffix -> (balance sheet line, opening balance field, Senior)
+FIELD_TRANCHES = {'SenSec': ('Senior Secured', 'senior_secured', True),
+                  'StTerm': ('Debt 1 - Tranche 1', 'debt_tranche1', False)}
+
+
+@dataclass
+class ModelInputs:
+    # Statement of Profit and Loss (last actual year)
+    revenue: float = 0.0
+    cost_of_goods_sold: float = 0.0
+    operating_expenses: float = 0.0
+    depreciation: float = 0.0
+    interest_expense: float = 0.0
+    income_tax_expense: float = 0.0
+    # Balance Sheet (opening)
+    cash: float = 0.0
+    accounts_receivable: float = 0.0
+    inventory: float = 0.0
+    other_current_assets: float = 0.0
+    ppe: float = 0.0
+    other_assets: float = 0.0
+    accounts_payable: float = 0.0
+    senior_secured: float = 0.0
+    debt_tranche1: float = 0.0
+    equity: float = 0.0
+    retained_earning: float = 0.0
+    # Senior Secured tranche (rates in %)
+    IndivDebt_SenSec: str = "Individual"
+    Additional_Loan_on_restructuring_SenSec: float = 0.0
+    Bank_Base_Rate_SenSec: float = 0.0
+    Liquidity_Premiums_SenSec: float = 0.0
+    Credit_Risk_Premiums_SenSec: float = 0.0
+    Maturity_Y_SenSec: float = 0.0
+    Amortization_Y_SenSec: float = 0.0
+    # Repayment profile, one of debt.PROFILES: the DSCR a 'sculpted' debt
+    # service is sized to and, for 'custom', the % of the balance repaid in
+    # each repayment month counted from the first one (..., months)
+    Profile_SenSec: str = "annuity"
+    Target_DSCR_SenSec: float = 1.3
+    Custom_Schedule_SenSec: np.ndarray | None = None
+    # Floating rate: monthly base rate curve in % (..., months), used instead of
+    # Bank_Base_Rate_SenSec when set
+    Bank_Base_Rate_Curve_SenSec: np.ndarray | None = None
+    # Short Term tranche (rates in %)
+    IndivDebt_StTerm: str = "Individual"
+    Additional_Loan_on_restructuring_StTerm: float = 0.0
+    Bank_Base_Rate_StTerm: float = 0.0
+    Liquidity_Premiums_StTerm: float = 0.0
+    Credit_Risk_Premiums_StTerm: float = 0.0
+    Maturity_Y_StTerm: float = 0.0
+    Amortization_Y_StTerm: float = 0.0
+    Profile_StTerm: str = "annuity"
+    Target_DSCR_StTerm: float = 1.3
+    Custom_Schedule_StTerm: np.ndarray | None = None
+    Bank_Base_Rate_Curve_StTerm: np.ndarray | None = None
+    # Facilities, one row per tranche with the TRANCHE_COLUMNS and any of the
+    # OPTIONAL_TRANCHE_COLUMNS (rates in %, periods in years); replaces the two tranches above, senior_secured and
+    # debt_tranche1 included, when set
+    tranches: pd.DataFrame | None = None
+    # Projections (growth rates in %, keyed by projection year 1..projections_year).
+    # projections_year is also the model horizon: every monthly table runs over
+    # projections_year * 12 months
+    projections_year: int = 10
+    capital_expenditure_additions1: float = 0.0
+    asset_depreciated_over_years: float = 0.0
+    tax_rates: float = 0.0
+    growth_rate_rev_Dict: dict = field(default_factory=dict)
+    growth_rate_cost_Dict: dict = field(default_factory=dict)
+    growth_rate_cost_ope_Dict: dict = field(default_factory=dict)
+    growth_rate_capex_Dict: dict = field(default_factory=dict)
+    # Revenue seasonality in %, keyed by calendar month 1..12
+    Rev_Seas_Dict: dict = field(default_factory=dict)
+    # Cash management: a revolving facility of up to revolver_limit (none when
+    # 0) at revolver_rate (% p.a.) draws to keep Cash at cash_floor and is
+    # repaid first from cash above it; sweep_pct (%) of the cash still above
+    # cash_floor then prepays sweep_tranche (a tranche name, the first one when None)
+    cash_floor: float = 0.0
+    revolver_limit: float = 0.0
+    revolver_rate: float = 0.0
+    sweep_pct: float = 0.0
+    sweep_tranche: str | None = None
+    # Interest conventions: average_balance_interest charges the interest paid
+    # on a tranche on the average of its opening and closing balance (the
+    # opening one otherwise), and cash earns cash_interest_rate (% p.a.) on
+    # its balance under the same convention.  The circularity is solved until
+    # every monthly amount moves by at most circularity_tol in a pass, in at
+    # most max_circularity_iterations passes
+    average_balance_interest: bool = False
+    cash_interest_rate: float = 0.0
+    circularity_tol: float = 1e-6
+    max_circularity_iterations: int = 50
+    # Income tax: tax_rates (%) on the EBT of every projection year, net of
+    # the losses carried forward (tax_losses_brought_forward at the opening);
+    # a loss expires tax_loss_expiry years after the year it arises in (never
+    # when None) and tax is paid tax_payment_lag months after it is charged
+    tax_losses_brought_forward: float = 0.0
+    tax_loss_expiry: int | None = None
+    tax_payment_lag: int = 0
+    # Working capital assumptions (in %)
+    AR_pct: float = 0.0
+    Inventory_pct: float = 0.0
+    oCA_pct: float = 0.0
+    AP_pct: float = 0.0
+    # The working capital lines are a % of the next ("forward") or last
+    # ("trailing") wc_window_months months of their P&L lines
+    wc_window_months: int = 12
+    wc_window_direction: str = "forward"
+
+
+@dataclass
+class TrancheTerms:
+    IndivDebt: str
+    loan: float
+    Additional_Loan_on_restructuring: float
+    Bank_Base_Rate: float
+    Liquidity_Premiums: float
+    Credit_Risk_Premiums: float
+    Interest_Rate_per_annum: float
+    Interest_Rate_per_month: float
+    Maturity_Y: float
+    Maturity_M: float
+    Amortization_Y: float
+    Amortization_M: float
+    Repayment_Over_Y: float
+    Repayment_Over_M: float
+    outAftAmortization: float = np.nan
+    Repayment: float = np.nan
+    # The rates are monthly curves (..., months)
+    Floating: bool = False
+    Profile: str = "annuity"
+    Target_DSCR: float = np.nan
+    # % of the balance repaid in each repayment month (..., months), 'custom' profile
+    Custom_Schedule: np.ndarray | None = None
+
+
+@dataclass
+class ModelResult:
+    """Every table of a run, kept as statement cubes.
+
+    The DataFrames and Series the app displays (``projectionDF``,
+    ``debtCalc_SenSec``, ``PnLStatTbl``, ..., ``KPIYlyTbl``) are built from the
+    cubes on first access, for a single case only.  ``*_SenSec`` and
+    ``*_StTerm`` are the first and second tranche.
+    """
+    # Balance sheet line of every tranche, in tranche axis order
+    tranche_names: list
+    # Terms of every tranche, arrays (..., tranche); the rates (..., tranche,
+    # month) when a tranche floats, and Custom_Schedule always
+    terms: TrancheTerms
+    pnl_open: dict
+    bs_open: dict
+    projections: StatementCube
+    # Debt schedules of every tranche, (..., tranche, line, month)
+    debt: StatementCube
+    debt_total: StatementCube
+    depreciation: StatementCube
+    pnl: StatementCube
+    pnl_mtly: StatementCube
+    bs_mtly: StatementCube
+    cfs_mtly: StatementCube
+    kpi_mtly: StatementCube
+    pnl_yly: StatementCube
+    bs_yly: StatementCube
+    cfs_yly: StatementCube
+    kpi_yly: StatementCube
+    # Annual tax schedule, the tax.TAX_COLUMNS
+    tax: StatementCube
+    # Circularity solver: passes of the monthly model ('iterations', 0 when
+    # nothing is circular) and the largest move of each case in the last one
+    # ('residual')
+    circularity: dict
+
+    def scenario(self, i):
+        """Result of case ``i`` of a batched run (``i`` indexes the leading scenario axes)."""
+        take = lambda values: np.asarray(values)[i] if np.ndim(values) else values
+        result = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, StatementCube):
+                result[f.name] = value.select(i)
+            elif isinstance(value, TrancheTerms):
+                result[f.name] = TrancheTerms(**{t.name: take(getattr(value, t.name)) for t in fields(value)})
+            elif isinstance(value, list):
+                result[f.name] = value
+            else:
+                result[f.name] = {line: take(values) for line, values in value.items()}
+        return ModelResult(**result)
+
+    def tranche_index(self, tranche):
+        """Position on the tranche axis of ``tranche``, a name or a position."""
+        return self.tranche_names.index(tranche) if isinstance(tranche, str) else tranche
+
+    def debt_of(self, tranche):
+        """Debt schedule cube of one tranche (name or position)."""
+        k = self.tranche_index(tranche)
+        return StatementCube(self.debt.values[..., k, :, :], self.debt.lines, self.debt.freq, self.debt.index)
+
+    def terms_of(self, tranche):
+        """Terms of one tranche (name or position)."""
+        k = self.tranche_index(tranche)
+        monthly = np.ndim(self.terms.loan) + 1
+        pick = lambda v: v if v is None else (v[..., k, :] if np.ndim(v) == monthly else v[..., k])[()]
+        return TrancheTerms(**{f.name: pick(getattr(self.terms, f.name)) for f in fields(self.terms)})
+
+    def debtCalc(self, tranche):
+        """Debt schedule table of one tranche (name or position)."""
+        return self.debt_of(tranche).to_frame()
+
+    @cached_property
+    def terms_SenSec(self):
+        return self.terms_of(0)
+
+    @cached_property
+    def terms_StTerm(self):
+        return self.terms_of(1)
+
+    @cached_property
+    def debt_SenSec(self):
+        return self.debt_of(0)
+
+    @cached_property
+    def debt_StTerm(self):
+        return self.debt_of(1)
+
+    @cached_property
+    def projectionDF(self):
+        return self.projections.to_frame(labels=()).rename_axis(None)
+
+    @cached_property
+    def PnLStatMtlySr(self):
+        return pd.Series(self.pnl_open, dtype=float)
+
+    @cached_property
+    def BSMtlySr(self):
+        return pd.Series(self.bs_open, dtype=float)
+
+    @cached_property
+    def debtCalc_SenSec(self):
+        return self.debtCalc(0)
+
+    @cached_property
+    def debtCalc_StTerm(self):
+        return self.debtCalc(1)
+
+    @cached_property
+    def totDebtCalc(self):
+        return self.debt_total.to_frame(labels=('Year',))
+
+    @cached_property
+    def depSchedCalcTbl(self):
+        return self.depreciation.to_frame()
+
+    @cached_property
+    def PnLStatTbl(self):
+        PnLStatTbl = self.pnl.to_frame()
+        PnLStatTbl.insert(0, 'Seasonality', PnLStatTbl.pop('Seasonality'))
+        return PnLStatTbl
+
+    @cached_property
+    def PnLStatMtlyTbl(self):
+        return self.pnl_mtly.to_frame()
+
+    @cached_property
+    def BSMtlyTbl(self):
+        return self.bs_mtly.to_frame()
+
+    @cached_property
+    def CFSMtlyTbl(self):
+        return self.cfs_mtly.to_frame()
+
+    @cached_property
+    def KPIMtlyTbl(self):
+        return self.kpi_mtly.to_frame()
+
+    @cached_property
+    def PnLStatYlyTbl(self):
+        return self.pnl_yly.to_frame(labels=())
+
+    @cached_property
+    def BSYlyTbl(self):
+        return self.bs_yly.to_frame(labels=('Month',))
+
+    @cached_property
+    def CFSYlyTbl(self):
+        return self.cfs_yly.to_frame(labels=('Month',))
+
+    @cached_property
+    def KPIYlyTbl(self):
+        return self.kpi_yly.to_frame(labels=('Month',))
+
+    @cached_property
+    def TaxYlyTbl(self):
+        return self.tax.to_frame(labels=())
+
+
+def tranche_terms(IndivDebt, loan, additional_loan, base_rate, liquidity_premiums, credit_risk_premiums,
+                  maturity_y, amortization_y, senior=False, floating=False, profile="annuity", target_dscr=np.nan,
+                  custom_schedule=None):
+    """Derive rates and periods of tranches from their inputs (rates in %).
+
+    Inputs are per tranche, arrays ``(..., tranche)`` when several tranches are
+    derived at once.  ``floating`` flags the tranches whose base rate is a
+    monthly curve; when any does, ``base_rate`` holds a curve ``(..., month)``
+    for every tranche (flat for the others) and the interest rates follow it.
+    ``profile`` is the repayment profile of each tranche (one of ``PROFILES``)
+    and ``custom_schedule`` the monthly % repaid by 'custom' ones.
+    """
+    unknown = set(np.unique(profile)) - set(PROFILES)
+    if unknown:
+        raise ValueError(f"repayment profiles must be among {PROFILES}, not {sorted(unknown)}")
+    base_rate = base_rate / 100
+    liquidity_premiums = liquidity_premiums / 100
+    credit_risk_premiums = credit_risk_premiums / 100
+    spread = liquidity_premiums + credit_risk_premiums
+    rate_pa = base_rate + (as_float(spread)[..., None] if np.any(floating) else spread)
+    # Senior tranches repay over the amortisation period when it equals the maturity
+    repayment_over_y = np.where(senior & (np.asarray(maturity_y) == amortization_y),
+                                amortization_y, np.subtract(maturity_y, amortization_y))[()]
+    return TrancheTerms(
+        IndivDebt=IndivDebt,
+        loan=loan,
+        Additional_Loan_on_restructuring=additional_loan,
+        Bank_Base_Rate=base_rate,
+        Liquidity_Premiums=liquidity_premiums,
+        Credit_Risk_Premiums=credit_risk_premiums,
+        Interest_Rate_per_annum=rate_pa,
+        Interest_Rate_per_month=rate_pa / 12,
+        Maturity_Y=maturity_y,
+        Maturity_M=maturity_y * 12,
+        Amortization_Y=amortization_y,
+        Amortization_M=amortization_y * 12,
+        Repayment_Over_Y=repayment_over_y,
+        Repayment_Over_M=repayment_over_y * 12,
+        Floating=floating,
+        Profile=profile,
+        Target_DSCR=target_dscr,
+        Custom_Schedule=None if custom_schedule is None else as_float(custom_schedule) / 100,
+    )
+
+
+def debt_schedule(terms, nb_months, cfads=None):
+    """Monthly Opening/Additional Loan/Amortisation/Interest/Repayment/Closing cube of every tranche.
+
+    The cube has the tranche axis before its line axis, ``(..., tranche, line,
+    month)``.  The tranches of every case are grouped by schedule (fixed-rate
+    and floating-rate annuities, set principal profiles and sculpted debt
+    services), each group goes through its schedule in one call and the rows
+    are put back in place.  ``cfads`` ``(..., month)`` is the cash flow
+    available for debt service, shared by the 'sculpted' tranches of a case
+    (see ``sculpted_shares``).  Returns
+    the cube and a copy of ``terms`` with ``outAftAmortization`` and
+    ``Repayment`` filled in.
+    """
+    shape = np.shape(terms.loan)
+    size = int(np.prod(shape))
+    flat = lambda x: np.broadcast_to(x if isinstance(x, Dual) else np.asarray(x), shape).reshape(size)
+    monthly = lambda x: np.broadcast_to(x, shape + (nb_months,)).reshape(size, nb_months)
+    rate = terms.Interest_Rate_per_month
+    rate = monthly(rate) if np.ndim(rate) > len(shape) else flat(rate)[:, None]
+    profile = flat(terms.Profile)
+    floating = flat(terms.Floating)
+    consolidated = flat(terms.IndivDebt) == "Consolidated"
+    groups = {'annuity': (profile == 'annuity') & ~floating, 'floating': (profile == 'annuity') & floating,
+              'principal': np.isin(profile, ('bullet', 'straight-line', 'custom')), 'sculpted': profile == 'sculpted'}
+    parts = []
+    for group, mask in groups.items():
+        rows = np.flatnonzero(mask)
+        if len(rows) == 0:
+            continue
+        pick = lambda x: flat(x)[rows]
+        loans = (pick(terms.loan), pick(terms.Additional_Loan_on_restructuring))
+        periods = (pick(terms.Amortization_M), pick(terms.Maturity_M), pick(terms.Repayment_Over_M))
+        rates = np.broadcast_to(rate[rows], (len(rows), nb_months))
+        if group == 'annuity':
+            part = debt_schedule_arrays(*loans, rate[rows, 0], *periods, consolidated=consolidated[rows],
+                                        nb_months=nb_months)
+        elif group == 'floating':
+            part = floating_debt_schedule_arrays(*loans, rates, *periods, consolidated=consolidated[rows])
+        elif group == 'principal':
+            # Share of the balance repaid each repayment month: none before the
+            # last one for a bullet, 1/R for straight-line, the schedule for custom
+            custom = profile[rows] == 'custom'
+            if custom.any() and terms.Custom_Schedule is None:
+                raise ValueError("'custom' tranches need a Custom_Schedule")
+            with np.errstate(divide='ignore'):
+                share = np.where((profile[rows] == 'straight-line')[:, None], 1 / periods[2][:, None], 0.0)
+            if custom.any():
+                share = np.where(custom[:, None], monthly(terms.Custom_Schedule)[rows], share)
+            part = principal_debt_schedule_arrays(*loans, rates, *periods, share, consolidated=consolidated[rows])
+        else:
+            if cfads is None:
+                raise ValueError("'sculpted' tranches need the cash flow available for debt service")
+            flows = monthly(as_float(cfads)[..., None, :] * sculpted_shares(terms, shape)[..., None])[rows]
+            part = sculpted_debt_schedule_arrays(*loans, rates, *periods, flows, pick(terms.Target_DSCR),
+                                                 consolidated=consolidated[rows])
+        parts.append((rows, part))
+
+    order = np.argsort(np.concatenate([rows for rows, _ in parts]))
+    join = lambda values, tail=(): np.concatenate(values, axis=0)[order].reshape(shape + tail)
+    schedule = {line: join([part[0][line] for _, part in parts], (nb_months,)) for line in DEBT_COLUMNS}
+    terms = replace(terms, outAftAmortization=join([part[1] for _, part in parts])[()],
+                    Repayment=join([part[2] for _, part in parts])[()])
+    return StatementCube.from_lines(schedule), terms
+
+
+def sculpted_shares(terms, shape):
+    """Share ``(..., tranche)`` of the cash flow available for debt service each 'sculpted' tranche is sized on.
+
+    The sculpted tranches of a case split it pro rata to the balance they
+    start from (equally when none of them is drawn), so their total debt
+    service stays within ``cfads / Target_DSCR``; other tranches get none.
+    """
+    sculpted = np.broadcast_to(terms.Profile == 'sculpted', shape)
+    owed = np.where(sculpted, as_float(terms.loan) + as_float(terms.Additional_Loan_on_restructuring), 0.0)
+    total = np.sum(owed, axis=-1)[..., None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(total > 0, owed / total, sculpted / np.sum(sculpted, axis=-1)[..., None])
+
+
+def monthly_rates(terms, nb_months):
+    """Monthly interest rate of every tranche and month, ``(..., tranche, month)``."""
+    rate = terms.Interest_Rate_per_month
+    if np.ndim(rate) > np.ndim(terms.loan):
+        return rate
+    return np.broadcast_to(as_float(rate)[..., None], np.shape(rate) + (nb_months,))
+
+
+def cash_management(inputs, tranche_names, terms, debt, projections, depreciation, BSMtlySr, interest_income=None,
+                    tax=None, start=None):
+    """Debt cube with the revolver drawn and repaid and the sweep tranche prepaid (``cash_sweep_arrays``).
+
+    The net cash flow they start from is one pass of the statements on the
+    scheduled debt (``start``, the ``scheduled_pass`` when already known),
+    with the monthly ``tax`` charge of the managed debt paid instead of the
+    tax of that pass when given (the interest the sweep and the revolver
+    change moves the tax).
+    """
+    if start is None:
+        start = scheduled_pass(inputs, tranche_names, debt, projections, depreciation, BSMtlySr, interest_income)
+    pnl, cfs = start
+    net_cash_flow = cfs['Net Cash flow']
+    if tax is not None:
+        net_cash_flow = net_cash_flow + tax_paid(tax - pnl['Tax'], inputs.tax_payment_lag)
+    nb_months = debt.values.shape[-1]
+    if inputs.sweep_tranche is None:
+        k = 0
+    elif inputs.sweep_tranche in tranche_names and inputs.sweep_tranche != REVOLVER:
+        k = tranche_names.index(inputs.sweep_tranche)
+    else:
+        raise ValueError(f"sweep_tranche must be one of {[n for n in tranche_names if n != REVOLVER]}, "
+                         f"not {inputs.sweep_tranche!r}")
+    revolver = tranche_names.index(REVOLVER) if REVOLVER in tranche_names else None
+    rates = monthly_rates(terms, nb_months)
+    months = np.arange(1, nb_months + 1)
+    grace = months <= as_float(terms.Amortization_M)[..., k, None]
+    accruing = ~grace & (months <= as_float(terms.Maturity_M)[..., k, None])
+    swept, drawn, _ = cash_sweep_arrays(
+        net_cash_flow, inputs.cash, {line: debt[line][..., k, :] for line in DEBT_COLUMNS}, rates[..., k, :],
+        grace, accruing, inputs.cash_floor, as_float(inputs.sweep_pct) / 100,
+        0.0 if revolver is None else rates[..., revolver, :], inputs.revolver_limit)
+    lines = {}
+    for line in DEBT_COLUMNS:
+        rows = [debt[line][..., j, :] for j in range(len(tranche_names))]
+        rows[k] = swept[line]
+        if revolver is not None:
+            rows[revolver] = drawn[line]
+        lines[line] = np.stack(rows, axis=-2)
+    return StatementCube.from_lines(lines)
+
+
+def scheduled_pass(inputs, tranche_names, debt, projections, depreciation, BSMtlySr, interest_income=None):
+    """Monthly P&L and cash flow statement cubes of the scheduled ``debt``, before any cash management."""
+    debt_total = total_debt(debt)
+    pnl, _ = pnl_statements(inputs, projections, depreciation, debt_total, interest_income)
+    _, cfs = bs_cfs_monthly(inputs, BSMtlySr, pnl, depreciation, tranche_names, debt, debt_total, interest_income)
+    return pnl, cfs
+
+
+def with_interest(debt, extra):
+    """Debt cube with ``extra`` interest ``(..., tranche, month)`` charged and paid with the debt service."""
+    lines = {line: debt[line] for line in DEBT_COLUMNS}
+    lines['Interest'] = lines['Interest'] + extra
+    lines['Repayment'] = lines['Repayment'] - extra
+    return StatementCube.from_lines(lines)
+
+
+def average_interest(debt, terms, nb_months, tranche_names):
+    """Interest to add to the opening-balance interest of each tranche for it to run on average balances.
+
+    Half the rate on the change of balance, ``(..., tranche, month)``, in the
+    months interest is paid; interest capitalised in the grace period
+    compounds monthly on the opening balance as before, and so does the
+    revolver's, drawn and repaid by the cash management.
+    """
+    months = np.arange(1, nb_months + 1)
+    paid = (months > as_float(terms.Amortization_M)[..., None]) & (months <= as_float(terms.Maturity_M)[..., None])
+    paid &= np.array([name != REVOLVER for name in tranche_names])[:, None]
+    change = debt['Closing'] - (debt['Opening'] + debt['Additional Loan'])
+    return np.where(paid, monthly_rates(terms, nb_months) * change / 2, 0.0)
+
+
+def cash_interest(inputs, cfs):
+    """Interest earned on cash each month, on the average or the opening balance."""
+    rate = as_float(inputs.cash_interest_rate)[..., None] / 100 / 12
+    balance = (cfs['Opening'] + cfs['Closing']) / 2 if inputs.average_balance_interest else cfs['Opening']
+    return rate * balance
+
+
+def total_debt(debt):
+    """Debt flows of all the tranches together: the schedules summed over the tranche axis."""
+    return StatementCube.from_lines({
+        'Additional Loan': debt['Additional Loan'].sum(axis=-2),
+        'Total Repayment': debt['Repayment'].sum(axis=-2),
+        'Total Interest': (debt['Interest'] + debt['Amortisation']).sum(axis=-2),
+    })
+
+
+def tranche_columns(inputs):
+    """Parameters of every facility: ``TRANCHE_COLUMNS`` and ``OPTIONAL_TRANCHE_COLUMNS``, one value per tranche.
+
+    The ``tranches`` table when set, else the Senior Secured and Debt 1 -
+    Tranche 1 input fields.
+    """
+    if inputs.tranches is not None:
+        table = inputs.tranches
+        missing = [column for column in TRANCHE_COLUMNS if column not in table.columns]
+        if missing:
+            raise ValueError(f"tranche table has no column {missing}")
+        columns = {column: table[column].tolist() for column in TRANCHE_COLUMNS}
+        for column, default in OPTIONAL_TRANCHE_COLUMNS.items():
+            values = table[column].tolist() if column in table else [default] * len(table)
+            # Empty cells (None or NaN) take the default, e.g. fixed-rate facilities
+            columns[column] = [default if value is None or (default is None and np.ndim(value) == 0)
+                               or (np.ndim(value) == 0 and not isinstance(value, str) and np.isnan(value))
+                               else value for value in values]
+        return columns
+    columns = {column: [] for column in TRANCHE_COLUMNS + list(OPTIONAL_TRANCHE_COLUMNS)}
+    for suffix, (name, loan, senior) in FIELD_TRANCHES.items():
+        columns['Name'].append(name)
+        columns['Loan'].append(getattr(inputs, loan))
+        columns['Senior'].append(senior)
+        for column in ('IndivDebt', 'Additional_Loan_on_restructuring', 'Bank_Base_Rate', 'Liquidity_Premiums',
+                       'Credit_Risk_Premiums', 'Maturity_Y', 'Amortization_Y', *OPTIONAL_TRANCHE_COLUMNS):
+            columns[column].append(getattr(inputs, f"{column}_{suffix}"))
+    return columns
+
+
+def tranche_table(inputs):
+    """Facilities of ``inputs`` as a tranche table, e.g. to add facilities to the two of the input fields."""
+    columns = tranche_columns(inputs)
+    for column in ('Bank_Base_Rate_Curve', 'Custom_Schedule'):
+        if all(value is None for value in columns[column]):
+            del columns[column]
+    return pd.DataFrame(columns)
+
+
+def stack_tranches(values, shape):
+    """Per-tranche values (scalars or scenario arrays) stacked on a last tranche axis, ``shape + (tranche,)``."""
+    values = [v if isinstance(v, Dual) else np.asarray(v) for v in values]
+    return np.stack([np.broadcast_to(v, shape) for v in values], axis=-1)
+
+
+def all_tranche_terms(inputs):
+    """Names and stacked terms ``(..., tranche)`` of every facility of broadcast ``inputs``.
+
+    A revolving facility comes last, as a bullet tranche drawn from 0, when
+    any case has a ``revolver_limit``.
+    """
+    columns = tranche_columns(inputs)
+    if np.any(inputs.revolver_limit > 0):
+        revolver = {**OPTIONAL_TRANCHE_COLUMNS, 'Name': REVOLVER, 'IndivDebt': 'Individual', 'Loan': 0.0,
+                    'Additional_Loan_on_restructuring': 0.0, 'Bank_Base_Rate': inputs.revolver_rate,
+                    'Liquidity_Premiums': 0.0, 'Credit_Risk_Premiums': 0.0, 'Maturity_Y': inputs.projections_year,
+                    'Amortization_Y': 0.0, 'Senior': False, 'Profile': 'bullet'}
+        for column, values in columns.items():
+            values.append(revolver[column])
+    shape = np.shape(inputs.revenue)
+    nb_months = inputs.projections_year * 12
+    curves = [None if curve is None else rate_curve(curve, nb_months) for curve in columns['Bank_Base_Rate_Curve']]
+    floating = np.array([curve is not None for curve in curves])
+    stack = lambda column: stack_tranches(columns[column], shape)
+    if floating.any():
+        # Every tranche gets a curve, flat for the fixed-rate ones
+        base_rate = np.stack([np.broadcast_to(as_float(rate)[..., None] if curve is None else curve, shape + (nb_months,))
+                              for rate, curve in zip(columns['Bank_Base_Rate'], curves)], axis=-2)
+    else:
+        base_rate = stack('Bank_Base_Rate')
+    terms = tranche_terms(stack('IndivDebt'), stack_tranches([as_float(v) for v in columns['Loan']], shape),
+                          stack_tranches([as_float(v) for v in columns['Additional_Loan_on_restructuring']], shape),
+                          base_rate, stack('Liquidity_Premiums'), stack('Credit_Risk_Premiums'), stack('Maturity_Y'),
+                          stack('Amortization_Y'), senior=stack('Senior').astype(bool),
+                          floating=np.broadcast_to(floating, shape + floating.shape), profile=stack('Profile'),
+                          target_dscr=stack_tranches([as_float(v) for v in columns['Target_DSCR']], shape),
+                          custom_schedule=custom_schedules(columns['Custom_Schedule'], shape, nb_months))
+    return [str(name) for name in columns['Name']], terms
+
+
+def schedule_curve(schedule, nb_months):
+    """Monthly schedule ``(..., months)`` cut to ``nb_months``, padded with zeros when it is shorter."""
+    schedule = as_float(schedule)
+    pad = max(nb_months - schedule.shape[-1], 0)
+    zeros = np.zeros(schedule.shape[:-1] + (pad,))
+    return np.concatenate([schedule[..., :nb_months], zeros], axis=-1)
+
+
+def custom_schedules(schedules, shape, nb_months):
+    """Custom repayment schedules of every tranche ``shape + (tranche, month)``, zeros where there is none.
+
+    None when no tranche has one.
+    """
+    if all(schedule is None for schedule in schedules):
+        return None
+    return np.stack([np.zeros(shape + (nb_months,)) if schedule is None
+                     else np.broadcast_to(schedule_curve(schedule, nb_months), shape + (nb_months,))
+                     for schedule in schedules], axis=-2)
+
+
+def growth_rates(rates, nb_years):
+    """Growth rates in % keyed by projection year as fractions ``(..., years)``; missing years grow at 0%."""
+    rates = np.broadcast_arrays(*[as_float(rates.get(y, 0.0)) for y in range(1, nb_years + 1)])
+    rates = np.stack(rates, axis=-1)
+    return np.where(np.isnan(rates), 0.0, rates) / 100
+
+
+def grow(first, rates):
+    """Yearly path starting at ``first`` in year 1, each later year grown by its rate."""
+    first = as_float(first)
+    shape = np.broadcast_shapes(first.shape, rates.shape[:-1])
+    later = 1 + rates[..., 1:]
+    growth = np.concatenate([np.broadcast_to(first, shape)[..., None], np.broadcast_to(later, shape + later.shape[-1:])],
+                            axis=-1)
+    return np.cumprod(growth, axis=-1)
+
+
+def projections(inputs):
+    """Annual Revenue/COGS/Operating Cost/Capex projections from the growth rates."""
+    nb_years = inputs.projections_year
+    gr_rev = growth_rates(inputs.growth_rate_rev_Dict, nb_years)
+    gr_cost = growth_rates(inputs.growth_rate_cost_Dict, nb_years)
+    gr_ope = growth_rates(inputs.growth_rate_cost_ope_Dict, nb_years)
+    gr_capex = growth_rates(inputs.growth_rate_capex_Dict, nb_years)
+    # Year 1 grows the last actual year; capex starts from the year 1 input
+    return StatementCube.from_lines({
+        "Revenue per annum": grow(inputs.revenue * (1 + gr_rev[..., 0]), gr_rev),
+        "GR of Revenue p.a": gr_rev,
+        "COGS or COS": grow(-inputs.cost_of_goods_sold * (1 + gr_cost[..., 0]), gr_cost),
+        "GR in Cost p.a": gr_cost,
+        "Operating Cost": grow(-inputs.operating_expenses * (1 + gr_ope[..., 0]), gr_ope),
+        "GR in Cost p.a (Oper)": gr_ope,
+        "Capital Expenditure Additions": grow(inputs.capital_expenditure_additions1, gr_capex),
+        "GR in Capex p.a": gr_capex,
+    }, freq='Y')
+
+
+def depreciation_schedule(inputs, projections):
+    capex = np.repeat(projections["Capital Expenditure Additions"], 12, axis=-1) / 12
+    schedule = depreciation_schedule_arrays(inputs.ppe, capex, inputs.asset_depreciated_over_years * 12,
+                                            inputs.projections_year * 12)
+    return StatementCube.from_lines(schedule)
+
+
+def seasonality_weights(inputs):
+    """Revenue seasonality of calendar months 1..12 as fractions ``(..., 12)``."""
+    return np.stack(np.broadcast_arrays(*[as_float(inputs.Rev_Seas_Dict.get(m, 0.0)) / 100 for m in range(1, 13)]),
+                    axis=-1)
+
+
+def monthly_ebitda(inputs, projections):
+    """Monthly EBITDA ``(..., month)``, the cash flow available for debt service (it does not depend on the debt)."""
+    return operating_arrays(projections["Revenue per annum"], projections["COGS or COS"], projections["Operating Cost"],
+                            seasonality_weights(inputs), inputs.projections_year * 12)['EBITDA']
+
+
+def pnl_statements(inputs, projections, depreciation, debt_total, interest_income=None):
+    """Monthly P&L cube and the same lines under their statement names (a view on it).
+
+    The Interest line is net of the ``interest_income`` earned on cash, if any.
+    """
+    seasonality = seasonality_weights(inputs)
+    interest = -debt_total['Total Interest']
+    if interest_income is not None:
+        interest = interest + interest_income
+    pnl = StatementCube.from_lines(pnl_arrays(projections["Revenue per annum"], projections["COGS or COS"],
+                                              projections["Operating Cost"],
+                                              seasonality, depreciation['Depreciation'], interest,
+                                              as_float(inputs.tax_rates) / 100, inputs.tax_loss_expiry,
+                                              inputs.tax_losses_brought_forward))
+    return pnl, pnl.alias(PNL_MONTHLY_ALIASES)
+
+
+def pnl_opening(inputs):
+    """Last actual year P&L, shown as the first column of the P&L tables."""
+    revenue = inputs.revenue
+    cost_of_goods_sold = inputs.cost_of_goods_sold
+    operating_expenses = inputs.operating_expenses
+    depreciation = inputs.depreciation
+    interest_expense = inputs.interest_expense
+    income_tax_expense = inputs.income_tax_expense
+    PnLStatMtlySr = {}
+    PnLStatMtlySr['Revenue'] = revenue
+    PnLStatMtlySr['Cost of Goods Sold'] = cost_of_goods_sold
+    PnLStatMtlySr['Gross Profit'] = revenue + cost_of_goods_sold
+    PnLStatMtlySr['Operating Expenses'] = operating_expenses
+    PnLStatMtlySr['EBITDA'] = revenue + cost_of_goods_sold + operating_expenses
+    PnLStatMtlySr['Depreciation and Amortisation'] = depreciation
+    PnLStatMtlySr['Interest Expense'] = interest_expense
+    PnLStatMtlySr['Net Income Before Tax'] = revenue + cost_of_goods_sold + operating_expenses + depreciation + interest_expense
+    PnLStatMtlySr['Income Tax Expense'] = income_tax_expense
+    PnLStatMtlySr['Net Income'] = revenue + cost_of_goods_sold + operating_expenses + depreciation + interest_expense + income_tax_expense
+    return PnLStatMtlySr
+
+
+def bs_opening(inputs, tranche_names, loans):
+    """Opening balance sheet, shown as the first column of the balance sheet tables.
+
+    ``loans`` holds the opening balance of every tranche, ``(..., tranche)``.
+    """
+    BSMtlySr = {}
+    BSMtlySr['Cash'] = inputs.cash
+    BSMtlySr['Accounts Receivable'] = inputs.accounts_receivable
+    BSMtlySr['Inventory'] = inputs.inventory
+    BSMtlySr['Other Current Assets'] = inputs.other_current_assets
+    BSMtlySr['Property, Plant & Equipment (Net)'] = inputs.ppe
+    BSMtlySr['Other Assets/DTA'] = inputs.other_assets
+    BSMtlySr['Total Assets'] = inputs.cash + inputs.accounts_receivable + inputs.inventory + inputs.other_current_assets + inputs.ppe + inputs.other_assets
+    BSMtlySr['Short Term Debt'] = np.nan
+    BSMtlySr['Accounts payable/Provisions'] = inputs.accounts_payable
+    BSMtlySr['Long Term Debt'] = np.nan
+    for k, name in enumerate(tranche_names):
+        BSMtlySr[name] = loans[..., k][()]
+    BSMtlySr['Equity'] = inputs.equity
+    BSMtlySr['Retained Earning'] = inputs.retained_earning
+    BSMtlySr['Total Equity and Liability'] = inputs.accounts_payable + loans.sum(axis=-1) + inputs.equity + inputs.retained_earning
+    BSMtlySr['Difference'] = BSMtlySr['Total Equity and Liability'] - BSMtlySr['Total Assets']
+    BSMtlySr['Working Capital'] = inputs.accounts_receivable + inputs.inventory + inputs.other_current_assets + inputs.other_assets - inputs.accounts_payable
+    BSMtlySr['Change in working capital'] = np.nan
+    return BSMtlySr
+
+
+def bs_cfs_monthly(inputs, BSMtlySr, pnl, depreciation, tranche_names, debt, debt_total, interest_income=None):
+    """Monthly balance sheet and cash flow statement cubes, rolled forward together."""
+    bs, cfs = bs_cfs_arrays(pnl, depreciation['Capex Addition'], depreciation['Closing'], debt['Closing'],
+                            debt_total['Additional Loan'], debt_total['Total Repayment'],
+                            {'Cash': inputs.cash, 'Equity': BSMtlySr['Equity'], 'Retained Earning': inputs.retained_earning,
+                             'Working Capital': BSMtlySr['Working Capital']},
+                            inputs.AR_pct / 100, inputs.Inventory_pct / 100, inputs.oCA_pct / 100, inputs.AP_pct / 100,
+                            window=inputs.wc_window_months, direction=inputs.wc_window_direction,
+                            debt_lines=tranche_names, interest_income=0.0 if interest_income is None else interest_income,
+                            tax_lag=inputs.tax_payment_lag)
+    return StatementCube.from_lines(bs), StatementCube.from_lines(cfs)
+
+
+def kpi_monthly(pnl_mtly, bs_mtly, cfs_mtly, tranche_names):
+    return StatementCube.from_lines(kpi_arrays(pnl_mtly, bs_mtly, cfs_mtly, debt_lines=tranche_names))
+
+
+def pnl_yearly(pnl_mtly):
+    return StatementCube.from_lines(pnl_yearly_arrays(pnl_mtly), freq='Y')
+
+
+def bs_yearly(BSMtlySr, bs_mtly, tranche_names):
+    return StatementCube.from_lines(bs_yearly_arrays(bs_mtly, BSMtlySr['Working Capital'], tranche_names), freq='Y')
+
+
+def cfs_yearly(BSMtlySr, pnl_yly, bs_yly, projections, debt_total, interest_income=None):
+    return StatementCube.from_lines(cfs_yearly_arrays(pnl_yly, bs_yly, projections["Capital Expenditure Additions"],
+                                                      debt_total['Additional Loan'], debt_total['Total Repayment'],
+                                                      BSMtlySr['Cash'], interest_income), freq='Y')
+
+
+def kpi_yearly(pnl_yly, bs_yly, cfs_yly, tranche_names):
+    return StatementCube.from_lines(kpi_arrays(pnl_yly, bs_yly, cfs_yly, yearly=True, debt_lines=tranche_names), freq='Y')
+
+
+def tax_yearly(inputs, pnl_yly):
+    """Annual tax schedule behind the Income Tax Expense line."""
+    schedule = tax_schedule_arrays(pnl_yly['Net Income Before Tax'], as_float(inputs.tax_rates) / 100,
+                                   inputs.tax_loss_expiry, inputs.tax_losses_brought_forward)
+    return StatementCube.from_lines(schedule, freq='Y')
+
+
+def rate_curve(curve, nb_months):
+    """Monthly curve ``(..., months)`` cut to ``nb_months``, its last rate held flat when it is shorter."""
+    curve = as_float(curve)
+    months = np.minimum(np.arange(nb_months), curve.shape[-1] - 1)
+    return curve[..., months]
+
+
+def broadcast_inputs(inputs):
+    """Inputs with every per-scenario field broadcast to the common scenario shape.
+
+    Rate curves and custom schedules keep their month axis last, cut or
+    extended to the horizon.
+    """
+    shared = ('projections_year', 'wc_window_months', 'wc_window_direction', 'tranches', 'sweep_tranche',
+              'average_balance_interest', 'circularity_tol', 'max_circularity_iterations', 'tax_loss_expiry',
+              'tax_payment_lag')
+    values = {f.name: getattr(inputs, f.name) for f in fields(inputs) if f.name not in shared}
+    nb_months = inputs.projections_year * 12
+    curves = {name: rate_curve(values.pop(name), nb_months) for name in CURVE_FIELDS if values[name] is not None}
+    curves.update({name: schedule_curve(values.pop(name), nb_months) for name in SCHEDULE_FIELDS
+                   if values[name] is not None})
+    shape = np.broadcast_shapes(*[np.shape(x) for v in values.values() for x in (v.values() if isinstance(v, dict) else [v])],
+                                *[np.shape(curve)[:-1] for curve in curves.values()])
+    bc = lambda x: np.broadcast_to(x if isinstance(x, Dual) else np.asarray(x), shape)
+    curves = {name: np.broadcast_to(curve, shape + (nb_months,)) for name, curve in curves.items()}
+    if shape == ():
+        return replace(inputs, **curves)
+    return replace(inputs, **{name: {k: bc(x) for k, x in v.items()} if isinstance(v, dict) else bc(v)
+                              for name, v in values.items() if v is not None}, **curves)
+
+
+def run_model(inputs):
+    """Run the full refinancing model for one set of inputs and return every table.
+
+    The monthly tables cover the ``projections_year`` horizon, month by month.
+    With array inputs every cube carries the scenario axes in front of its
+    line and period axes.  Average-balance interest, interest on cash and the
+    tax of a swept or revolving debt are circular: the monthly model is then
+    iterated to their fixed point with ``solve_fixed_point``.
+    """
+    inputs = broadcast_inputs(inputs)
+    for name in ('cash_floor', 'sweep_pct', 'revolver_limit', 'revolver_rate'):
+        if np.any(getattr(inputs, name) < 0):
+            raise ValueError(f"{name} must not be negative")
+    tranche_names, terms = all_tranche_terms(inputs)
+    nb_months = inputs.projections_year * 12
+    projected = projections(inputs)
+    sculpted = np.any(terms.Profile == 'sculpted')
+    debt, terms = debt_schedule(terms, nb_months, cfads=monthly_ebitda(inputs, projected) if sculpted else None)
+    depreciation = depreciation_schedule(inputs, projected)
+    BSMtlySr = bs_opening(inputs, tranche_names, terms.loan)
+    managed = REVOLVER in tranche_names or np.any(inputs.sweep_pct != 0) or np.any(inputs.revolver_limit != 0)
+    scheduled = debt
+    interest_circular = inputs.average_balance_interest or np.any(inputs.cash_interest_rate != 0)
+    # Without circular interest the scheduled debt the cash management starts from is the same in every pass
+    start = None
+    if managed and not interest_circular:
+        start = scheduled_pass(inputs, tranche_names, scheduled, projected, depreciation, BSMtlySr)
+
+    def monthly(extra=None, interest_income=None, tax=None):
+        """Debt and monthly statements with ``extra`` debt interest and the ``interest_income`` on cash.
+
+        ``tax`` is the monthly tax the cash management expects the managed debt to bear.
+        """
+        debt = scheduled if extra is None else with_interest(scheduled, extra)
+        if managed:
+            debt = cash_management(inputs, tranche_names, terms, debt, projected, depreciation, BSMtlySr,
+                                   interest_income, tax, start)
+        debt_total = total_debt(debt)
+        pnl, pnl_mtly = pnl_statements(inputs, projected, depreciation, debt_total, interest_income)
+        bs_mtly, cfs_mtly = bs_cfs_monthly(inputs, BSMtlySr, pnl, depreciation, tranche_names, debt, debt_total,
+                                           interest_income)
+        return debt, debt_total, pnl, pnl_mtly, bs_mtly, cfs_mtly
+
+    circularity = {'iterations': 0, 'residual': np.zeros(np.shape(inputs.revenue))}
+    interest_income = None
+    # The tax moves with the interest the cash management changes, and the cash it manages with the tax
+    taxed = managed and np.any(inputs.tax_rates != 0)
+    if interest_circular or taxed:
+        # Unknowns: the extra debt interest of every tranche and month, the
+        # interest on cash, then the monthly tax when it is circular
+        shape = np.shape(terms.loan)
+        split = shape[-1] * nb_months
+        cash = slice(split, split + nb_months)
+        evaluated = {}
+
+        def update(x):
+            extra = x[..., :split].reshape(shape + (nb_months,))
+            tax = x[..., cash.stop:] if taxed else None
+            evaluated['x'], evaluated['tables'] = x, monthly(extra, x[..., cash], tax)
+            debt, pnl, cfs_mtly = evaluated['tables'][0], evaluated['tables'][2], evaluated['tables'][-1]
+            extra = average_interest(debt, terms, nb_months, tranche_names) if inputs.average_balance_interest else 0 * extra
+            values = [extra.reshape(shape[:-1] + (split,)), cash_interest(inputs, cfs_mtly)]
+            return np.concatenate(values + [pnl['Tax']] if taxed else values, axis=-1)
+
+        def precondition(residual):
+            """Newton step: interest on cash compounds in the cash balance, extra debt interest moves no balance."""
+            cash_step = balance_interest_step(residual[..., cash], as_float(inputs.cash_interest_rate) / 100 / 12,
+                                              inputs.average_balance_interest)
+            return np.concatenate([residual[..., :split], cash_step, residual[..., cash.stop:]], axis=-1)
+
+        x0 = np.zeros(shape[:-1] + (cash.stop,))
+        if taxed:
+            # Starting from the tax of the scheduled debt
+            pnl = start[0] if start is not None else pnl_statements(inputs, projected, depreciation,
+                                                                    total_debt(scheduled))[0]
+            x0 = np.concatenate([x0, pnl['Tax']], axis=-1)
+        x, iterations, residual = solve_fixed_point(update, x0,
+                                                    inputs.circularity_tol, inputs.max_circularity_iterations,
+                                                    precondition=precondition)
+        circularity = {'iterations': iterations, 'residual': residual}
+        interest_income = x[..., cash]
+        # The solver returns the iterate it evaluated last
+        debt, debt_total, pnl, pnl_mtly, bs_mtly, cfs_mtly = evaluated['tables']
+    else:
+        debt, debt_total, pnl, pnl_mtly, bs_mtly, cfs_mtly = monthly()
+    PnLStatMtlySr = pnl_opening(inputs)
+    kpi_mtly = kpi_monthly(pnl_mtly, bs_mtly, cfs_mtly, tranche_names)
+    pnl_yly = pnl_yearly(pnl_mtly)
+    bs_yly = bs_yearly(BSMtlySr, bs_mtly, tranche_names)
+    cfs_yly = cfs_yearly(BSMtlySr, pnl_yly, bs_yly, projected, debt_total, interest_income)
+    kpi_yly = kpi_yearly(pnl_yly, bs_yly, cfs_yly, tranche_names)
+    tax = tax_yearly(inputs, pnl_yly)
+    return ModelResult(
+        tranche_names=tranche_names,
+        terms=terms,
+        pnl_open=PnLStatMtlySr,
+        bs_open=BSMtlySr,
+        projections=projected,
+        debt=debt,
+        debt_total=debt_total,
+        depreciation=depreciation,
+        pnl=pnl,
+        pnl_mtly=pnl_mtly,
+        bs_mtly=bs_mtly,
+        cfs_mtly=cfs_mtly,
+        kpi_mtly=kpi_mtly,
+        pnl_yly=pnl_yly,
+        bs_yly=bs_yly,
+        cfs_yly=cfs_yly,
+        kpi_yly=kpi_yly,
+        tax=tax,
+        circularity=circularity,
+    )
@@ -0,0 +1,96 @@
+"""Stochastic short-rate paths for floating-rate tranches.
+
+Paths are simulated monthly with the exact discretisation of the
+Ornstein-Uhlenbeck short rate ``dr = a (m(t) - r) dt + sigma dW``.  Vasicek
+reverts to a constant long-term mean.  Hull-White fits the mean ``m(t)`` to an
+initial forward curve ``f(0, t)``: month by month, so that the expected rate
+is the forward rate plus the Hull-White convexity ``sigma^2 / 2 ((1 - e^{-a
+t}) / a)^2``, as for the continuous-time ``theta(t)``.  A step is ``r_i =
+r_{i-1} e^{-a dt} + d_i + sigma sqrt((1 - e^{-2 a dt}) / (2 a)) eps_i`` with
+``dt = 1/12`` and ``d_i`` the drift of the mean, so a whole ``(path, month)``
+matrix is a discounted cumulative sum of the shocks, taken a year at a time
+so the discount factors stay well scaled.  Rates are in % per annum like the
+``Bank_Base_Rate_*`` inputs and feed ``Bank_Base_Rate_Curve_*`` directly.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+MODELS = ("vasicek", "hull-white")
+
+
+@dataclass
+class ShortRateSpec:
+    """Short-rate model of the bank base rate, all rates in % per annum.
+
+    ``r0`` is the rate of month 0 (the base case ``Bank_Base_Rate_SenSec`` when
+    None), ``mean_reversion`` the speed ``a`` per year and ``volatility`` the
+    annual ``sigma`` in percentage points.  Vasicek reverts to the constant
+    ``long_term_mean`` (``r0`` when None).  Hull-White is fitted to the monthly
+    forward rates ``initial_curve`` of months 1.., held flat past its end
+    (see ``short_rate_paths`` when None).  Rates are
+    floored at ``floor`` (no floor when None), which lifts the mean above the
+    fitted one.
+    """
+    model: str = "vasicek"
+    r0: float | None = None
+    mean_reversion: float = 0.1
+    long_term_mean: float | None = None
+    initial_curve: np.ndarray | None = None
+    volatility: float = 1.0
+    floor: float | None = None
+
+
+def hull_white_mean(initial_curve, mean_reversion, volatility, nb_months):
+    """Expected rate in % of months 1..``nb_months`` of a Hull-White model fitted to ``initial_curve``.
+
+    The forward rate of each month plus the convexity ``sigma^2 / 2 B(t)^2``,
+    ``B(t) = (1 - e^{-a t}) / a`` (``t`` when ``a = 0``); rates in % make it
+    ``sigma^2 B(t)^2 / 200``.
+    """
+    curve = np.asarray(initial_curve, dtype=float)
+    months = np.arange(nb_months)
+    t = (months + 1) / 12
+    a = mean_reversion
+    b = (1 - np.exp(-a * t)) / a if a > 0 else t
+    return curve[np.minimum(months, len(curve) - 1)] + volatility ** 2 * b ** 2 / 200
+
+
+def short_rate_paths(spec, nb_paths, nb_months, rng, r0=None, initial_curve=None):
+    """Monthly short rates of ``nb_paths`` paths, shape ``(nb_paths, nb_months)``.
+
+    Month ``i`` is the rate ``i`` months after ``r0`` (``spec.r0`` taking
+    precedence), drawn from ``rng`` (a ``numpy.random.Generator``).  A
+    Hull-White model is fitted to ``spec.initial_curve``, else to
+    ``initial_curve``, else to a flat curve at ``r0``.
+    """
+    if spec.model not in MODELS:
+        raise ValueError(f"model must be one of {MODELS}, not {spec.model!r}")
+    r0 = spec.r0 if spec.r0 is not None else r0
+    if r0 is None:
+        raise ValueError("the short rate needs a starting rate r0")
+    dt = 1 / 12
+    a = spec.mean_reversion
+    decay = np.exp(-a * dt)
+    if spec.model == "hull-white":
+        curve = next((c for c in (spec.initial_curve, initial_curve) if c is not None), [r0])
+        # Drift of each month that takes the expected rate from one month's target to the next
+        target = hull_white_mean(curve, a, spec.volatility, nb_months)
+        mean_drift = target - decay * np.concatenate([[r0], target[:-1]])
+    else:
+        mean_drift = np.full(nb_months, (1 - decay) * (r0 if spec.long_term_mean is None else spec.long_term_mean))
+
+    step_sd = spec.volatility * (np.sqrt((1 - decay ** 2) / (2 * a)) if a > 0 else np.sqrt(dt))
+    # r_i = decay^j r_{i-j} + sum_{k<j} decay^k (d_{i-k} + step_sd eps_{i-k})
+    drift = mean_drift + step_sd * rng.standard_normal((nb_paths, nb_months))
+    weights = decay ** np.arange(1, 13)
+    rates = np.empty((nb_paths, nb_months))
+    previous = np.full(nb_paths, float(r0))
+    for start in range(0, nb_months, 12):
+        block = slice(start, min(start + 12, nb_months))
+        w = weights[:block.stop - start]
+        rates[:, block] = previous[:, None] * w + w * np.cumsum(drift[:, block] / w, axis=-1)
+        previous = rates[:, block.stop - 1]
+    if spec.floor is not None:
+        rates = np.maximum(rates, spec.floor)
+    return rates
@@ -0,0 +1,128 @@
+"""One-at-a-time (tornado) sensitivity of chosen outputs to every numeric input.
+
+Every input is moved down and up by a step while the others stay at their
+base value; the ``2 * inputs + 1`` cases are one scenario axis, so the whole
+report is a single batched run of the model.
+"""
+from dataclasses import fields, replace
+
+import numpy as np
+import pandas as pd
+
+from .model import run_model
+
+
+def min_dscr(result):
+    """Lowest annual DSCR over the years with debt service (NaN without any)."""
+    serviced = result.cfs_yly['Repayment of Long-term Debt'] != 0
+    lowest = np.where(serviced, result.kpi_yly['Debt Service Coverage Ratio'], np.inf).min(axis=-1)
+    return np.where(np.isinf(lowest), np.nan, lowest)
+
+
+# Outputs the report ranks inputs on, name -> function of a ModelResult giving one value per case
+DEFAULT_METRICS = {
+    'Minimum DSCR': min_dscr,
+    'Final year Cash': lambda result: result.bs_yly['Cash'][..., -1],
+    'Peak Debt to EBITDA': lambda result: np.fmax.reduce(result.kpi_yly['Debt to EBITDA'], axis=-1),
+}
+
+# Inputs that cannot go below 0 (periods, loans, cash management, tax, percentages of revenue/costs)
+NON_NEGATIVE = ('Additional_Loan_on_restructuring_', 'Maturity_Y_', 'Amortization_Y_', 'asset_depreciated_over_years',
+                'AR_pct', 'Inventory_pct', 'oCA_pct', 'AP_pct', 'Rev_Seas_Dict', 'sweep_pct', 'revolver_limit',
+                'revolver_rate', 'cash_floor', 'cash_interest_rate', 'tax_rates', 'tax_losses_brought_forward')
+# Moves of the inputs whose base value is 0, by name prefix in the input's own
+# unit: rates and shares in % by one percentage point (0.01 as a fraction),
+# periods by one year and DSCR targets by 0.1; amounts move by ``zero_step``
+ZERO_STEPS = {
+    **dict.fromkeys(('Bank_Base_Rate_', 'Liquidity_Premiums_', 'Credit_Risk_Premiums_', 'tax_rates', 'sweep_pct',
+                     'revolver_rate', 'cash_interest_rate', 'AR_pct', 'Inventory_pct', 'oCA_pct', 'AP_pct',
+                     'growth_rate_', 'Rev_Seas_Dict'), 1.0),
+    **dict.fromkeys(('Maturity_Y_', 'Amortization_Y_', 'asset_depreciated_over_years'), 1.0),
+    'Target_DSCR_': 0.1,
+}
+# Numeric fields that set up the solver rather than the case
+SOLVER_SETTINGS = ('circularity_tol', 'max_circularity_iterations')
+
+
+def numeric_inputs(inputs):
+    """Names and base values of every numeric input, dict entries as ``field[key]``.
+
+    The growth rates cover every projection year and the seasonality every
+    month, whether or not they are set.  The horizon, the working capital
+    window and the ``SOLVER_SETTINGS`` are structural and left out.
+    """
+    values = {}
+    for f in fields(inputs):
+        value = getattr(inputs, f.name)
+        if f.type is float and f.name not in SOLVER_SETTINGS:
+            values[f.name] = value
+        elif f.type is dict:
+            keys = range(1, 13) if f.name == 'Rev_Seas_Dict' else range(1, inputs.projections_year + 1)
+            for key in keys:
+                values[f"{f.name}[{key}]"] = value.get(key, 0.0)
+    return values
+
+
+def zero_delta(name, zero_step):
+    """Move of input ``name`` from a base value of 0: its ``ZERO_STEPS`` entry, else ``zero_step``."""
+    return next((delta for prefix, delta in ZERO_STEPS.items() if name.startswith(prefix)), zero_step)
+
+
+def low_value(name, base, delta):
+    """Value of input ``name`` moved down by ``delta`` (not below 0 for the ``NON_NEGATIVE`` ones)."""
+    return max(base - delta, 0.0) if name.startswith(NON_NEGATIVE) else base - delta
+
+
+def with_inputs(inputs, values):
+    """``inputs`` with the named inputs (``field`` or ``field[key]``, as in ``numeric_inputs``) set to ``values``."""
+    changed = {}
+    for name, value in values.items():
+        field_name, _, key = name.partition('[')
+        if key:
+            changed.setdefault(field_name, dict(getattr(inputs, field_name)))[int(key[:-1])] = value
+        else:
+            changed[field_name] = value
+    return replace(inputs, **changed)
+
+
+def perturbed_inputs(inputs, deltas):
+    """Inputs over ``2 * len(deltas) + 1`` cases: the base case, then each input down and up by its delta."""
+    nb_cases = 2 * len(deltas) + 1
+    base_values = numeric_inputs(inputs)
+    batched = {}
+    for i, (name, delta) in enumerate(deltas.items()):
+        base = base_values[name]
+        batched[name] = values = np.full(nb_cases, float(base))
+        values[2 * i + 1] = low_value(name, base, delta)
+        values[2 * i + 2] = base + delta
+    return with_inputs(inputs, batched)
+
+
+def tornado(inputs, metrics=None, step=0.1, zero_step=1.0):
+    """Tornado tables of the ``metrics`` outputs (``DEFAULT_METRICS`` by default).
+
+    Each numeric input moves by ``step`` times its absolute value, or when it
+    is 0 by its ``ZERO_STEPS`` move (``zero_step`` for amounts, in the input's
+    own unit).  Returns one
+    DataFrame per metric, inputs ranked by the swing of the output between
+    the down and up moves; the base output is in ``attrs['base']``.
+    """
+    metrics = DEFAULT_METRICS if metrics is None else metrics
+    base_values = numeric_inputs(inputs)
+    deltas = {name: step * abs(value) if value != 0 else zero_delta(name, zero_step)
+              for name, value in base_values.items()}
+    result = run_model(perturbed_inputs(inputs, deltas))
+    names = list(deltas)
+    tables = {}
+    for metric, output in metrics.items():
+        values = np.broadcast_to(output(result), (2 * len(names) + 1,))
+        down, up = values[1::2], values[2::2]
+        tbl = pd.DataFrame({'Base': [base_values[name] for name in names],
+                            'Low input': [low_value(name, base_values[name], deltas[name]) for name in names],
+                            'High input': [base_values[name] + deltas[name] for name in names],
+                            'Output at low': down, 'Output at high': up, 'Swing': np.abs(up - down)},
+                           index=pd.Index(names, name='Input'))
+        tbl = tbl.sort_values('Swing', ascending=False)
+        tbl.attrs['base'] = values[0]
+        tables[metric] = tbl
+    return tables
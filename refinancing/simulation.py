@@ -0,0 +1,169 @@
+"""Monte Carlo simulation of the annual credit ratios.
+
+Revenue and cost growth paths, seasonality weights and the bank base rate are
+perturbed around a base case, or the base rate follows a short-rate model
+month by month (floating-rate tranches), and the paths are pushed through ``run_model``
+as a scenario axis, ``chunk_size`` paths at a time so memory stays bounded.
+Only the annual ratios of ``KPIYlyTbl`` that covenants are written on are
+kept from each chunk.
+"""
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+import pandas as pd
+
+from .kpi import DEFAULT_COVENANTS, covenant_breaches
+from .model import run_model
+from .rates import ShortRateSpec, short_rate_paths
+from .statements import annual_sum
+
+
+@dataclass
+class SimulationSpec:
+    """Distributions of the simulated drivers.
+
+    Growth and base rate shocks are in percentage points, like the inputs:
+    every projection year gets its own growth shock, the base rate shock is
+    shared by both tranches.  Seasonality noise is relative: each monthly
+    weight is scaled by ``1 + shock`` (floored at 0) and the weights are
+    rescaled to their base total.  Shocks are ``distribution`` draws
+    ("normal", or "t" with ``t_df`` degrees of freedom for fat tails) times
+    the ``*_sd`` scale.
+
+    With ``short_rate`` set, both tranches of the input fields float: the
+    Senior Secured base rate follows a ``ShortRateSpec`` path (starting from
+    the base case rate unless ``r0`` is given, a Hull-White model fitted to
+    the base case ``Bank_Base_Rate_Curve_SenSec`` unless it has its own
+    curve), the Short Term one the same path plus its base case spread over
+    the Senior Secured rate, and ``base_rate_sd`` shifts whole paths.  The
+    base rates simulated are those of the input fields, so inputs with a
+    ``tranches`` table cannot simulate them.
+    """
+    n_paths: int = 10_000
+    chunk_size: int = 2_000
+    seed: int | None = None
+    distribution: str = "normal"
+    t_df: float = 5.0
+    revenue_growth_sd: float = 0.0
+    cost_growth_sd: float = 0.0
+    operating_cost_growth_sd: float = 0.0
+    seasonality_sd: float = 0.0
+    base_rate_sd: float = 0.0
+    short_rate: ShortRateSpec | None = None
+    percentiles: tuple = (5, 50, 95)
+    covenants: dict = field(default_factory=lambda: dict(DEFAULT_COVENANTS))
+
+
+@dataclass
+class SimulationResult:
+    # Ratio percentiles per year, columns (ratio, "P5"/"P50"/"P95")
+    bands: pd.DataFrame
+    # Share of paths breaching each covenant, per year and over the horizon
+    breach_probability: pd.DataFrame
+    breach_any_year: pd.Series
+    # Simulated ratios, ratio -> (path, year)
+    paths: dict
+    # Percentiles per year of the annual Total Interest and Total Repayment,
+    # columns (line, "P5"/"P50"/"P95"), when the base rate is simulated
+    debt_bands: pd.DataFrame | None = None
+
+
+def _shocks(rng, spec, size):
+    if spec.distribution == "normal":
+        return rng.standard_normal(size)
+    if spec.distribution == "t":
+        return rng.standard_t(spec.t_df, size)
+    raise ValueError(f"distribution must be 'normal' or 't', not {spec.distribution!r}")
+
+
+def simulated_inputs(inputs, spec, rng, nb_paths):
+    """``inputs`` with ``nb_paths`` simulated drivers along a leading scenario axis."""
+    nb_years = inputs.projections_year
+    shock = lambda sd, size: sd * _shocks(rng, spec, size)
+
+    def growth(rates, sd):
+        if sd == 0:
+            return rates
+        return {y: rates.get(y, 0.0) + shock(sd, nb_paths) for y in range(1, nb_years + 1)}
+
+    seasonality = inputs.Rev_Seas_Dict
+    if spec.seasonality_sd != 0:
+        base = np.array([inputs.Rev_Seas_Dict.get(m, 0.0) for m in range(1, 13)], dtype=float)
+        weights = base * np.maximum(1 + shock(spec.seasonality_sd, (nb_paths, 12)), 0.0)
+        total = weights.sum(axis=1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            weights = np.where(total > 0, weights * base.sum() / total, 0.0)
+        seasonality = {m: weights[:, m - 1] for m in range(1, 13)}
+    if inputs.tranches is not None and (spec.short_rate is not None or spec.base_rate_sd != 0):
+        raise ValueError("the base rates are simulated on the tranches of the input fields, "
+                         "not on a tranches table")
+    rate_shock = shock(spec.base_rate_sd, nb_paths) if spec.base_rate_sd != 0 else 0.0
+    if spec.short_rate is not None:
+        base = short_rate_paths(spec.short_rate, nb_paths, nb_years * 12, rng, r0=inputs.Bank_Base_Rate_SenSec,
+                                initial_curve=inputs.Bank_Base_Rate_Curve_SenSec)
+        curve = base + np.reshape(rate_shock, (-1, 1))
+        spread = inputs.Bank_Base_Rate_StTerm - inputs.Bank_Base_Rate_SenSec
+        rate_shock = 0.0
+    else:
+        curve = spread = None
+    return replace(inputs,
+                   growth_rate_rev_Dict=growth(inputs.growth_rate_rev_Dict, spec.revenue_growth_sd),
+                   growth_rate_cost_Dict=growth(inputs.growth_rate_cost_Dict, spec.cost_growth_sd),
+                   growth_rate_cost_ope_Dict=growth(inputs.growth_rate_cost_ope_Dict, spec.operating_cost_growth_sd),
+                   Rev_Seas_Dict=seasonality,
+                   Bank_Base_Rate_SenSec=inputs.Bank_Base_Rate_SenSec + rate_shock,
+                   Bank_Base_Rate_StTerm=inputs.Bank_Base_Rate_StTerm + rate_shock,
+                   Bank_Base_Rate_Curve_SenSec=curve,
+                   Bank_Base_Rate_Curve_StTerm=None if curve is None else curve + spread)
+
+
+def simulate(inputs, spec=None):
+    """Monte Carlo distribution of the covenant ratios of ``KPIYlyTbl`` around ``inputs``.
+
+    Breaches follow ``covenant_breaches`` (DSCR and ICR are only tested in
+    years with debt service and interest).
+
+    Chunk ``k`` draws from its own child of ``SeedSequence(spec.seed)``, so a
+    seeded run is reproducible for a given ``chunk_size``.
+    """
+    spec = spec or SimulationSpec()
+    ratios = list(spec.covenants)
+    nb_chunks = -(-spec.n_paths // spec.chunk_size)
+    seeds = np.random.SeedSequence(spec.seed).spawn(nb_chunks)
+    debt_lines = ['Total Interest', 'Total Repayment'] if spec.short_rate is not None else []
+    chunks = {ratio: [] for ratio in ratios + debt_lines}
+    breach_chunks = {ratio: [] for ratio in ratios}
+    for k, seed in enumerate(seeds):
+        nb_paths = min(spec.chunk_size, spec.n_paths - k * spec.chunk_size)
+        result = run_model(simulated_inputs(inputs, spec, np.random.default_rng(seed), nb_paths))
+        shape = (nb_paths, result.kpi_yly.nb_periods)
+        breached = covenant_breaches(result.kpi_yly, result.cfs_yly, spec.covenants)
+        for ratio in ratios:
+            chunks[ratio].append(np.broadcast_to(result.kpi_yly[ratio], shape))
+            breach_chunks[ratio].append(np.broadcast_to(breached[ratio], shape))
+        for line in debt_lines:
+            chunks[line].append(np.broadcast_to(annual_sum(result.debt_total[line]), shape))
+    paths = {ratio: np.concatenate(chunks[ratio]) for ratio in ratios}
+    debt_paths = {line: np.concatenate(chunks[line]) for line in debt_lines}
+    breached = {ratio: np.concatenate(breach_chunks[ratio]) for ratio in ratios}
+
+    years = pd.RangeIndex(1, inputs.projections_year + 1, name='Year')
+    labels = [f"P{p:g}" for p in spec.percentiles]
+
+    def percentile_bands(paths):
+        bands = {}
+        for name, values in paths.items():
+            # Observed values rather than interpolated ones, so that infinite ratios
+            # (zero EBITDA or PP&E) stay in the tails instead of turning into NaN
+            values = np.nanpercentile(values, spec.percentiles, axis=0, method='inverted_cdf')
+            for label, row in zip(labels, values):
+                bands[(name, label)] = row
+        return pd.DataFrame(bands, index=years)
+
+    return SimulationResult(
+        bands=percentile_bands(paths),
+        breach_probability=pd.DataFrame({ratio: breached[ratio].mean(axis=0) for ratio in ratios}, index=years),
+        breach_any_year=pd.Series({ratio: breached[ratio].any(axis=1).mean() for ratio in ratios}),
+        paths=paths,
+        debt_bands=percentile_bands(debt_paths) if debt_lines else None,
+    )
@@ -0,0 +1,86 @@
+"""Debt capacity goal seek against covenant floors.
+
+Each question is answered with a few batched runs of the model: the
+candidate loans (or tenors) of a round are one scenario axis, so a round
+costs about as much as a single run.
+"""
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from .kpi import DEFAULT_COVENANTS, covenants_met
+from .model import run_model
+
+
+@dataclass
+class SizingResult:
+    value: float
+    # False when even the most conservative candidate breaks a covenant (value is NaN)
+    feasible: bool
+    rounds: int
+    evaluations: int
+
+
+def meets_covenants(inputs, covenants, **candidates):
+    """Whether each candidate value (arrays over one scenario axis) meets ``covenants`` in every year."""
+    result = run_model(replace(inputs, **candidates))
+    return np.broadcast_to(covenants_met(result.kpi_yly, result.cfs_yly, covenants),
+                           np.broadcast_shapes(*[np.shape(v) for v in candidates.values()]))
+
+
+def max_additional_loan(inputs, tranche="SenSec", covenants=None, tol=1.0, start=None, points=16, max_rounds=60):
+    """Largest restructuring loan of ``tranche`` ("SenSec" or "StTerm") meeting the covenants in every year.
+
+    Covenants only get tighter as the loan grows, so the answer is bracketed
+    between a feasible and a breaching loan.  A warm ``start`` (e.g. the answer
+    for a neighbouring case) is probed first on a +/-10% grid; without one, or
+    when the answer lies outside it, the bracket is found on geometric grids.
+    Each following round splits the bracket into ``points + 1`` parts in one
+    batched run, until it is narrower than ``tol``.
+    """
+    covenants = DEFAULT_COVENANTS if covenants is None else covenants
+    name = f"Additional_Loan_on_restructuring_{tranche}"
+    check = lambda loans: meets_covenants(inputs, covenants, **{name: loans})
+    rounds, evaluations = 1, 1
+    if not check(np.zeros(1))[0]:
+        return SizingResult(np.nan, False, rounds, evaluations)
+
+    lo, hi = 0.0, np.inf
+    if start:
+        loans = start * (1 + 0.1 * np.linspace(-1, 1, points))
+    else:
+        scale = max(getattr(inputs, name), inputs.revenue, 1.0)
+        loans = scale * 2.0 ** np.arange(-(points // 2), points - points // 2)
+    while rounds < max_rounds:
+        ok = check(loans)
+        rounds, evaluations = rounds + 1, evaluations + len(loans)
+        k = np.argmin(ok) if not ok.all() else len(loans)
+        lo = max(lo, loans[k - 1]) if k > 0 else lo
+        hi = min(hi, loans[k]) if k < len(loans) else hi
+        if np.isinf(hi):
+            loans = lo * 2.0 ** np.arange(1, points + 1)
+        elif hi - lo <= tol:
+            break
+        elif lo == 0:
+            loans = hi * 2.0 ** np.arange(-points, 0)
+        else:
+            loans = np.linspace(lo, hi, points + 2)[1:-1]
+    return SizingResult(lo, True, rounds, evaluations)
+
+
+def min_tenor(inputs, field="Maturity_Y_SenSec", covenants=None, candidates=None):
+    """Shortest ``field`` (a Maturity_Y_* or Amortization_Y_* input) meeting the covenants in every year.
+
+    All ``candidates`` (in years; every month of the horizon by default) are
+    evaluated in one batched run, so the answer does not rely on the
+    covenants being monotone in the tenor.
+    """
+    covenants = DEFAULT_COVENANTS if covenants is None else covenants
+    if candidates is None:
+        start = 1 if field.startswith("Maturity") else 0
+        candidates = np.arange(start, inputs.projections_year * 12 + 1) / 12
+    candidates = np.sort(np.asarray(candidates, dtype=float))
+    ok = meets_covenants(inputs, covenants, **{field: candidates})
+    if not ok.any():
+        return SizingResult(np.nan, False, 1, len(candidates))
+    return SizingResult(candidates[np.argmax(ok)], True, 1, len(candidates))
@@ -0,0 +1,269 @@
+"""Monthly financial statements built with array operations.
+
+Annual projections are spread over the months by broadcasting them through the
+month -> projection year index and the 12-month seasonality vector; every
+statement line is then a whole-column expression.  Arrays may carry leading
+(scenario) axes; the month axis is always last.
+"""
+import numpy as np
+
+from .dual import as_float
+from .tax import monthly_tax, tax_schedule_arrays
+
+PNL_COLUMNS = ['Seasonality', 'Revenue', 'Restructured Cost', 'Gross Profit', 'Indirect Cost', 'EBITDA',
+               'Depreciation and Amortisation', 'EBIT', 'Interest', 'EBT', 'Tax', 'Net Profit']
+# Monthly Table A is the P&L under its statement names
+PNL_MONTHLY_ALIASES = {
+    'Revenue': 'Revenue',
+    'Cost of Goods Sold': 'Restructured Cost',
+    'Gross Profit': 'Gross Profit',
+    'Operating Expenses': 'Indirect Cost',
+    'EBITDA': 'EBITDA',
+    'Depreciation and Amortisation': 'Depreciation and Amortisation',
+    'Interest Expense': 'Interest',
+    'Net Income Before Tax': 'EBT',
+    'Income Tax Expense': 'Tax',
+    'Net Income': 'Net Profit',
+}
+BS_COLUMNS = ['Cash', 'Accounts Receivable', 'Inventory', 'Other Current Assets', 'Property, Plant & Equipment (Net)',
+              'Other Assets/DTA', 'Total Assets', 'Short Term Debt', 'Accounts payable/Provisions', 'Long Term Debt',
+              'Senior Secured', 'Debt 1 - Tranche 1', 'Equity', 'Retained Earning', 'Total Equity and Liability',
+              'Difference', 'Working Capital', 'Change in working capital']
+# Balance sheet lines of the two tranches of the input fields; a tranche table
+# puts one line per facility in their place
+DEBT_LINES = ['Senior Secured', 'Debt 1 - Tranche 1']
+CFS_COLUMNS = ['Net Income', 'Depreciation and Amortisation', 'Change in Working Capital', 'Interest Paid',
+               'Net Cash from Operating Activities', 'Capital Expenditures', 'Net Cash from Investing Activities',
+               'Proceeds from Long-term Debt', 'Repayment of Long-term Debt', 'Net Cash from Financing Activities',
+               'Net Cash flow', 'Opening', 'Closing']
+# Working capital lines: P&L lines they are a percentage of, and the assumption
+# giving that percentage (Other Assets/DTA follows the Other Current Assets one)
+WORKING_CAPITAL_DRIVERS = {
+    'Accounts Receivable': (['Revenue'], 'AR_pct'),
+    'Inventory': (['Restructured Cost'], 'Inventory_pct'),
+    'Other Current Assets': (['Revenue'], 'oCA_pct'),
+    'Other Assets/DTA': (['Revenue'], 'oCA_pct'),
+    'Accounts payable/Provisions': (['Restructured Cost', 'Indirect Cost'], 'AP_pct'),
+}
+
+
+def spread_annual(annual, seasonality, nb_months):
+    """Monthly values of annual amounts ``(..., years)`` weighted by ``seasonality`` ``(..., 12)``."""
+    months = np.arange(nb_months)
+    annual = as_float(annual)
+    seasonality = as_float(seasonality)
+    return annual[..., months // 12] * seasonality[..., months % 12]
+
+
+def operating_arrays(revenue_pa, cogs_pa, opex_pa, seasonality, nb_months):
+    """Monthly Seasonality, Revenue, Restructured Cost, Gross Profit, Indirect Cost and EBITDA.
+
+    The P&L lines above the debt, spread from the annual projections as in
+    ``pnl_arrays``.
+    """
+    seas = as_float(seasonality)[..., np.arange(nb_months) % 12]
+    pnl = {'Seasonality': seas}
+    pnl['Revenue'] = spread_annual(revenue_pa, seasonality, nb_months)
+    pnl['Restructured Cost'] = -spread_annual(cogs_pa, seasonality, nb_months)
+    pnl['Gross Profit'] = pnl['Revenue'] + pnl['Restructured Cost']
+    pnl['Indirect Cost'] = -spread_annual(opex_pa, seasonality, nb_months)
+    pnl['EBITDA'] = pnl['Gross Profit'] + pnl['Indirect Cost']
+    return pnl
+
+
+def pnl_arrays(revenue_pa, cogs_pa, opex_pa, seasonality, depreciation, interest, tax_rate=0.0, loss_expiry=None,
+               losses_brought_forward=0.0):
+    """Monthly P&L (the ``PNL_COLUMNS``) from the annual projections.
+
+    ``revenue_pa``, ``cogs_pa`` and ``opex_pa`` are the projected annual Revenue,
+    COGS and Operating Cost (costs as positive amounts), ``depreciation`` the
+    monthly depreciation charge and ``interest`` the monthly P&L interest line
+    (negative).  Tax is assessed on the EBT of every year at ``tax_rate`` with
+    loss carry-forward (``tax_schedule_arrays``) and charged evenly over its
+    months.
+    """
+    depreciation = as_float(depreciation)
+    nb_months = depreciation.shape[-1]
+    pnl = operating_arrays(revenue_pa, cogs_pa, opex_pa, seasonality, nb_months)
+    pnl['Depreciation and Amortisation'] = -depreciation
+    pnl['EBIT'] = pnl['EBITDA'] + pnl['Depreciation and Amortisation']
+    pnl['Interest'] = as_float(interest)
+    pnl['EBT'] = pnl['EBIT'] + pnl['Interest']
+    tax = tax_schedule_arrays(annual_sum(pnl['EBT']), tax_rate, loss_expiry, losses_brought_forward)['Tax']
+    pnl['Tax'] = monthly_tax(tax)
+    pnl['Net Profit'] = pnl['EBT'] + pnl['Tax']
+    return pnl
+
+
+def window_sum(values, window=12, direction='forward'):
+    """Sum of each month and its ``window - 1`` next (``'forward'``) or last (``'trailing'``) months.
+
+    Windows are truncated at the ends of the horizon and NaN counts as 0, like
+    ``Series.sum`` over a ``.loc`` slice.  Every window is the difference of two
+    prefix sums, so the cost does not depend on ``window``; windows holding only
+    zeros are exactly 0 rather than a cancellation residue.
+    """
+    values = as_float(values)
+    values = np.where(np.isnan(values), 0.0, values)
+    n = values.shape[-1]
+    zero = np.zeros(values.shape[:-1] + (1,))
+    prefix = np.concatenate([zero, np.cumsum(values, axis=-1)], axis=-1)
+    nonzero = np.concatenate([zero, np.cumsum(values != 0, axis=-1)], axis=-1)
+    months = np.arange(n)
+    if direction == 'forward':
+        start, stop = months, np.minimum(months + window, n)
+    elif direction == 'trailing':
+        start, stop = np.maximum(months + 1 - window, 0), months + 1
+    else:
+        raise ValueError(f"direction must be 'forward' or 'trailing', not {direction!r}")
+    total = prefix[..., stop] - prefix[..., start]
+    return np.where(nonzero[..., stop] == nonzero[..., start], 0.0, total)
+
+
+def driver_line(windowed, lines, pct):
+    """Balance sheet line defined as ``pct`` of the windowed P&L ``lines``.
+
+    ``windowed`` maps each P&L line to its ``window_sum`` over the next/last
+    months, so a line shared by several drivers is only windowed once.
+    """
+    total = sum(windowed[line] for line in lines)
+    return as_float(pct)[..., None] * total
+
+
+def bs_columns(debt_lines=DEBT_LINES):
+    """Balance sheet lines in statement order, with one line per tranche of ``debt_lines``."""
+    at = BS_COLUMNS.index(DEBT_LINES[0])
+    return BS_COLUMNS[:at] + list(debt_lines) + BS_COLUMNS[at + len(DEBT_LINES):]
+
+
+def bs_cfs_arrays(pnl, capex, ppe, debt_closing, proceeds, repayment, opening,
+                  AR_pct, Inventory_pct, oCA_pct, AP_pct, window=12, direction='forward', debt_lines=DEBT_LINES,
+                  interest_income=0.0, tax_lag=0):
+    """Monthly balance sheet and cash flow statement rolled forward as array operations.
+
+    ``pnl`` is the ``pnl_arrays`` dict; ``capex``, ``ppe`` (net PP&E closing),
+    ``debt_closing`` (tranche closings ``(..., tranche, month)``, one tranche
+    per line of ``debt_lines``), ``proceeds`` and ``repayment`` (total debt
+    flows) are monthly arrays; ``opening`` holds the
+    opening Cash, Equity, Retained Earning and Working Capital; the working
+    capital assumptions are fractions of the next/last ``window`` months of
+    the P&L lines in ``WORKING_CAPITAL_DRIVERS``.  Cash and Retained Earning are running
+    sums on top of their openings and the change in working capital is a first
+    difference against the opening Working Capital.  The P&L Interest is net
+    of the monthly ``interest_income`` earned on cash, which stays in cash
+    while the interest charged on the debt is added back (it is paid through
+    ``repayment``).  Tax is paid ``tax_lag`` months after it is charged; the
+    tax still unpaid is a provision in Accounts payable/Provisions, so its
+    payment goes through the change in working capital.  Returns ``(bs,
+    cfs)`` dicts in statement order.
+    """
+    col = lambda p: as_float(p)[..., None]
+    pct = {'AR_pct': AR_pct, 'Inventory_pct': -as_float(Inventory_pct), 'oCA_pct': oCA_pct,
+           'AP_pct': -as_float(AP_pct)}
+    net_profit = pnl['Net Profit']
+    shape = net_profit.shape
+
+    cfs = {'Net Income': net_profit,
+           'Depreciation and Amortisation': -pnl['Depreciation and Amortisation']}
+    windowed = {line: window_sum(pnl[line], window, direction)
+                for line in dict.fromkeys(line for lines, _ in WORKING_CAPITAL_DRIVERS.values() for line in lines)}
+    bs = {name: driver_line(windowed, lines, pct[assumption]) for name, (lines, assumption) in WORKING_CAPITAL_DRIVERS.items()}
+    if tax_lag > 0:
+        bs['Accounts payable/Provisions'] = bs['Accounts payable/Provisions'] - window_sum(pnl['Tax'], tax_lag, 'trailing')
+    bs['Property, Plant & Equipment (Net)'] = np.broadcast_to(as_float(ppe), shape)
+    bs['Short Term Debt'] = np.full(shape, np.nan)
+    bs['Long Term Debt'] = np.full(shape, np.nan)
+    debt_closing = np.broadcast_to(as_float(debt_closing), shape[:-1] + (len(debt_lines), shape[-1]))
+    for k, line in enumerate(debt_lines):
+        bs[line] = debt_closing[..., k, :]
+    bs['Equity'] = np.broadcast_to(col(opening['Equity']), shape)
+    bs['Retained Earning'] = np.cumsum(np.concatenate([col(opening['Retained Earning']), net_profit], axis=-1), axis=-1)[..., 1:]
+    bs['Total Equity and Liability'] = bs['Accounts payable/Provisions'] + debt_closing.sum(axis=-2) + bs['Equity'] + bs['Retained Earning']
+    bs['Working Capital'] = bs['Accounts Receivable'] + bs['Inventory'] + bs['Other Current Assets'] + bs['Other Assets/DTA'] - bs['Accounts payable/Provisions']
+    bs['Change in working capital'] = np.diff(bs['Working Capital'], axis=-1, prepend=col(opening['Working Capital']))
+
+    cfs['Change in Working Capital'] = -bs['Change in working capital']
+    cfs['Interest Paid'] = -(pnl['Interest'] - as_float(interest_income))
+    cfs['Net Cash from Operating Activities'] = cfs['Net Income'] + cfs['Depreciation and Amortisation'] + cfs['Change in Working Capital'] + cfs['Interest Paid']
+    cfs['Capital Expenditures'] = -as_float(capex)
+    cfs['Net Cash from Investing Activities'] = cfs['Capital Expenditures']
+    cfs['Proceeds from Long-term Debt'] = np.broadcast_to(as_float(proceeds), shape)
+    cfs['Repayment of Long-term Debt'] = np.broadcast_to(as_float(repayment), shape)
+    cfs['Net Cash from Financing Activities'] = cfs['Proceeds from Long-term Debt'] + cfs['Repayment of Long-term Debt']
+    cfs['Net Cash flow'] = cfs['Net Cash from Operating Activities'] + cfs['Net Cash from Investing Activities'] + cfs['Net Cash from Financing Activities']
+    cash = np.cumsum(np.concatenate([col(opening['Cash']), cfs['Net Cash flow']], axis=-1), axis=-1)
+    cfs['Opening'] = cash[..., :-1]
+    cfs['Closing'] = cash[..., 1:]
+
+    bs['Cash'] = cfs['Closing']
+    bs['Total Assets'] = bs['Cash'] + bs['Accounts Receivable'] + bs['Inventory'] + bs['Other Current Assets'] + bs['Property, Plant & Equipment (Net)'] + bs['Other Assets/DTA']
+    bs['Difference'] = bs['Total Equity and Liability'] - bs['Total Assets']
+    bs = {name: bs[name] for name in bs_columns(debt_lines)}
+    cfs = {name: cfs[name] for name in CFS_COLUMNS}
+    return bs, cfs
+
+
+def annual_sum(values):
+    """Yearly totals of a monthly flow: the month axis is reshaped to ``(years, 12)`` and summed (NaN as 0)."""
+    values = as_float(values)
+    return np.nansum(values.reshape(values.shape[:-1] + (-1, 12)), axis=-1)
+
+
+def annual_close(values):
+    """Yearly values of a monthly stock: the December month of every year."""
+    return as_float(values)[..., 11::12]
+
+
+def pnl_yearly_arrays(pnl):
+    """Annual P&L from the monthly lines under their statement names (``PNL_MONTHLY_ALIASES`` keys)."""
+    yly = {'Revenue': annual_sum(pnl['Revenue']), 'Cost of Goods Sold': annual_sum(pnl['Cost of Goods Sold'])}
+    yly['Gross Profit'] = yly['Revenue'] + yly['Cost of Goods Sold']
+    yly['Operating Expenses'] = annual_sum(pnl['Operating Expenses'])
+    yly['EBITDA'] = yly['Gross Profit'] + yly['Operating Expenses']
+    yly['Depreciation and Amortisation'] = annual_sum(pnl['Depreciation and Amortisation'])
+    yly['Interest Expense'] = annual_sum(pnl['Interest Expense'])
+    yly['Net Income Before Tax'] = yly['EBITDA'] + yly['Depreciation and Amortisation'] + yly['Interest Expense']
+    yly['Income Tax Expense'] = annual_sum(pnl['Income Tax Expense'])
+    yly['Net Income'] = yly['Net Income Before Tax'] + yly['Income Tax Expense']
+    return yly
+
+
+def bs_yearly_arrays(bs, opening_working_capital, debt_lines=DEBT_LINES):
+    """Annual balance sheet: December balances, totals and working capital recomputed on them."""
+    col = lambda p: as_float(p)[..., None]
+    yly = {name: annual_close(bs[name]) for name in bs_columns(debt_lines)}
+    yly['Total Assets'] = yly['Cash'] + yly['Accounts Receivable'] + yly['Inventory'] + yly['Other Current Assets'] + yly['Property, Plant & Equipment (Net)'] + yly['Other Assets/DTA']
+    yly['Short Term Debt'] = np.full_like(yly['Cash'], np.nan)
+    yly['Long Term Debt'] = np.full_like(yly['Cash'], np.nan)
+    debt = np.sum(np.stack([yly[line] for line in debt_lines]), axis=0)
+    yly['Total Equity and Liability'] = yly['Accounts payable/Provisions'] + debt + yly['Equity'] + yly['Retained Earning']
+    yly['Difference'] = yly['Total Equity and Liability'] - yly['Total Assets']
+    yly['Working Capital'] = yly['Accounts Receivable'] + yly['Inventory'] + yly['Other Current Assets'] + yly['Other Assets/DTA'] - yly['Accounts payable/Provisions']
+    yly['Change in working capital'] = np.diff(yly['Working Capital'], axis=-1, prepend=col(opening_working_capital))
+    return yly
+
+
+def cfs_yearly_arrays(pnl_yly, bs_yly, capex, proceeds, repayment, opening_cash, interest_income=None):
+    """Annual cash flow statement.
+
+    ``capex`` holds the annual capex projections, ``proceeds``,
+    ``repayment`` and ``interest_income`` the monthly total debt flows and
+    interest earned on cash (none when None).
+    """
+    income = 0.0 if interest_income is None else annual_sum(interest_income)
+    col = lambda p: as_float(p)[..., None]
+    yly = {'Net Income': pnl_yly['Net Income'],
+           'Depreciation and Amortisation': -pnl_yly['Depreciation and Amortisation'],
+           'Change in Working Capital': -bs_yly['Change in working capital'],
+           'Interest Paid': -(pnl_yly['Interest Expense'] - income)}
+    yly['Net Cash from Operating Activities'] = yly['Net Income'] + yly['Depreciation and Amortisation'] + yly['Change in Working Capital'] + yly['Interest Paid']
+    yly['Capital Expenditures'] = -as_float(capex)
+    yly['Net Cash from Investing Activities'] = yly['Capital Expenditures']
+    yly['Proceeds from Long-term Debt'] = annual_sum(proceeds)
+    yly['Repayment of Long-term Debt'] = annual_sum(repayment)
+    yly['Net Cash from Financing Activities'] = yly['Proceeds from Long-term Debt'] + yly['Repayment of Long-term Debt']
+    yly['Net Cash flow'] = yly['Net Cash from Operating Activities'] + yly['Net Cash from Investing Activities'] + yly['Net Cash from Financing Activities']
+    cash = np.cumsum(np.concatenate([col(opening_cash), yly['Net Cash flow']], axis=-1), axis=-1)
+    yly['Opening'] = cash[..., :-1]
+    yly['Closing'] = cash[..., 1:]
+    return yly
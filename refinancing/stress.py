@@ -0,0 +1,86 @@
+"""Reverse stress test: how far revenue can fall or costs rise before a limit breaks.
+
+Each projected line of ``projectionDF`` (Revenue, COGS, Operating Cost) is
+proportional to the last actual year amount it grows from, so scaling that
+input scales the whole projected line.  The breakeven multipliers of every
+case and every line are bisected together: a round runs ``points`` trial
+multipliers per line and case as one scenario axis.
+"""
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from .kpi import DEFAULT_FLOORS, limits_met
+from .model import broadcast_inputs, run_model
+
+# Projected line -> (input it grows from, whether a larger multiplier is the safe side)
+STRESS_DRIVERS = {
+    'Revenue': ('revenue', True),
+    'COGS': ('cost_of_goods_sold', False),
+    'Operating Cost': ('operating_expenses', False),
+}
+
+
+def breakeven_multipliers(inputs, covenants=None, min_cash=0.0, upper=10.0, tol=1e-4, points=8, max_rounds=40):
+    """Breakeven multipliers of the projected Revenue, COGS and Operating Cost, one row per case.
+
+    A multiplier is the factor on the whole projected line at which the
+    covenants (``DEFAULT_FLOORS`` by default) or the monthly Cash floor
+    ``min_cash`` first break, the other lines being at their base: the lowest
+    safe one for Revenue, the highest safe one for the costs, searched in
+    ``[0, 1]`` when the base case is safe and in ``[1, upper]`` otherwise, to
+    within ``tol``.  Revenue is 0 when even no revenue is safe and NaN when
+    ``upper`` times it is not; costs are inf when ``upper`` times them is safe
+    and NaN when even no cost is not.  Cases are the (flattened) leading
+    scenario axes of ``inputs``; ``Headroom`` is the smallest of the moves
+    ``1 - Revenue``, ``COGS - 1`` and ``Operating Cost - 1`` (negative when the
+    base case breaks), so ``.sort_values('Headroom')`` ranks a book from the
+    most fragile case.
+    """
+    covenants = DEFAULT_FLOORS if covenants is None else covenants
+    inputs = broadcast_inputs(inputs)
+    shape = np.shape(inputs.revenue)
+    names = list(STRESS_DRIVERS)
+    safe_high = np.array([STRESS_DRIVERS[name][1] for name in names]).reshape((-1, 1) + (1,) * len(shape))
+
+    def high_side(multipliers):
+        """Whether each multiplier ``(line, trial, ...)`` lies above the breakeven of its line."""
+        scaled = {}
+        for k, name in enumerate(names):
+            field = STRESS_DRIVERS[name][0]
+            factor = np.ones_like(multipliers)
+            factor[k] = multipliers[k]
+            scaled[field] = getattr(inputs, field) * factor
+        result = run_model(replace(inputs, **scaled))
+        ok = np.broadcast_to(limits_met(result.kpi_yly, result.cfs_yly, result.bs_mtly, covenants, min_cash),
+                             multipliers.shape)
+        return ok == safe_high
+
+    # The breakeven is bracketed by the base case and one end of [0, upper]
+    ends = np.broadcast_to(np.array([0.0, 1.0, upper]).reshape(1, 3, *(1,) * len(shape)), (len(names), 3) + shape)
+    at_zero, at_base, at_upper = np.moveaxis(high_side(ends), 1, 0)
+    lo, hi = np.where(at_base, 0.0, 1.0), np.where(at_base, 1.0, upper)
+    bracketed = np.where(at_base, ~at_zero, at_upper)
+    fractions = np.arange(1, points + 1).reshape((1, -1) + (1,) * len(shape)) / (points + 1)
+    rounds = 0
+    while rounds < max_rounds and np.any(bracketed & (hi - lo > tol)):
+        trials = lo[:, None] + (hi - lo)[:, None] * fractions
+        above = high_side(trials)
+        k = np.argmax(above, axis=1)
+        found = above.any(axis=1)
+        hi = np.where(found, np.take_along_axis(trials, k[:, None], axis=1)[:, 0], hi)
+        lo = np.where(found & (k > 0), np.take_along_axis(trials, np.maximum(k - 1, 0)[:, None], axis=1)[:, 0],
+                      np.where(found, lo, trials[:, -1]))
+        rounds += 1
+
+    safe_high = safe_high[:, 0]
+    breakeven = np.where(safe_high, hi, lo)
+    # Breakeven below 0 (Revenue can vanish, costs break even at 0) or above upper
+    breakeven = np.where(at_base & at_zero, np.where(safe_high, 0.0, np.nan), breakeven)
+    breakeven = np.where(~at_base & ~at_upper, np.where(safe_high, np.nan, np.inf), breakeven)
+    table = pd.DataFrame({name: breakeven[k].reshape(-1) for k, name in enumerate(names)})
+    moves = [1 - table[name] if STRESS_DRIVERS[name][1] else table[name] - 1 for name in names]
+    table['Headroom'] = pd.concat(moves, axis=1).min(axis=1)
+    table.attrs['rounds'] = rounds
+    return table
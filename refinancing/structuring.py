@@ -0,0 +1,133 @@
+"""Search for the cheapest refinancing structure over a grid of tranche terms.
+
+The grid crosses candidate values of tranche inputs (maturities, grace
+periods, premiums, Individual/Consolidated).  Candidates are run as a
+scenario axis, ``chunk_size`` at a time, and the whole grid is run by default.
+
+``prune=True`` is a heuristic for grids too large to run: the maturities are
+searched from the longest down, and once a structure breaches, every
+structure that differs from it only by shorter maturities is taken to breach
+too and is never run.  Neither the DSCR nor the cash is monotone in the
+maturity (a longer maturity brings more repayment years into the horizon and
+pays more interest), so a pruned search can miss feasible structures, or all
+of them.
+"""
+from dataclasses import dataclass, fields, replace
+
+import numpy as np
+import pandas as pd
+
+from .kpi import DEFAULT_FLOORS, limits_met
+from .model import FIELD_TRANCHES, run_model
+from .sensitivity import min_dscr
+
+# Inputs whose increase the pruned search takes to never turn a feasible structure into a breaching one
+MONOTONE_FIELDS = ('Maturity_Y_SenSec', 'Maturity_Y_StTerm')
+
+
+@dataclass
+class StructureSearch:
+    # One row per structure that was run: its grid values, Total Interest,
+    # Minimum DSCR, Minimum Cash and Feasible, cheapest first
+    candidates: pd.DataFrame
+    # Cheapest feasible structure (None when there is none)
+    best: pd.Series | None
+    # Feasible structures no other one beats on both Total Interest and Minimum DSCR
+    frontier: pd.DataFrame
+    evaluations: int
+    pruned: int
+    rounds: int
+
+
+def structure_metrics(result):
+    """Total Interest over the horizon, Minimum DSCR and Minimum monthly Cash of each case."""
+    return {'Total Interest': result.debt_total['Total Interest'].sum(axis=-1),
+            'Minimum DSCR': min_dscr(result),
+            'Minimum Cash': result.bs_mtly['Cash'].min(axis=-1)}
+
+
+def efficient_frontier(candidates):
+    """Rows of ``candidates`` not beaten on both Total Interest (lower) and Minimum DSCR (higher).
+
+    A structure without any debt service in the horizon (NaN DSCR) counts as
+    the safest.
+    """
+    dscr = candidates['Minimum DSCR'].fillna(np.inf).to_numpy()
+    order = np.lexsort((-dscr, candidates['Total Interest'].to_numpy()))
+    best_before = np.maximum.accumulate(np.concatenate([[-np.inf], dscr[order][:-1]]))
+    return candidates.iloc[order[dscr[order] > best_before]]
+
+
+def optimize_structure(inputs, grid, covenants=None, prune=False, chunk_size=2_000):
+    """Structure of least total interest keeping Cash >= 0 every month and meeting ``covenants`` every year.
+
+    ``grid`` maps ``ModelInputs`` fields to their candidate values, e.g.
+    ``{'Maturity_Y_SenSec': [3, 5, 7], 'Amortization_Y_SenSec': [0, 1],
+    'IndivDebt_StTerm': ['Individual', 'Consolidated']}``; the other inputs
+    keep their value.  ``covenants`` defaults to ``DEFAULT_FLOORS``.  Structures whose grace period is longer than
+    their maturity are skipped, and so are those where it equals the maturity
+    of a tranche that is not Senior (nothing would be left to repay it over).
+    ``prune=True`` runs the pruned search of the module docstring instead.
+    """
+    covenants = DEFAULT_FLOORS if covenants is None else covenants
+    scalar_fields = {f.name for f in fields(inputs) if f.type is not dict}
+    unknown = [name for name in grid if name not in scalar_fields]
+    if unknown:
+        raise ValueError(f"grid fields must be scalar ModelInputs fields, not {unknown}")
+    names = list(grid)
+    # Monotone candidates ascending, so that grid position follows the value
+    axes = [np.sort(grid[name]) if name in MONOTONE_FIELDS else np.asarray(grid[name]) for name in names]
+    shape = tuple(len(axis) for axis in axes)
+    position = np.indices(shape).reshape(len(shape), -1)
+    column = lambda name: axes[names.index(name)][position[names.index(name)]] if name in grid else getattr(inputs, name)
+
+    valid = np.ones(position.shape[1], dtype=bool)
+    for tranche, (_, _, senior) in FIELD_TRANCHES.items():
+        maturity, grace = f'Maturity_Y_{tranche}', f'Amortization_Y_{tranche}'
+        if maturity in grid or grace in grid:
+            grace, maturity = np.asarray(column(grace)), np.asarray(column(maturity))
+            valid &= (grace <= maturity) if senior else (grace < maturity)
+
+    monotone = [k for k, name in enumerate(names) if name in MONOTONE_FIELDS and prune]
+    level = position[monotone].sum(axis=0) if monotone else np.zeros(position.shape[1], dtype=int)
+    tested = np.zeros(position.shape[1], dtype=bool)
+    breached = np.zeros(position.shape[1], dtype=bool)
+    metrics = {label: np.full(position.shape[1], np.nan) for label in ('Total Interest', 'Minimum DSCR', 'Minimum Cash')}
+    rounds = 0
+    for layer in np.unique(level[valid])[::-1]:
+        if prune and monotone:
+            # Everything below (on every monotone axis) a breaching structure breaches too
+            below = breached.reshape(shape)
+            for k in monotone:
+                below = np.flip(np.logical_or.accumulate(np.flip(below, k), axis=k), k)
+            todo = np.flatnonzero(valid & (level == layer) & ~below.ravel())
+        else:
+            todo = np.flatnonzero(valid & (level == layer))
+        if len(todo) == 0:
+            continue
+        rounds += 1
+        for start in range(0, len(todo), chunk_size):
+            chunk = todo[start:start + chunk_size]
+            result = run_model(replace(inputs, **{name: column(name)[chunk] for name in names}))
+            values = {label: np.broadcast_to(v, chunk.shape) for label, v in structure_metrics(result).items()}
+            ok = limits_met(result.kpi_yly, result.cfs_yly, result.bs_mtly, covenants)
+            for label, v in values.items():
+                metrics[label][chunk] = v
+            tested[chunk] = True
+            breached[chunk] = ~np.broadcast_to(ok, chunk.shape)
+
+    rows = np.flatnonzero(tested)
+    candidates = pd.DataFrame({name: column(name)[rows] for name in names})
+    for label, v in metrics.items():
+        candidates[label] = v[rows]
+    candidates['Feasible'] = ~breached[rows]
+    candidates = candidates.sort_values('Total Interest', kind='stable').reset_index(drop=True)
+    feasible = candidates[candidates['Feasible']]
+    return StructureSearch(
+        candidates=candidates,
+        best=feasible.iloc[0] if len(feasible) else None,
+        frontier=efficient_frontier(feasible).reset_index(drop=True),
+        evaluations=len(rows),
+        pruned=int(valid.sum()) - len(rows),
+        rounds=rounds,
+    )
@@ -0,0 +1,89 @@
+"""Revolving facility and cash sweep.
+
+A revolver draws whenever Cash would close below a floor and is repaid first
+from cash above it; a share of the cash still above the floor then prepays
+one tranche.  A prepayment lowers the interest of every later month, so the
+months are solved in order: a Python loop over the month axis whose every
+step is a handful of array operations over all the cases of a batch, so the
+scan costs a fixed amount per month whatever the batch size.
+
+The swept tranche keeps its scheduled principal (capped at what it still
+owes): prepayments shorten it, and the interest they save stays in cash.  Its
+schedule is followed through ``D``, how far its balance runs below the
+original one, so that without prepayments it is the original schedule
+exactly.  Debt flows are the only cash flows the sweep changes (interest
+expense is added back in the cash flow statement).
+"""
+import numpy as np
+
+from .dual import as_float
+
+
+def cash_sweep_arrays(net_cash_flow, opening_cash, schedule, rates, grace, accruing, cash_floor, sweep_share,
+                      revolver_rates=0.0, revolver_limit=0.0):
+    """Swept tranche schedule, revolver schedule and monthly closing Cash.
+
+    ``net_cash_flow`` ``(..., months)`` is the monthly net cash flow with the
+    original debt schedules, ``schedule`` the ``DEBT_COLUMNS`` dict of the swept
+    tranche, accruing interest at ``rates`` ``(..., months)``: capitalised in
+    the ``grace`` months, paid in the ``accruing`` ones.  ``sweep_share`` is the
+    fraction of the cash above ``cash_floor`` that prepays it, after the
+    revolver (up to ``revolver_limit``, interest paid monthly at
+    ``revolver_rates``) is repaid.  Returns ``(swept, revolver, cash)``, the two
+    schedules as ``DEBT_COLUMNS`` dicts.  A balance closing below 1 is repaid
+    in full, as in ``debt_schedule_arrays``.
+    """
+    net_cash_flow = as_float(net_cash_flow)
+    n = net_cash_flow.shape[-1]
+    shape = net_cash_flow.shape[:-1]
+    full = lambda x: np.broadcast_to(as_float(x), shape + (n,))
+    scalar = lambda x: np.broadcast_to(as_float(x), shape)
+    cash_floor, sweep_share, revolver_limit = scalar(cash_floor), scalar(sweep_share), scalar(revolver_limit)
+    scheduled_opening, additional, scheduled_amortisation, scheduled_interest, scheduled_closing = (
+        full(schedule[line]) for line in ('Opening', 'Additional Loan', 'Amortisation', 'Interest', 'Closing'))
+    # Scheduled principal: the debt service net of the interest paid
+    principal = -(full(schedule['Repayment']) + scheduled_interest)
+    rates, revolver_rates, net_cash_flow = full(rates), full(revolver_rates), full(net_cash_flow)
+    grace, accruing = np.broadcast_to(grace, shape + (n,)), np.broadcast_to(accruing, shape + (n,))
+
+    cash = scalar(opening_cash)
+    closing_cash = []
+    D = np.zeros(shape)
+    V = np.zeros(shape)
+    swept = {line: [] for line in ('Opening', 'Amortisation', 'Interest', 'Repayment', 'Closing')}
+    revolver = {line: [] for line in ('Opening', 'Additional Loan', 'Interest', 'Repayment', 'Closing')}
+    for t in range(n):
+        saved = rates[..., t] * D
+        opening = scheduled_opening[..., t] - D
+        amortisation = scheduled_amortisation[..., t] - np.where(grace[..., t], saved, 0.0)
+        interest = scheduled_interest[..., t] - np.where(accruing[..., t], saved, 0.0)
+        scheduled = principal[..., t]
+        owed = opening + additional[..., t] + amortisation
+        paid = np.where(D > 0, np.minimum(scheduled, np.maximum(owed, 0.0)), scheduled)
+        revolver_interest = V * revolver_rates[..., t]
+        before = cash + net_cash_flow[..., t] + (scheduled_interest[..., t] - interest) + (scheduled - paid) - revolver_interest
+        draw = np.minimum(np.maximum(cash_floor - before, 0.0), np.maximum(revolver_limit - V, 0.0))
+        repaid = np.minimum(V, np.maximum(before - cash_floor, 0.0))
+        cash = before + draw - repaid
+        prepaid = np.minimum(sweep_share * np.maximum(cash - cash_floor, 0.0), np.maximum(owed - paid, 0.0))
+        D = D + np.where(grace[..., t], saved, 0.0) + (paid - scheduled) + prepaid
+        drawn = V + draw - repaid
+        # Balances left below 1 are repaid, snapping the closings to 0
+        closing = scheduled_closing[..., t] - D
+        residue = np.where(np.abs(closing) < 1, closing, 0.0)
+        drawn_residue = np.where(np.abs(drawn) < 1, drawn, 0.0)
+        prepaid, D, closing = prepaid + residue, D + residue, closing - residue
+        repaid, drawn = repaid + drawn_residue, drawn - drawn_residue
+        cash = cash - prepaid - drawn_residue
+        closing_cash.append(cash)
+        for line, value in zip(swept, (opening, amortisation, interest, -(interest + paid + prepaid), closing)):
+            swept[line].append(value)
+        for line, value in zip(revolver, (V, draw, revolver_interest, -(revolver_interest + repaid), drawn)):
+            revolver[line].append(value)
+        V = drawn
+
+    swept = {line: np.stack(values, axis=-1) for line, values in swept.items()}
+    swept['Additional Loan'] = additional
+    revolver = {line: np.stack(values, axis=-1) for line, values in revolver.items()}
+    revolver['Amortisation'] = np.zeros(shape + (n,))
+    return swept, revolver, np.stack(closing_cash, axis=-1)
@@ -0,0 +1,123 @@
+"""Income tax on EBT with loss carry-forward, over whole batches of cases.
+
+Tax is assessed on the EBT of every projection year.  Losses are carried
+forward and set against the profits of later years, oldest first.  Without
+expiry the taxable income of years 1..y together is the largest cumulative EBT
+(net of the losses brought forward) reached by year y, floored at 0, so the
+taxable income of each year is the first difference of a running maximum: one
+array expression along the year axis for every case of a batch.  Losses that
+expire are used oldest first: the losses used or expired by the end of a year
+are those of the year before, at least every loss that has expired, plus the
+profit of the year, at most every loss that has arisen.  That clamp recurrence
+is a prefix scan (``clamp_scan``) over the cumulative losses.  The tax of a
+year is charged evenly over its months (``monthly_tax``) and may be paid some
+months later (``tax_paid``).
+"""
+import numpy as np
+
+from .dual import Dual, as_float
+
+TAX_COLUMNS = ['EBT', 'Losses Used', 'Taxable Income', 'Tax', 'Losses Carried Forward']
+
+
+def running_max(values):
+    """Running maximum along the last axis, picked from ``values`` (so a ``Dual`` keeps its tangents)."""
+    values = as_float(values)
+    value = values.value if isinstance(values, Dual) else values
+    # A period holds a new maximum when it is at least the running maximum
+    record = value >= np.maximum.accumulate(value, axis=-1)
+    index = np.maximum.accumulate(np.where(record, np.arange(value.shape[-1]), 0), axis=-1)
+    return np.take_along_axis(values, index, axis=-1)
+
+
+def clamp_scan(shift, lower, upper):
+    """``x_y = min(max(x_{y-1} + shift_y, lower_y), upper_y)`` along the last axis, from ``x_{-1} = 0``.
+
+    Each step is a clamp of a shift, and a clamp of a shift after another is
+    one too, so the steps are composed in pairs, then fours..., in
+    ``log2(years)`` array passes (a prefix scan).  ``lower`` above ``upper``
+    clamps to ``upper``.
+    """
+    shift, upper = as_float(shift), as_float(upper)
+    lower = np.minimum(lower, upper)
+    n = shift.shape[-1]
+    step = 1
+    while step < n:
+        # Compose each step after the one ``step`` years before it
+        clamp = lambda x: np.minimum(np.maximum(x + shift[..., step:], lower[..., step:]), upper[..., step:])
+        keep = lambda x, composed: np.concatenate([x[..., :step], composed], axis=-1)
+        shift, lower, upper = (keep(shift, shift[..., :-step] + shift[..., step:]),
+                               keep(lower, clamp(lower[..., :-step])), keep(upper, clamp(upper[..., :-step])))
+        step *= 2
+    return np.minimum(np.maximum(shift, lower), upper)
+
+
+def _carried_forward(ebt, brought_forward):
+    """Losses used and losses carried forward of each year when losses never expire."""
+    zero = np.zeros(ebt.shape[:-1] + (1,))
+    cumulative = np.concatenate([zero, np.cumsum(ebt, axis=-1) - brought_forward[..., None]], axis=-1)
+    taxed = running_max(cumulative)
+    # 0 exactly in the years that set a new maximum, as ``taxed`` is picked from ``cumulative``
+    carried = np.maximum(taxed[..., 1:] - cumulative[..., 1:], 0.0)
+    available = np.concatenate([brought_forward[..., None] + 0 * zero, carried[..., :-1]], axis=-1)
+    return np.minimum(np.maximum(ebt, 0.0), available), carried
+
+
+def _carried_forward_expiring(ebt, brought_forward, expiry):
+    """Losses used and losses carried forward of each year when losses expire after ``expiry`` years."""
+    n = ebt.shape[-1]
+    profit = np.maximum(ebt, 0.0)
+    # Cumulative losses by year of origin, those brought forward first
+    losses = np.cumsum(np.concatenate([brought_forward[..., None] + 0 * ebt[..., :1], np.maximum(-ebt, 0.0)],
+                                      axis=-1), axis=-1)
+    # Losses arisen by the start of each year, and those expired by then
+    arisen = losses[..., :n]
+    expired = np.concatenate([np.zeros(ebt.shape[:-1] + (min(expiry, n + 1),)), losses[..., :max(n + 1 - expiry, 0)]],
+                             axis=-1)
+    # Losses used or expired by the end of each year, oldest first: the losses
+    # used in a year are its profit, up to what has arisen and not expired
+    spent = clamp_scan(profit, expired[..., :n] + profit, arisen)
+    before = np.concatenate([np.zeros(ebt.shape[:-1] + (1,)), spent[..., :-1]], axis=-1)
+    used = np.minimum(profit, np.maximum(arisen - np.maximum(before, expired[..., :n]), 0.0))
+    carried = np.maximum(losses[..., 1:] - np.maximum(spent, expired[..., 1:]), 0.0)
+    return used, carried
+
+
+def tax_schedule_arrays(ebt, tax_rate, loss_expiry=None, losses_brought_forward=0.0):
+    """Annual tax schedule (the ``TAX_COLUMNS``) of the yearly ``ebt`` ``(..., years)``.
+
+    ``tax_rate`` is a fraction, ``losses_brought_forward`` the tax losses
+    available at the opening (a positive amount).  A loss can be used in the
+    ``loss_expiry`` years after the year it arises in (those brought forward in
+    the first ``loss_expiry`` years), forever when None.  Tax is negative like
+    the other P&L charges and never a credit.
+    """
+    ebt = as_float(ebt)
+    brought_forward = as_float(losses_brought_forward)
+    if loss_expiry is None:
+        used, carried = _carried_forward(ebt, brought_forward)
+    elif loss_expiry < 1:
+        raise ValueError(f"loss_expiry must be at least 1 year, not {loss_expiry!r}")
+    else:
+        used, carried = _carried_forward_expiring(ebt, brought_forward, int(loss_expiry))
+    taxable = np.maximum(ebt, 0.0) - used
+    rate = as_float(tax_rate)[..., None]
+    # No tax at a zero rate, even on a non-finite EBT
+    tax = np.where(rate == 0, 0.0, -rate * taxable)
+    return {'EBT': ebt, 'Losses Used': used, 'Taxable Income': taxable,
+            'Tax': tax, 'Losses Carried Forward': carried}
+
+
+def monthly_tax(tax):
+    """Monthly charge of the annual ``tax`` ``(..., years)``: a twelfth of it every month of its year."""
+    return np.repeat(as_float(tax), 12, axis=-1) / 12
+
+
+def tax_paid(tax, lag=0):
+    """Cash paid for the monthly ``tax`` charge ``(..., months)``, ``lag`` months after it is charged."""
+    tax = as_float(tax)
+    if lag <= 0:
+        return tax
+    n = tax.shape[-1]
+    zeros = np.zeros(tax.shape[:-1] + (min(lag, n),))
+    return np.concatenate([zeros, tax[..., :max(n - lag, 0)]], axis=-1)
@@ -0,0 +1,119 @@
+"""NPV, IRR and effective cost of the refinancing, over whole batches of cases.
+
+Cash flows are arrays ``(..., periods)`` with the first flow at time 0, as in
+``numpy_financial``; every case along the leading axes is solved at once.  The
+IRR is a safeguarded Newton iteration: the root is first bracketed on a grid of
+rates, then each Newton step on the NPV is replaced by a bisection step
+whenever it leaves the bracket.
+"""
+import numpy as np
+
+from .model import ModelResult
+
+# Per-period rates the IRR root is bracketed on
+IRR_GRID = np.array([-0.9, -0.5, -0.2, -0.1, -0.05, -0.02, -0.01, -0.005, 0.0,
+                     0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0])
+
+
+def npv(rate, cashflows):
+    """Net present value of ``cashflows`` ``(..., periods)`` at the per-period ``rate`` ``(...)``."""
+    cashflows = np.asarray(cashflows, dtype=float)
+    t = np.arange(cashflows.shape[-1])
+    return (cashflows * (1 + np.asarray(rate, dtype=float)[..., None]) ** -t).sum(axis=-1)
+
+
+def irr(cashflows, tol=1e-12, max_iter=100):
+    """Per-period internal rate of return of each row of ``cashflows`` ``(..., periods)``.
+
+    Of several roots, the one in the ``IRR_GRID`` interval closest to 0 is
+    returned (``numpy_financial.irr`` also prefers the root closest to 0).  NaN
+    where the NPV does not change sign on the grid, e.g. flows of one sign.
+    """
+    cashflows = np.asarray(cashflows, dtype=float)
+    t = np.arange(cashflows.shape[-1])
+    shape = cashflows.shape[:-1]
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        on_grid = np.stack([npv(np.full(shape, rate), cashflows) for rate in IRR_GRID])
+        sign = np.sign(on_grid)
+        change = (sign[:-1] * sign[1:] < 0) | (sign[:-1] == 0)
+        distance = np.minimum(np.abs(IRR_GRID[:-1]), np.abs(IRR_GRID[1:]))
+        k = np.argmin(np.where(change, distance[(slice(None),) + (None,) * len(shape)], np.inf), axis=0)
+        bracketed = np.take_along_axis(change, k[None], axis=0)[0] & (cashflows != 0).any(axis=-1)
+        lo, hi = IRR_GRID[k], IRR_GRID[k + 1]
+        f_lo = np.take_along_axis(on_grid, k[None], axis=0)[0]
+
+        r = np.where(f_lo == 0, lo, (lo + hi) / 2)
+        done = ~bracketed
+        for _ in range(max_iter):
+            discount = (1 + r[..., None]) ** -t
+            f = (cashflows * discount).sum(axis=-1)
+            df = -(t * cashflows * discount).sum(axis=-1) / (1 + r)
+            # Keep the bracket around the root
+            below = np.sign(f) == np.sign(f_lo)
+            lo, f_lo = np.where(below, r, lo), np.where(below, f, f_lo)
+            hi = np.where(below, hi, r)
+            step = r - f / df
+            step = np.where(np.isfinite(step) & (step > lo) & (step < hi), step, (lo + hi) / 2)
+            converged = (np.abs(step - r) <= tol * (1 + np.abs(r))) | (f == 0)
+            r = np.where(done, r, step)
+            done |= converged
+            if done.all():
+                break
+    return np.where(bracketed, r, np.nan)
+
+
+def annualised(rate):
+    """Monthly rate compounded over a year."""
+    return (1 + rate) ** 12 - 1
+
+
+def tranche_cash_flows(debt):
+    """Borrower cash flows of a debt cube (``ModelResult.debt``, or one tranche of it).
+
+    Loans are drawn at the start of their month (the opening loan and the month
+    1 top-up at time 0) and repaid (negative) at its end; the balance still
+    outstanding at the end of the horizon is repaid with the last month.
+    Shape ``(..., months + 1)``.
+    """
+    flows = np.concatenate([debt['Additional Loan'], -debt['Closing'][..., -1:]], axis=-1)
+    flows[..., 0] += debt['Opening'][..., 0]
+    flows[..., 1:] += debt['Repayment']
+    return flows
+
+
+def effective_cost(debt):
+    """All-in annual cost of a tranche in %: the annualised IRR of its borrower cash flows."""
+    return 100 * annualised(irr(tranche_cash_flows(debt)))
+
+
+def free_cash_flows(result: ModelResult, free_cash_flow, outlay):
+    """``outlay`` paid at time 0 then the monthly ``free_cash_flow`` line of ``KPIMtlyTbl``."""
+    fcf = result.kpi_mtly[free_cash_flow]
+    outlay = np.broadcast_to(-np.asarray(outlay, dtype=float), fcf.shape[:-1])
+    return np.concatenate([outlay[..., None], fcf], axis=-1)
+
+
+def valuation(result: ModelResult, discount_rate, equity_value=None, firm_value=None):
+    """NPV and IRR of the FCFF and FCFE, and the effective cost of each tranche, one value per case.
+
+    ``discount_rate`` is an annual rate in % (per case or shared).  The FCFF
+    and FCFE streams start with an outlay at time 0: the firm and equity
+    values, by default the opening book values (Equity + Retained Earning,
+    plus every tranche for the firm).  Rates and IRRs are in % per annum; the
+    effective costs are keyed ``Effective cost <tranche name>``.
+    """
+    bs = result.bs_open
+    equity_value = bs['Equity'] + bs['Retained Earning'] if equity_value is None else equity_value
+    firm_value = equity_value + result.terms.loan.sum(axis=-1) if firm_value is None else firm_value
+    monthly_rate = (1 + np.asarray(discount_rate, dtype=float) / 100) ** (1 / 12) - 1
+    fcff = free_cash_flows(result, 'FCFF', firm_value)
+    fcfe = free_cash_flows(result, 'FCFE', equity_value)
+    costs = effective_cost(result.debt)
+    return {
+        'NPV FCFF': npv(monthly_rate, fcff),
+        'NPV FCFE': npv(monthly_rate, fcfe),
+        'IRR FCFF': 100 * annualised(irr(fcff)),
+        'IRR FCFE': 100 * annualised(irr(fcfe)),
+        **{f"Effective cost {name}": costs[..., k] for k, name in enumerate(result.tranche_names)},
+    }
@@ -0,0 +1,34 @@
+"""Inputs shared by the tests."""
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from refinancing import ModelInputs
+
+DATA = Path(__file__).parent / 'data'
+
+
+def load_baseline():
+    """Cases and tables of the baseline app, by case name (see ``tests/data``)."""
+    with gzip.open(DATA / 'baseline_tables.json.gz', 'rt') as f:
+        return json.load(f)
+
+
+def model_inputs(values):
+    """``ModelInputs`` from their JSON values (dict keys back to ints)."""
+    return ModelInputs(**{name: {int(key): v for key, v in value.items()} if isinstance(value, dict) else value
+                          for name, value in values.items()})
+
+
+@pytest.fixture(scope='session')
+def baseline():
+    return load_baseline()
+
+
+@pytest.fixture
+def base_inputs(baseline):
+    """The default case of the baseline, with an opening balance sheet that balances."""
+    values = dict(baseline['default']['inputs'], retained_earning=1900.0)
+    return model_inputs(values)
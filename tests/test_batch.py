@@ -0,0 +1,41 @@
+"""Batched runs over a leading scenario axis against case-by-case runs."""
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from refinancing import run_model
+
+TABLES = ['debtCalc_SenSec', 'debtCalc_StTerm', 'totDebtCalc', 'projectionDF', 'depSchedCalcTbl', 'PnLStatMtlyTbl',
+          'BSMtlyTbl', 'CFSMtlyTbl', 'KPIMtlyTbl', 'PnLStatYlyTbl', 'BSYlyTbl', 'CFSYlyTbl', 'KPIYlyTbl']
+CHANGES = {
+    'revenue': np.array([30000.0, 35000.0, 42000.0]),
+    'Bank_Base_Rate_SenSec': np.array([2.0, 4.0, 9.0]),
+    'Amortization_Y_StTerm': np.array([0.0, 1.0, 3.0]),
+    'IndivDebt_StTerm': np.array(['Individual', 'Consolidated', 'Individual']),
+}
+# Year 2 revenue growth of each case
+GROWTH = np.array([-5.0, 0.0, 15.0])
+
+
+def case_inputs(inputs, k):
+    return replace(inputs, **{name: values[k] for name, values in CHANGES.items()},
+                   growth_rate_rev_Dict={**inputs.growth_rate_rev_Dict, 2: GROWTH[k]})
+
+
+def test_batch_matches_single_runs(base_inputs):
+    batch = run_model(replace(base_inputs, **CHANGES, growth_rate_rev_Dict={**base_inputs.growth_rate_rev_Dict, 2: GROWTH}))
+    for k in range(3):
+        single = run_model(case_inputs(base_inputs, k))
+        scenario = batch.scenario(k)
+        for name in TABLES:
+            pd.testing.assert_frame_equal(getattr(scenario, name), getattr(single, name), rtol=1e-12, atol=1e-9,
+                                          obj=name)
+
+
+def test_scenario_axes_lead_every_cube(base_inputs):
+    rates = np.linspace(1.0, 8.0, 6).reshape(2, 3)
+    batch = run_model(replace(base_inputs, Bank_Base_Rate_SenSec=rates))
+    assert batch.kpi_yly.values.shape[:2] == (2, 3)
+    single = run_model(replace(base_inputs, Bank_Base_Rate_SenSec=rates[1, 2]))
+    pd.testing.assert_frame_equal(batch.scenario((1, 2)).KPIYlyTbl, single.KPIYlyTbl, rtol=1e-12, atol=1e-9)
@@ -0,0 +1,44 @@
+"""Circular interest and tax solved to ``circularity_tol``."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from refinancing import run_model
+
+CIRCULAR = {
+    'average balance': dict(average_balance_interest=True),
+    'interest on cash': dict(cash_interest_rate=3.0),
+    'managed': dict(average_balance_interest=True, cash_interest_rate=3.0, cash_floor=1000.0, revolver_limit=1e9,
+                    revolver_rate=6.0, sweep_pct=50.0),
+    'managed and taxed': dict(average_balance_interest=True, cash_interest_rate=3.0, cash_floor=1000.0,
+                              revolver_limit=1e9, revolver_rate=6.0, sweep_pct=50.0, tax_rates=25.0),
+}
+
+
+@pytest.mark.parametrize('tol', [1e-6, 1e-9])
+@pytest.mark.parametrize('case', CIRCULAR)
+def test_converges_to_tolerance(base_inputs, case, tol):
+    inputs = replace(base_inputs, circularity_tol=tol, **CIRCULAR[case])
+    circularity = run_model(inputs).circularity
+    assert 1 < circularity['iterations'] < inputs.max_circularity_iterations
+    assert np.all(circularity['residual'] <= tol)
+
+
+def test_solution_follows_conventions(base_inputs):
+    result = run_model(replace(base_inputs, average_balance_interest=True, cash_interest_rate=3.0))
+    # Interest on the average balance of the months the loan pays interest
+    debt, terms = result.debt_of(0), result.terms_of(0)
+    months = np.arange(1, debt['Closing'].shape[-1] + 1)
+    paid = (months > terms.Amortization_M) & (months <= terms.Maturity_M)
+    average = (debt['Opening'] + debt['Additional Loan'] + debt['Closing']) / 2
+    np.testing.assert_allclose(debt['Interest'][paid], terms.Interest_Rate_per_month * average[paid], atol=1e-5)
+    # Interest income on the average cash balance
+    cfs = result.cfs_mtly
+    income = result.pnl['Interest'] + result.debt_total['Total Interest']
+    np.testing.assert_allclose(income, 0.03 / 12 * (cfs['Opening'] + cfs['Closing']) / 2, atol=1e-5)
+    np.testing.assert_allclose(result.bs_mtly['Difference'], 0.0, atol=1e-6)
+
+
+def test_no_passes_without_circularity(base_inputs):
+    assert run_model(base_inputs).circularity['iterations'] == 0
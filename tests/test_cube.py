@@ -0,0 +1,25 @@
+"""Array-backed statement tables."""
+import numpy as np
+
+from refinancing.cube import StatementCube
+
+
+def test_lines_are_views_on_one_array():
+    cube = StatementCube.from_lines({'Revenue': np.arange(24.0), 'Cost': -1.0})
+    assert cube.values.shape == (2, 24)
+    np.testing.assert_array_equal(cube['Cost'], np.full(24, -1.0))
+    cube['Revenue'][0] = 7.0
+    assert cube.values[0, 0] == 7.0
+    alias = cube.alias({'Sales': 'Revenue'})
+    np.testing.assert_array_equal(alias['Sales'], cube['Revenue'])
+    assert alias.values is cube.values
+    assert list(cube) == ['Revenue', 'Cost'] and 'Cost' in cube and 'Sales' not in cube
+
+
+def test_to_frame_labels():
+    monthly = StatementCube.from_lines({'Cash': np.arange(1.0, 25.0)}).to_frame()
+    assert list(monthly.columns) == ['Year', 'Month', 'Cash']
+    assert monthly.index.name == 'MonthCum' and monthly.index[-1] == 24
+    assert monthly.loc[13, 'Year'] == 2 and monthly.loc[13, 'Month'] == 'January'
+    yearly = StatementCube.from_lines({'Cash': np.arange(2.0)}, freq='Y').to_frame(labels=('Month',))
+    assert list(yearly['Month']) == ['December', 'December'] and yearly.index.name == 'Year'
@@ -0,0 +1,58 @@
+"""Monthly base-rate curves."""
+import numpy as np
+import pytest
+
+from refinancing import curves
+from refinancing.curves import clear_curve_cache, curve_from_tenors, interpolated_curve, read_curve_csv
+
+
+def test_linear_between_tenors_and_flat_outside():
+    curve = curve_from_tenors([12, 3, 24], [5.0, 2.0, 6.0], 36)
+    assert curve.shape == (36,)
+    np.testing.assert_allclose(curve[:3], 2.0)
+    np.testing.assert_allclose(curve[[5, 11, 17, 23]], [3.0, 5.0, 5.5, 6.0])
+    np.testing.assert_allclose(curve[24:], 6.0)
+
+
+def test_batch_rows_are_interpolated_once():
+    rates = np.array([[[2.0, 4.0], [3.0, 3.0]], [[2.0, 4.0], [1.0, 5.0]]])
+    curves = curve_from_tenors([1, 13], rates, 24)
+    assert curves.shape == (2, 2, 24)
+    for index in np.ndindex(2, 2):
+        np.testing.assert_array_equal(curves[index], curve_from_tenors([1, 13], rates[index], 24))
+    with pytest.raises(ValueError):
+        curve_from_tenors([1, 13, 25], rates, 24)
+
+
+def test_cached_curves_are_shared_and_read_only():
+    clear_curve_cache()
+    first = interpolated_curve([6, 60], [3.0, 4.0], 120)
+    assert interpolated_curve(np.array([6.0, 60.0]), [3.0, 4.0], 120) is first
+    assert interpolated_curve([6, 60], [3.0, 4.0], 60) is not first
+    with pytest.raises(ValueError):
+        first[0] = 0.0
+    clear_curve_cache()
+    assert interpolated_curve([6, 60], [3.0, 4.0], 120) is not first
+
+
+def test_cache_drops_the_least_recently_used(monkeypatch):
+    monkeypatch.setattr(curves, 'CURVE_CACHE_SIZE', 2)
+    clear_curve_cache()
+    first = interpolated_curve([1, 12], [1.0, 2.0], 24)
+    second = interpolated_curve([1, 12], [2.0, 3.0], 24)
+    assert interpolated_curve([1, 12], [1.0, 2.0], 24) is first
+    interpolated_curve([1, 12], [3.0, 4.0], 24)
+    assert len(curves._CURVE_CACHE) == 2
+    assert interpolated_curve([1, 12], [1.0, 2.0], 24) is first
+    assert interpolated_curve([1, 12], [2.0, 3.0], 24) is not second
+    clear_curve_cache()
+    assert len(curves._CURVE_CACHE) == 0
+
+
+def test_read_curve_csv(tmp_path):
+    path = tmp_path / 'curve.csv'
+    path.write_text("Tenor,Rate\n1,2.0\n12,4.2\n")
+    np.testing.assert_allclose(read_curve_csv(path, 24), curve_from_tenors([1, 12], [2.0, 4.2], 24))
+    path.write_text("Month,Rate\n1,2.0\n")
+    with pytest.raises(ValueError):
+        read_curve_csv(path, 24)
@@ -0,0 +1,32 @@
+"""Closed-form debt schedules of ``debt_schedule_arrays``."""
+import numpy as np
+import numpy_financial as npf
+
+from refinancing.debt import debt_schedule_arrays
+
+
+def test_grace_then_annuity_to_maturity():
+    # 12 months of capitalised interest, then an annuity over the 48 months to maturity
+    schedule, balance, payment = debt_schedule_arrays(1000.0, 500.0, 0.005, 12, 60, 48, nb_months=72)
+    closing = schedule['Closing']
+    np.testing.assert_allclose(closing[11], 1505.0 * 1.005 ** 11)
+    np.testing.assert_allclose(balance, closing[11])
+    np.testing.assert_allclose(payment, npf.pmt(0.005, 48, closing[11]))
+    np.testing.assert_allclose(schedule['Repayment'][12:60], payment)
+    assert np.all(schedule['Repayment'][:12] == 0) and np.all(schedule['Interest'][:12] == 0)
+    assert np.all(closing[:59] > 1) and np.all(closing[59:] == 0)
+    # Every month rolls forward
+    flows = sum(schedule[line] for line in ('Opening', 'Additional Loan', 'Amortisation', 'Interest', 'Repayment'))
+    np.testing.assert_allclose(flows, closing, atol=1e-9)
+
+
+def test_batch_matches_single_tranches():
+    args = [(1000.0, 500.0, 0.005, 12, 60, 48, False), (0.0, 800.0, 0.004, 0, 36, 36, True),
+            (2000.0, 0.0, 0.0, 24, 24, 0, False)]
+    batch, balance, payment = debt_schedule_arrays(*[np.array(column) for column in zip(*args)], nb_months=72)
+    for k, arg in enumerate(args):
+        single, single_balance, single_payment = debt_schedule_arrays(*arg[:-1], consolidated=arg[-1], nb_months=72)
+        for line, values in single.items():
+            np.testing.assert_array_equal(batch[line][k], values)
+        np.testing.assert_array_equal(balance[k], single_balance)
+        np.testing.assert_array_equal(payment[k], single_payment)
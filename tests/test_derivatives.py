@@ -0,0 +1,42 @@
+"""Forward-mode derivatives of the KPI tables against central finite differences."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from refinancing import kpi_derivatives, run_model
+from refinancing.sensitivity import numeric_inputs, with_inputs
+
+WRT = ['revenue', 'cost_of_goods_sold', 'capital_expenditure_additions1', 'Bank_Base_Rate_SenSec',
+       'Credit_Risk_Premiums_StTerm', 'Additional_Loan_on_restructuring_StTerm', 'growth_rate_rev_Dict[3]',
+       'growth_rate_cost_ope_Dict[5]', 'Rev_Seas_Dict[3]', 'AR_pct']
+CASES = {
+    'scheduled': {},
+    'circular': dict(average_balance_interest=True, cash_interest_rate=3.0, circularity_tol=1e-10),
+    'taxed': dict(tax_rates=25.0, tax_losses_brought_forward=5000.0),
+    'sculpted': dict(Profile_SenSec='sculpted', Profile_StTerm='sculpted'),
+}
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_matches_finite_differences(base_inputs, case):
+    inputs = replace(base_inputs, **CASES[case])
+    derivatives = kpi_derivatives(inputs, wrt=WRT)
+    np.testing.assert_allclose(derivatives.result.kpi_yly.values, run_model(inputs).kpi_yly.values, rtol=1e-12)
+    base = numeric_inputs(inputs)
+    for k, name in enumerate(WRT):
+        step = 1e-6 * max(1.0, abs(base[name]))
+        up = run_model(with_inputs(inputs, {name: base[name] + step}))
+        down = run_model(with_inputs(inputs, {name: base[name] - step}))
+        for cube in ('kpi_mtly', 'kpi_yly'):
+            with np.errstate(invalid='ignore'):
+                # Ratios with no denominator are infinite in both runs
+                expected = (getattr(up, cube).values - getattr(down, cube).values) / (2 * step)
+            actual = getattr(derivatives, cube).values[k]
+            finite = np.isfinite(expected) & np.isfinite(actual)
+            np.testing.assert_allclose(actual[finite], expected[finite], rtol=1e-5, atol=1e-5, err_msg=f"{name} {cube}")
+
+
+def test_unknown_input(base_inputs):
+    with pytest.raises(ValueError):
+        kpi_derivatives(base_inputs, wrt=['no_such_input'])
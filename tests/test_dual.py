@@ -0,0 +1,30 @@
+"""Tangents of the numpy functions ``Dual`` supports."""
+import numpy as np
+import pytest
+
+from refinancing.dual import Dual
+
+
+def product_rule(x, dx, axis):
+    """Tangent of ``cumprod`` term by term: the sum over k of the product with x_k replaced by dx_k."""
+    x, dx = np.moveaxis(x, axis, -1), np.moveaxis(dx, axis + 1 if axis >= 0 else axis, -1)
+    tangent = np.zeros_like(dx)
+    for i in range(x.shape[-1]):
+        for k in range(i + 1):
+            factors = np.broadcast_to(x[..., :i + 1], dx.shape[:-1] + (i + 1,)).copy()
+            factors[..., k] = dx[..., k]
+            tangent[..., i] += factors.prod(axis=-1)
+    return np.moveaxis(tangent, -1, axis + 1 if axis >= 0 else axis)
+
+
+@pytest.mark.parametrize('axis', [0, 1, -1])
+@pytest.mark.parametrize('zeros', [0, 1, 2])
+def test_cumprod(axis, zeros):
+    rng = np.random.default_rng(zeros)
+    x = rng.normal(1.0, 0.5, (3, 8))
+    x[0, [2, 5][:zeros]] = 0.0
+    x[[1, 2][:zeros], 3] = 0.0
+    dx = rng.normal(size=(2, 3, 8))
+    product = np.cumprod(Dual(x, dx), axis=axis)
+    np.testing.assert_array_equal(product.value, np.cumprod(x, axis=axis))
+    np.testing.assert_allclose(product.tangent, product_rule(x, dx, axis), rtol=1e-12, atol=1e-12)
@@ -0,0 +1,39 @@
+"""Horizons other than the 10 years of the baseline."""
+from dataclasses import fields, replace
+
+import numpy as np
+import pytest
+
+from refinancing import ModelInputs, run_model
+
+
+def test_default_horizon_is_ten_years(base_inputs):
+    # The baseline cases were run over 10 years, as are inputs that leave the horizon at its default
+    assert ModelInputs.projections_year == 10
+    values = {f.name: getattr(base_inputs, f.name) for f in fields(base_inputs) if f.name != 'projections_year'}
+    result = run_model(ModelInputs(**values))
+    assert len(result.projectionDF) == 10
+    assert len(result.BSMtlyTbl) == len(result.debtCalc_SenSec) == 120
+    np.testing.assert_allclose(result.BSMtlyTbl['Difference'], 0.0, atol=1e-6)
+
+
+@pytest.mark.parametrize('years', [1, 3, 30])
+def test_tables_cover_the_horizon(base_inputs, years):
+    result = run_model(replace(base_inputs, projections_year=years))
+    assert len(result.projectionDF) == years
+    for name in ('debtCalc_SenSec', 'PnLStatMtlyTbl', 'BSMtlyTbl', 'CFSMtlyTbl', 'KPIMtlyTbl'):
+        assert len(getattr(result, name)) == 12 * years
+    for name in ('PnLStatYlyTbl', 'BSYlyTbl', 'CFSYlyTbl', 'KPIYlyTbl'):
+        assert len(getattr(result, name)) == years
+    np.testing.assert_allclose(result.BSMtlyTbl['Difference'], 0.0, atol=1e-6)
+    np.testing.assert_allclose(result.BSYlyTbl['Difference'], 0.0, atol=1e-6)
+    # The annual cash is the cash of each December
+    np.testing.assert_allclose(result.BSYlyTbl['Cash'], result.BSMtlyTbl['Cash'].iloc[11::12])
+
+
+def test_long_horizon_repays_every_tranche(base_inputs):
+    # Both tranches mature within 7 years; years past the 10 of the baseline roll forward with no debt
+    result = run_model(replace(base_inputs, projections_year=30))
+    assert np.all(result.debtCalc_SenSec['Closing'].iloc[84:] == 0)
+    assert np.all(result.debtCalc_StTerm['Closing'].iloc[84:] == 0)
+    np.testing.assert_allclose(result.CFSMtlyTbl['Repayment of Long-term Debt'].iloc[84:], 0.0)
@@ -0,0 +1,23 @@
+"""Masked division of the KPIs."""
+import numpy as np
+
+from refinancing.kpi import CARRY, carry_forward, safe_divide
+
+
+def test_carry_forward_repeats_last_unmasked():
+    values = np.array([[5.0, 1.0, 2.0, 3.0, 4.0], [1.0, 2.0, 3.0, 4.0, 5.0]])
+    mask = np.array([[True, False, True, True, False], [False, False, False, False, True]])
+    np.testing.assert_array_equal(carry_forward(values, mask), [[0.0, 1.0, 1.0, 1.0, 4.0], [1.0, 2.0, 3.0, 4.0, 4.0]])
+    np.testing.assert_array_equal(carry_forward(values[0], mask[0], initial=np.nan)[:2], [np.nan, 1.0])
+
+
+def test_safe_divide_fill_policies():
+    num, den = np.array([1.0, 2.0, 3.0, 4.0]), np.array([2.0, 0.0, 4.0, 0.0])
+    mask = den == 0
+    with np.errstate(divide='ignore'):
+        np.testing.assert_array_equal(safe_divide(num, den), num / den)
+    np.testing.assert_array_equal(safe_divide(num, den, mask, 0), [0.5, 0.0, 0.75, 0.0])
+    np.testing.assert_array_equal(safe_divide(num, den, mask, np.nan), [0.5, np.nan, 0.75, np.nan])
+    np.testing.assert_array_equal(safe_divide(num, den, mask, CARRY), [0.5, 0.5, 0.75, 0.75])
+    # No policy keeps the IEEE result even where masked
+    np.testing.assert_array_equal(safe_divide(num, den, mask, None), [0.5, np.inf, 0.75, np.inf])
@@ -0,0 +1,82 @@
+"""Short-rate paths and floating-rate tranches."""
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from refinancing import run_model, tranche_table
+from refinancing.rates import ShortRateSpec, short_rate_paths
+from refinancing.simulation import SimulationSpec, simulate
+
+
+def test_without_volatility_the_rate_reverts_to_its_mean():
+    spec = ShortRateSpec(r0=6.0, mean_reversion=0.5, long_term_mean=3.0, volatility=0.0)
+    rates = short_rate_paths(spec, 2, 60, np.random.default_rng(0))
+    months = np.arange(1, 61)
+    np.testing.assert_allclose(rates, np.broadcast_to(3.0 + 3.0 * np.exp(-0.5 * months / 12), (2, 60)), rtol=1e-12)
+
+
+def test_hull_white_without_volatility_follows_the_initial_curve():
+    curve = np.linspace(2.0, 5.0, 24)
+    spec = ShortRateSpec(model='hull-white', r0=4.0, mean_reversion=0.3, initial_curve=curve, volatility=0.0)
+    rates = short_rate_paths(spec, 1, 36, np.random.default_rng(0))[0]
+    np.testing.assert_allclose(rates, np.concatenate([curve, np.full(12, 5.0)]), rtol=1e-12)
+    # Without a curve of its own the model is fitted to the one it is given, else flat at r0
+    flat = short_rate_paths(replace(spec, initial_curve=None), 1, 36, np.random.default_rng(0))[0]
+    np.testing.assert_allclose(flat, 4.0, rtol=1e-12)
+    given = short_rate_paths(replace(spec, initial_curve=None), 1, 36, np.random.default_rng(0), initial_curve=curve)[0]
+    np.testing.assert_array_equal(given, rates)
+
+
+@pytest.mark.parametrize('mean_reversion', [0.0, 0.4])
+def test_hull_white_mean_is_the_forward_rate_plus_convexity(mean_reversion):
+    curve = 3.0 + np.sin(np.arange(60) / 10)
+    spec = ShortRateSpec(model='hull-white', r0=3.0, mean_reversion=mean_reversion, initial_curve=curve,
+                         volatility=1.2)
+    rates = short_rate_paths(spec, 40000, 60, np.random.default_rng(2))
+    t = np.arange(1, 61) / 12
+    b = (1 - np.exp(-mean_reversion * t)) / mean_reversion if mean_reversion else t
+    expected = curve + 1.2 ** 2 * b ** 2 / 200
+    sd = 1.2 * np.sqrt((1 - np.exp(-2 * mean_reversion * t)) / (2 * mean_reversion) if mean_reversion else t)
+    # Within 4 standard errors of the mean in every month
+    assert np.all(np.abs(rates.mean(axis=0) - expected) < 4 * sd / np.sqrt(40000))
+
+
+def test_moments_of_the_paths():
+    spec = ShortRateSpec(r0=4.0, mean_reversion=0.2, long_term_mean=4.0, volatility=1.0)
+    rates = short_rate_paths(spec, 20000, 120, np.random.default_rng(1))
+    # Stationary Ornstein-Uhlenbeck variance sigma^2 (1 - e^{-2 a t}) / (2 a) after t = 10 years
+    expected_sd = np.sqrt((1 - np.exp(-2 * 0.2 * 10)) / (2 * 0.2))
+    assert rates[:, -1].mean() == pytest.approx(4.0, abs=0.05)
+    assert rates[:, -1].std() == pytest.approx(expected_sd, rel=0.03)
+    floored = short_rate_paths(replace(spec, floor=0.0), 100, 120, np.random.default_rng(1))
+    assert floored.min() >= 0.0
+
+
+def test_flat_curve_reproduces_the_fixed_rate(base_inputs):
+    nb_months = base_inputs.projections_year * 12
+    floating = replace(base_inputs, Bank_Base_Rate_Curve_SenSec=np.full(nb_months, base_inputs.Bank_Base_Rate_SenSec),
+                       Bank_Base_Rate_Curve_StTerm=np.full(nb_months, base_inputs.Bank_Base_Rate_StTerm))
+    fixed, result = run_model(base_inputs), run_model(floating)
+    for name in ('debtCalc_SenSec', 'debtCalc_StTerm', 'BSMtlyTbl', 'KPIYlyTbl'):
+        pd.testing.assert_frame_equal(getattr(result, name), getattr(fixed, name), rtol=1e-9, atol=1e-6)
+
+
+def test_seeded_short_rate_simulation(base_inputs):
+    spec = SimulationSpec(n_paths=40, chunk_size=16, seed=3, short_rate=ShortRateSpec(volatility=1.5, floor=0.0))
+    first, second = simulate(base_inputs, spec), simulate(base_inputs, spec)
+    pd.testing.assert_frame_equal(first.debt_bands, second.debt_bands)
+    np.testing.assert_array_equal(first.paths['Debt to EBITDA'], second.paths['Debt to EBITDA'])
+    interest = first.debt_bands['Total Interest']
+    assert np.all(interest['P5'] <= interest['P50']) and np.all(interest['P50'] <= interest['P95'])
+    assert np.any(interest['P5'] < interest['P95'])
+
+
+def test_simulated_base_rates_need_the_input_fields(base_inputs):
+    inputs = replace(base_inputs, tranches=tranche_table(base_inputs))
+    for spec in (SimulationSpec(n_paths=4, short_rate=ShortRateSpec()), SimulationSpec(n_paths=4, base_rate_sd=1.0)):
+        with pytest.raises(ValueError):
+            simulate(inputs, spec)
+    # Other drivers still apply to a tranche table
+    simulate(inputs, SimulationSpec(n_paths=4, revenue_growth_sd=1.0, seed=0))
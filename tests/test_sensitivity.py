@@ -0,0 +1,38 @@
+"""One-at-a-time tornado report."""
+from dataclasses import replace
+
+import numpy as np
+
+from refinancing import run_model
+from refinancing.sensitivity import DEFAULT_METRICS, numeric_inputs, tornado
+
+
+def test_rows_match_single_runs(base_inputs):
+    tables = tornado(base_inputs)
+    assert set(tables) == set(DEFAULT_METRICS)
+    cash = tables['Final year Cash']
+    assert list(cash.index) == list(cash.sort_values('Swing', ascending=False).index)
+    assert len(cash) == len(numeric_inputs(base_inputs))
+    np.testing.assert_allclose(cash.attrs['base'], DEFAULT_METRICS['Final year Cash'](run_model(base_inputs)))
+    for name in ('revenue', 'Bank_Base_Rate_SenSec'):
+        row = cash.loc[name]
+        for column, value in (('Output at low', row['Low input']), ('Output at high', row['High input'])):
+            single = DEFAULT_METRICS['Final year Cash'](run_model(replace(base_inputs, **{name: value})))
+            np.testing.assert_allclose(row[column], single, rtol=1e-10)
+    np.testing.assert_allclose(cash.loc['revenue', ['Low input', 'High input']], [31500.0, 38500.0])
+
+
+def test_non_negative_inputs_stay_at_zero(base_inputs):
+    inputs = replace(base_inputs, Amortization_Y_StTerm=0.0)
+    row = tornado(inputs, step=0.5)['Minimum DSCR'].loc['Amortization_Y_StTerm']
+    assert row['Low input'] == 0.0 and row['High input'] == 1.0
+
+
+def test_zero_inputs_move_by_their_unit(base_inputs):
+    # Rates and shares move by a percentage point and periods by a year, whatever the step of amounts
+    inputs = replace(base_inputs, Amortization_Y_StTerm=0.0, cash_floor=0.0)
+    table = tornado(inputs, zero_step=1000.0)['Final year Cash']
+    for name, high in (('sweep_pct', 1.0), ('tax_rates', 1.0), ('cash_interest_rate', 1.0), ('revolver_rate', 1.0),
+                       ('Amortization_Y_StTerm', 1.0), ('cash_floor', 1000.0), ('tax_losses_brought_forward', 1000.0)):
+        assert table.loc[name, 'High input'] == high, name
+        assert table.loc[name, 'Low input'] == 0.0, name
@@ -0,0 +1,34 @@
+"""Monte Carlo covenant ratios of ``simulate``."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from refinancing import SimulationSpec, run_model, simulate
+
+SPEC = dict(n_paths=150, chunk_size=64, revenue_growth_sd=3.0, cost_growth_sd=2.0, seasonality_sd=0.1,
+            base_rate_sd=1.0)
+
+
+def test_seeded_runs_are_reproducible(base_inputs):
+    first = simulate(base_inputs, SimulationSpec(seed=7, **SPEC))
+    second = simulate(base_inputs, SimulationSpec(seed=7, **SPEC))
+    for ratio, paths in first.paths.items():
+        assert paths.shape == (150, 10)
+        np.testing.assert_array_equal(paths, second.paths[ratio])
+    pd.testing.assert_frame_equal(first.bands, second.bands)
+    other = simulate(base_inputs, SimulationSpec(seed=8, **SPEC))
+    assert not np.array_equal(first.paths['Debt to EBITDA'], other.paths['Debt to EBITDA'])
+
+
+def test_no_shocks_repeats_the_base_case(base_inputs):
+    result = simulate(base_inputs, SimulationSpec(n_paths=5, chunk_size=2, seed=0))
+    base = run_model(base_inputs).KPIYlyTbl
+    for ratio, paths in result.paths.items():
+        np.testing.assert_array_equal(paths, np.broadcast_to(base[ratio].to_numpy(), paths.shape))
+        np.testing.assert_array_equal(result.bands[(ratio, 'P50')], base[ratio])
+    assert set(np.unique(result.breach_probability.to_numpy())) <= {0.0, 1.0}
+
+
+def test_unknown_distribution(base_inputs):
+    with pytest.raises(ValueError):
+        simulate(base_inputs, SimulationSpec(n_paths=2, distribution='cauchy', revenue_growth_sd=1.0))
@@ -0,0 +1,28 @@
+"""Debt capacity goal seek."""
+import numpy as np
+import pytest
+
+from refinancing.sizing import max_additional_loan, meets_covenants
+
+COVENANTS = {'Debt Service Coverage Ratio': ('min', 0.5)}
+NAME = 'Additional_Loan_on_restructuring_SenSec'
+
+
+@pytest.mark.parametrize('tol', [1.0, 0.01])
+def test_max_additional_loan_brackets_the_boundary(base_inputs, tol):
+    result = max_additional_loan(base_inputs, covenants=COVENANTS, tol=tol)
+    assert result.feasible and result.value > 0
+    ok = meets_covenants(base_inputs, COVENANTS, **{NAME: np.array([0.0, result.value, result.value + tol])})
+    np.testing.assert_array_equal(ok, [True, True, False])
+
+
+def test_warm_start_finds_the_same_loan(base_inputs):
+    cold = max_additional_loan(base_inputs, covenants=COVENANTS)
+    warm = max_additional_loan(base_inputs, covenants=COVENANTS, start=cold.value * 1.05)
+    assert abs(warm.value - cold.value) <= 1.0
+    assert warm.rounds <= cold.rounds
+
+
+def test_infeasible_without_any_loan(base_inputs):
+    result = max_additional_loan(base_inputs, covenants={'Debt to EBITDA': ('max', 0.1)})
+    assert not result.feasible and np.isnan(result.value)
@@ -0,0 +1,33 @@
+"""Array building blocks of the statements."""
+import numpy as np
+import pytest
+
+from refinancing.statements import window_sum
+
+
+def naive_window_sum(values, window, direction):
+    n = len(values)
+    values = np.nan_to_num(values)
+    if direction == 'forward':
+        return np.array([values[m:min(m + window, n)].sum() for m in range(n)])
+    return np.array([values[max(m + 1 - window, 0):m + 1].sum() for m in range(n)])
+
+
+@pytest.mark.parametrize('direction', ['forward', 'trailing'])
+@pytest.mark.parametrize('window', [1, 3, 12, 40])
+def test_window_sum_matches_slices(window, direction):
+    values = np.random.default_rng(0).normal(1000.0, 300.0, size=(2, 30))
+    values[0, 5] = np.nan
+    expected = np.stack([naive_window_sum(row, window, direction) for row in values])
+    np.testing.assert_allclose(window_sum(values, window, direction), expected, rtol=1e-12)
+
+
+def test_window_sum_of_zeros_is_exact():
+    values = np.concatenate([np.full(12, 1e6 / 3), np.zeros(24)])
+    assert np.all(window_sum(values, 12, 'forward')[12:] == 0.0)
+    assert np.all(window_sum(values, 12, 'trailing')[24:] == 0.0)
+
+
+def test_window_sum_direction():
+    with pytest.raises(ValueError):
+        window_sum(np.ones(12), 12, 'backward')
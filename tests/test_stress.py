@@ -0,0 +1,43 @@
+"""Breakeven reverse stress test."""
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from refinancing import run_model
+from refinancing.kpi import limits_met
+from refinancing.stress import STRESS_DRIVERS, breakeven_multipliers
+
+FLOORS = {'Debt Service Coverage Ratio': ('min', 0.2)}
+TOL = 1e-4
+
+
+@pytest.fixture
+def funded_inputs(base_inputs):
+    return replace(base_inputs, cash=200000.0, equity=203000.0)
+
+
+def safe(inputs, line, multiplier):
+    field = STRESS_DRIVERS[line][0]
+    result = run_model(replace(inputs, **{field: getattr(inputs, field) * multiplier}))
+    return bool(limits_met(result.kpi_yly, result.cfs_yly, result.bs_mtly, FLOORS))
+
+
+def test_multipliers_sit_on_the_boundary(funded_inputs):
+    table = breakeven_multipliers(funded_inputs, covenants=FLOORS, tol=TOL)
+    revenue, cogs = table.loc[0, 'Revenue'], table.loc[0, 'COGS']
+    assert 0 < revenue < 1 < cogs
+    assert safe(funded_inputs, 'Revenue', revenue + 2 * TOL) and not safe(funded_inputs, 'Revenue', revenue - 2 * TOL)
+    assert safe(funded_inputs, 'COGS', cogs - 2 * TOL) and not safe(funded_inputs, 'COGS', cogs + 2 * TOL)
+    assert table.loc[0, 'Headroom'] == pytest.approx(min(1 - revenue, cogs - 1, table.loc[0, 'Operating Cost'] - 1))
+
+
+def test_batch_rows_match_single_cases(funded_inputs):
+    revenues = [35000.0, 40000.0, 20000.0]
+    batch = breakeven_multipliers(replace(funded_inputs, revenue=np.array(revenues)), covenants=FLOORS, tol=TOL)
+    for k, revenue in enumerate(revenues):
+        single = breakeven_multipliers(replace(funded_inputs, revenue=revenue), covenants=FLOORS, tol=TOL)
+        pd.testing.assert_series_equal(batch.loc[k], single.loc[0], check_names=False, atol=2 * TOL)
+    # The weakest case breaks at base: a negative headroom
+    assert batch['Headroom'].idxmin() == 2 and batch.loc[2, 'Headroom'] < 0
@@ -0,0 +1,63 @@
+"""Refinancing structure search."""
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from refinancing.structuring import efficient_frontier, optimize_structure
+
+GRID = {'Maturity_Y_SenSec': [2, 4, 6], 'Amortization_Y_SenSec': [0, 1, 2], 'Maturity_Y_StTerm': [3, 7],
+        'IndivDebt_StTerm': ['Individual', 'Consolidated']}
+FLOORS = {'Debt Service Coverage Ratio': ('min', 0.2)}
+
+
+def test_frontier_drops_beaten_structures():
+    candidates = pd.DataFrame({'Total Interest': [10.0, 12.0, 11.0, 20.0, 15.0],
+                               'Minimum DSCR': [1.0, 2.0, 0.5, np.nan, 2.0]})
+    frontier = efficient_frontier(candidates)
+    assert list(frontier.index) == [0, 1, 3]
+
+
+def test_exhaustive_search(base_inputs):
+    inputs = replace(base_inputs, cash=200000.0, equity=203000.0)
+    search = optimize_structure(inputs, GRID, covenants=FLOORS, prune=False)
+    candidates = search.candidates
+    # Every structure whose grace period is shorter than the maturity, or equal to it for Senior Secured, is run
+    assert search.pruned == 0 and search.evaluations == len(candidates) == 9 * 2 * 2
+    assert optimize_structure(inputs, GRID, covenants=FLOORS).candidates.equals(candidates)
+    feasible = candidates[candidates['Feasible']]
+    assert len(feasible) and np.all(feasible['Minimum Cash'] >= 0) and np.all(feasible['Minimum DSCR'] >= 0.2)
+    assert search.best['Total Interest'] == feasible['Total Interest'].min()
+    for _, row in search.frontier.iterrows():
+        beaten = ((feasible['Total Interest'] < row['Total Interest'])
+                  & (feasible['Minimum DSCR'].fillna(np.inf) > np.nan_to_num(row['Minimum DSCR'], nan=np.inf)))
+        assert not beaten.any()
+
+
+def test_grace_equal_to_maturity(base_inputs):
+    # Senior Secured repays over its grace period when it equals the maturity; Debt 1 - Tranche 1 has nothing left
+    grid = {'Maturity_Y_SenSec': [3], 'Amortization_Y_SenSec': [3], 'Maturity_Y_StTerm': [2, 3],
+            'Amortization_Y_StTerm': [2]}
+    candidates = optimize_structure(base_inputs, grid, covenants={}).candidates
+    assert list(candidates['Maturity_Y_StTerm']) == [3]
+
+
+def test_pruned_search_runs_a_subset(base_inputs):
+    # Longer maturities can breach where shorter ones do not, so pruning loses every feasible structure here
+    inputs = replace(base_inputs, cash=base_inputs.cash + 100000.0, equity=base_inputs.equity + 100000.0)
+    grid = {'Maturity_Y_SenSec': [2, 4, 6, 8, 10], 'Amortization_Y_SenSec': [0, 1, 2], 'Maturity_Y_StTerm': [3, 5, 7, 9],
+            'Additional_Loan_on_restructuring_SenSec': [0, 30000, 60000, 90000]}
+    exhaustive = optimize_structure(inputs, grid, covenants=FLOORS)
+    pruned = optimize_structure(inputs, grid, covenants=FLOORS, prune=True)
+    assert exhaustive.best is not None and pruned.best is None
+    assert pruned.evaluations + pruned.pruned == exhaustive.evaluations == 15 * 4 * 4
+    merged = pruned.candidates.merge(exhaustive.candidates, on=list(grid), suffixes=('', ' exhaustive'))
+    assert len(merged) == pruned.evaluations
+    for label in ('Total Interest', 'Minimum DSCR', 'Minimum Cash', 'Feasible'):
+        np.testing.assert_array_equal(merged[label], merged[f'{label} exhaustive'])
+
+
+def test_grid_fields_must_be_scalar(base_inputs):
+    with pytest.raises(ValueError):
+        optimize_structure(base_inputs, {'growth_rate_rev_Dict': [{}]})
@@ -0,0 +1,48 @@
+"""Cash management: the revolver tops cash up to the floor, the sweep prepays debt above it."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from refinancing import run_model
+
+FLOOR = 1000.0
+
+
+@pytest.mark.parametrize('sweep_pct', [0.0, 100.0])
+def test_revolver_holds_cash_at_floor(base_inputs, sweep_pct):
+    # Unmanaged, the case runs out of cash
+    assert run_model(base_inputs).bs_mtly['Cash'].min() < 0
+    result = run_model(replace(base_inputs, cash_floor=FLOOR, revolver_limit=1e9, revolver_rate=6.0,
+                               sweep_pct=sweep_pct))
+    cash = result.bs_mtly['Cash']
+    drawn = result.debt_of('Revolver')['Closing'] > 0
+    assert drawn.any()
+    np.testing.assert_allclose(cash[drawn], FLOOR, atol=1e-6)
+    assert cash.min() >= FLOOR - 1e-6
+    np.testing.assert_allclose(result.bs_mtly['Difference'], 0.0, atol=1e-6)
+
+
+def test_sweep_prepays_first_tranche(base_inputs):
+    scheduled = run_model(base_inputs)
+    swept = run_model(replace(base_inputs, cash_floor=FLOOR, revolver_limit=1e9, revolver_rate=6.0, sweep_pct=100.0))
+    debt, balance = swept.debt_of(0)['Closing'], scheduled.debt_of(0)['Closing']
+    assert np.all(debt <= balance + 1e-6)
+    assert np.any(debt < balance - 1)
+    # Closings are snapped to 0 like the scheduled ones
+    assert np.all((debt == 0) | (np.abs(debt) >= 1))
+
+
+@pytest.mark.parametrize('name', ['cash_floor', 'sweep_pct', 'revolver_limit', 'revolver_rate'])
+def test_negative_cash_management_input(base_inputs, name):
+    with pytest.raises(ValueError, match=name):
+        run_model(replace(base_inputs, **{name: -1.0}))
+
+
+def test_batch_matches_single_cases(base_inputs):
+    floors = np.array([0.0, FLOOR, 5 * FLOOR])
+    batch = run_model(replace(base_inputs, cash_floor=floors, revolver_limit=1e9, revolver_rate=6.0, sweep_pct=50.0))
+    for k, floor in enumerate(floors):
+        single = run_model(replace(base_inputs, cash_floor=floor, revolver_limit=1e9, revolver_rate=6.0, sweep_pct=50.0))
+        np.testing.assert_allclose(batch.scenario(k).debt.values, single.debt.values)
+        np.testing.assert_allclose(batch.scenario(k).bs_mtly.values, single.bs_mtly.values)
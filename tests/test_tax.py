@@ -0,0 +1,108 @@
+"""Loss carry-forward of ``tax_schedule_arrays`` against schedules worked by hand."""
+import numpy as np
+import pytest
+
+from refinancing import tax_schedule_arrays
+from refinancing.tax import monthly_tax, running_max, tax_paid
+
+EBT = np.array([-100.0, -50.0, 30.0, 200.0])
+
+
+def assert_schedule(schedule, used, taxable, carried, rate):
+    np.testing.assert_array_equal(schedule['Losses Used'], used)
+    np.testing.assert_array_equal(schedule['Taxable Income'], taxable)
+    np.testing.assert_array_equal(schedule['Losses Carried Forward'], carried)
+    np.testing.assert_array_equal(schedule['Tax'], -rate * np.array(taxable))
+
+
+def test_losses_never_expire():
+    # All 150 of losses are set against the profits of years 3 and 4
+    schedule = tax_schedule_arrays(EBT, 0.25)
+    assert_schedule(schedule, used=[0, 0, 30, 120], taxable=[0, 0, 0, 80], carried=[100, 150, 120, 0], rate=0.25)
+
+
+def test_losses_expire_oldest_first():
+    # Year 3 uses 30 of the year 1 loss, whose other 70 expire at the end of year 3
+    schedule = tax_schedule_arrays(EBT, 0.25, loss_expiry=2)
+    assert_schedule(schedule, used=[0, 0, 30, 50], taxable=[0, 0, 0, 150], carried=[100, 150, 50, 0], rate=0.25)
+
+
+def test_losses_used_as_they_arise():
+    schedule = tax_schedule_arrays(np.array([-100.0, 50.0, 80.0, -30.0, 200.0]), 0.25)
+    assert_schedule(schedule, used=[0, 50, 50, 0, 30], taxable=[0, 0, 30, 0, 170], carried=[100, 50, 0, 30, 0],
+                    rate=0.25)
+
+
+@pytest.mark.parametrize('loss_expiry', [None, 1])
+def test_losses_brought_forward(loss_expiry):
+    # Brought forward losses are usable in year 1 only when they expire after 1 year
+    schedule = tax_schedule_arrays(np.array([40.0, 100.0]), 0.2, loss_expiry=loss_expiry, losses_brought_forward=60.0)
+    if loss_expiry is None:
+        assert_schedule(schedule, used=[40, 20], taxable=[0, 80], carried=[20, 0], rate=0.2)
+    else:
+        assert_schedule(schedule, used=[40, 0], taxable=[0, 100], carried=[0, 0], rate=0.2)
+
+
+def test_profits_without_losses_are_taxed_exactly():
+    ebt = np.array([0.1, 0.2, 0.3, 0.7, 1.1])
+    schedule = tax_schedule_arrays(ebt, 0.25)
+    assert_schedule(schedule, used=[0] * 5, taxable=ebt, carried=[0] * 5, rate=0.25)
+
+
+def test_batch_matches_single_cases():
+    ebt = np.array([[-100.0, -50.0, 30.0, 200.0], [10.0, -20.0, 5.0, 30.0]])
+    schedule = tax_schedule_arrays(ebt, np.array([0.25, 0.3]), loss_expiry=2)
+    for k in range(2):
+        single = tax_schedule_arrays(ebt[k], [0.25, 0.3][k], loss_expiry=2)
+        for line, values in single.items():
+            np.testing.assert_array_equal(schedule[line][k], values)
+
+
+def vintage_ledger(ebt, expiry, brought_forward):
+    """Losses used and carried forward of ``ebt`` (one case), year by year and loss by loss."""
+    vintages = [[brought_forward, expiry]]
+    used, carried = [], []
+    for value in ebt:
+        profit, taken = max(value, 0.0), 0.0
+        for vintage in vintages:
+            take = min(vintage[0], profit - taken) if vintage[1] > 0 else 0.0
+            vintage[0] -= take
+            taken += take
+        vintages = [[amount, left - 1] for amount, left in vintages] + [[max(-value, 0.0), expiry]]
+        used.append(taken)
+        carried.append(sum(amount for amount, left in vintages if left > 0))
+    return used, carried
+
+
+@pytest.mark.parametrize('loss_expiry', [1, 2, 3, 7, 40])
+def test_expiring_losses_match_a_vintage_ledger(loss_expiry):
+    rng = np.random.default_rng(loss_expiry)
+    ebt = rng.normal(0.0, 100.0, (20, 25))
+    schedule = tax_schedule_arrays(ebt, 0.25, loss_expiry=loss_expiry, losses_brought_forward=80.0)
+    for k in range(len(ebt)):
+        used, carried = vintage_ledger(ebt[k], loss_expiry, 80.0)
+        np.testing.assert_allclose(schedule['Losses Used'][k], used, atol=1e-9)
+        np.testing.assert_allclose(schedule['Losses Carried Forward'][k], carried, atol=1e-9)
+
+
+def test_running_max():
+    values = np.random.default_rng(0).normal(size=(4, 30))
+    np.testing.assert_array_equal(running_max(values), np.maximum.accumulate(values, axis=-1))
+
+
+def test_loss_expiry_below_one_year():
+    with pytest.raises(ValueError):
+        tax_schedule_arrays(EBT, 0.25, loss_expiry=0)
+
+
+def test_tax_paid_after_lag():
+    tax = monthly_tax(np.array([-120.0, -240.0]))
+    np.testing.assert_array_equal(tax, [-10.0] * 12 + [-20.0] * 12)
+    np.testing.assert_array_equal(tax_paid(tax, 3), [0.0] * 3 + [-10.0] * 12 + [-20.0] * 9)
+
+
+def test_no_tax_at_a_zero_rate():
+    # The zero asset life makes EBT infinite; a zero rate still charges no tax
+    with np.errstate(invalid='ignore'):
+        schedule = tax_schedule_arrays(np.array([np.inf, -np.inf, 10.0]), 0.0, loss_expiry=2)
+    np.testing.assert_array_equal(schedule['Tax'], 0.0)
@@ -0,0 +1,78 @@
+"""Tranche tables with more facilities than the two input fields."""
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from refinancing import PROFILES, run_model
+from refinancing.model import TRANCHE_COLUMNS, all_tranche_terms, broadcast_inputs, debt_schedule, tranche_table
+from refinancing.valuation import valuation
+
+
+@pytest.fixture
+def three_tranches(base_inputs):
+    table = tranche_table(base_inputs)
+    mezzanine = {'Name': 'Mezzanine', 'IndivDebt': 'Individual', 'Loan': 0.0,
+                 'Additional_Loan_on_restructuring': 40000.0, 'Bank_Base_Rate': 6.0, 'Liquidity_Premiums': 2.0,
+                 'Credit_Risk_Premiums': 3.0, 'Maturity_Y': 5.0, 'Amortization_Y': 1.0, 'Senior': False}
+    return replace(base_inputs, tranches=pd.concat([table, pd.DataFrame([mezzanine])], ignore_index=True))
+
+
+def test_field_table_matches_the_input_fields(base_inputs):
+    fields = run_model(base_inputs)
+    table = run_model(replace(base_inputs, tranches=tranche_table(base_inputs)))
+    for name in ('debtCalc_SenSec', 'debtCalc_StTerm', 'BSMtlyTbl', 'KPIMtlyTbl'):
+        pd.testing.assert_frame_equal(getattr(table, name), getattr(fields, name))
+
+
+def test_every_tranche_repays_at_maturity(three_tranches):
+    result = run_model(three_tranches)
+    assert result.tranche_names == ['Senior Secured', 'Debt 1 - Tranche 1', 'Mezzanine']
+    for name, maturity in zip(result.tranche_names, three_tranches.tranches['Maturity_Y']):
+        closing = result.debtCalc(name)['Closing']
+        months = int(maturity * 12)
+        assert np.all(closing.iloc[:months - 1] > 1) and np.all(closing.iloc[months - 1:] == 0)
+    np.testing.assert_allclose(result.debt_total['Total Repayment'], result.debt['Repayment'].sum(axis=-2))
+    np.testing.assert_allclose(result.BSMtlyTbl['Mezzanine'], result.debtCalc('Mezzanine')['Closing'])
+    np.testing.assert_allclose(result.BSMtlyTbl['Difference'], 0.0, atol=1e-6)
+    assert {'Effective cost Mezzanine', 'Effective cost Senior Secured'} <= set(valuation(result, 8.0))
+
+
+def test_missing_column(base_inputs):
+    with pytest.raises(ValueError):
+        run_model(replace(base_inputs, tranches=tranche_table(base_inputs)[TRANCHE_COLUMNS[:-1]]))
+
+
+@pytest.mark.parametrize('profile', PROFILES)
+def test_every_profile_repays_at_maturity(three_tranches, profile):
+    table = three_tranches.tranches.assign(Profile=profile, Target_DSCR=1.3)
+    # 2% of the balance a month, the rest in the last repayment month
+    table['Custom_Schedule'] = [np.full(120, 2.0)] * len(table)
+    result = run_model(replace(three_tranches, tranches=table))
+    for name, maturity in zip(result.tranche_names, table['Maturity_Y']):
+        schedule = result.debtCalc(name)
+        assert np.all(schedule['Closing'].iloc[int(maturity * 12) - 1:] == 0), name
+        flows = schedule[['Opening', 'Additional Loan', 'Amortisation', 'Interest', 'Repayment']].sum(axis=1)
+        np.testing.assert_allclose(flows, schedule['Closing'], atol=1e-6)
+    np.testing.assert_allclose(result.BSMtlyTbl['Difference'], 0.0, atol=1e-6)
+
+
+def test_debt_schedule_leaves_the_terms_alone(base_inputs):
+    _, terms = all_tranche_terms(broadcast_inputs(base_inputs))
+    _, filled = debt_schedule(terms, base_inputs.projections_year * 12)
+    assert np.all(np.isnan(terms.outAftAmortization)) and np.all(np.isnan(terms.Repayment))
+    assert np.all(np.isfinite(filled.outAftAmortization)) and np.all(np.isfinite(filled.Repayment))
+
+
+def test_sculpted_tranches_share_the_cash_flow(three_tranches):
+    table = three_tranches.tranches.assign(Profile='sculpted', Target_DSCR=1.3)
+    result = run_model(replace(three_tranches, tranches=table))
+    service = -np.asarray(result.debt_total['Total Repayment'])
+    available = np.maximum(np.asarray(result.PnLStatMtlyTbl['EBITDA']), 0.0) / 1.3
+    # Whatever is left of a tranche is repaid in its last month, above the sculpted service
+    sculpted = np.ones(len(service), dtype=bool)
+    sculpted[(table['Maturity_Y'] * 12).astype(int) - 1] = False
+    assert np.all(service[sculpted] <= available[sculpted] + 1e-6)
+    # Every tranche is repaying by month 48, so all of it goes to debt service
+    np.testing.assert_allclose(service[48:59], available[48:59])
@@ -0,0 +1,43 @@
+"""NPV, IRR and effective cost."""
+from dataclasses import replace
+
+import numpy as np
+import numpy_financial as npf
+
+from refinancing import run_model
+from refinancing.valuation import effective_cost, irr, npv
+
+
+def conventional_flows(seed, size):
+    rng = np.random.default_rng(seed)
+    flows = rng.uniform(5.0, 40.0, size=size)
+    flows[..., 0] = -rng.uniform(50.0, 300.0, size=size[:-1])
+    return flows
+
+
+def test_irr_matches_numpy_financial():
+    flows = conventional_flows(0, (40, 13))
+    flows[3, 1:4] = -20.0
+    rates = irr(flows)
+    for row, rate in zip(flows, rates):
+        np.testing.assert_allclose(rate, npf.irr(row), rtol=1e-7)
+    np.testing.assert_allclose(npv(rates, flows), 0.0, atol=1e-6)
+
+
+def test_irr_without_sign_change_is_nan():
+    assert np.isnan(irr(np.array([10.0, 20.0, 30.0])))
+    assert np.isnan(irr(np.zeros(5)))
+
+
+def test_npv_matches_numpy_financial():
+    flows = conventional_flows(1, (5, 24))
+    rates = np.linspace(-0.01, 0.05, 5)
+    np.testing.assert_allclose(npv(rates, flows), [npf.npv(r, row) for r, row in zip(rates, flows)], rtol=1e-12)
+
+
+def test_effective_cost_of_an_annuity_is_its_rate(base_inputs):
+    # Without grace the borrower pays the contract rate, compounded monthly
+    inputs = replace(base_inputs, Amortization_Y_SenSec=0.0)
+    result = run_model(inputs)
+    rate = (inputs.Bank_Base_Rate_SenSec + inputs.Liquidity_Premiums_SenSec + inputs.Credit_Risk_Premiums_SenSec) / 1200
+    np.testing.assert_allclose(effective_cost(result.debt_SenSec), 100 * ((1 + rate) ** 12 - 1), rtol=1e-8)